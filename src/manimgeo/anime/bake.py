@@ -0,0 +1,277 @@
+"""
+几何对象轨迹的离线预计算
+
+自由点的运动事先已知时（路径、动画曲线），可以在渲染前一次性计算每一帧所有几何对象的属性，
+渲染时管理器的更新器只需按帧读取，不再在帧循环中调用 `BaseGeometry.update`
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
+import numpy as np
+
+from ..components import BaseGeometry, Point, batch_update
+from ..program import GeometryProgram, LAYOUTS
+from ..program.kernels import MAX_ROOTS, TURN_CCW, TURN_CW
+from ..program.program import geometry_kind, upstream_order
+
+# 自由点的运动：形如 (F, d) 的逐帧坐标，或接收形如 (F,) 的时刻数组并返回逐帧坐标的函数
+type Motion = Union[np.ndarray, Callable[[np.ndarray], np.ndarray]]
+
+# GeometryProgram 每次批量计算的帧数
+BAKE_CHUNK = 1024
+
+class BakedGeometry:
+    """
+    预计算的几何对象轨迹
+
+    ```python
+    baked = BakedGeometry.bake([circle, P], {A: lambda t: np.stack([np.cos(t), np.sin(t)], axis=1)}, duration=2)
+    baked.apply_time(0.5)  # 写入 t = 0.5 时所有对象的属性
+    baked.get(circle, "radius")  # 形如 (F,)
+    ```
+
+    每个对象的每个计算属性保存为一个逐帧数组，`turn` 以 `TURN_CCW` / `TURN_CW` 表示，
+    交点坐标 `result_points` 形如 (F, MAX_ROOTS, d)，不存在的交点以 NaN 填充。
+    计算失败的帧记录在 `valid` 中，对应帧的属性以 NaN 填充
+
+    三维坐标的场景通过 `GeometryProgram.run_batch` 一次性向量化计算全部帧。`GeometryProgram` 仅支持三维坐标，
+    二维坐标的场景（包括管理器经 `dim_23` 渲染的场景）及其余不受支持的场景在批量更新中逐帧计算，结束后自由点恢复原坐标。
+    逐帧计算的开销与渲染时逐帧更新相同，预计算对这些场景没有加速效果，只是计算结果可以在多次渲染间复用；
+    逐帧计算中某一帧计算失败（如三点共线）时，出错的对象及其下游在该帧记为无效，不会中断预计算
+    """
+
+    def __init__(self, objects: List[BaseGeometry], tracks: List[Dict[str, np.ndarray]], valid: np.ndarray, fps: float):
+        """
+        - `objects`: 按拓扑顺序排列的几何对象
+        - `tracks`: 每个对象的属性名称到逐帧数组的映射
+        - `valid`: 形如 (对象数, F) 的有效掩码
+        - `fps`: 帧率
+        """
+        self.objects = objects
+        self.tracks = tracks
+        self.valid = valid
+        self.fps = fps
+        self._index: Dict[int, int] = {id(obj): i for i, obj in enumerate(objects)}
+        # 每个对象最近一次写入的帧及写入后的版本号
+        self._applied: List[Optional[Tuple[int, int]]] = [None] * len(objects)
+
+    def __len__(self) -> int:
+        return self.valid.shape[1]
+
+    @property
+    def duration(self) -> float:
+        """轨迹时长"""
+        return (len(self) - 1) / self.fps
+
+    @classmethod
+    def bake(
+            cls,
+            objects: Iterable[BaseGeometry],
+            motions: Mapping[Point, Motion],
+            duration: float,
+            fps: float = 60,
+        ) -> BakedGeometry:
+        """
+        预计算几何对象在每一帧的属性
+
+        - `objects`: 需要记录的几何对象，其全部上游对象同样被记录
+        - `motions`: 自由点及其运动
+        - `duration`: 时长
+        - `fps`: 帧率，默认为 60
+
+        共 `round(duration * fps) + 1` 帧，第 k 帧对应时刻 `k / fps`
+        """
+        plan = _plan(objects, motions, duration, fps)
+        tracks = [{attr: np.empty((plan.frames, *shape)) for attr, shape in shapes.items()} for shapes in _shapes(plan)]
+        valid = np.empty((len(plan.objects), plan.frames), dtype=bool)
+        _fill(plan, tracks, valid)
+        return cls(plan.objects, tracks, valid, fps)
+
+    def frame_index(self, t: float) -> int:
+        """
+        获取时刻对应的帧，超出范围时取首帧或末帧
+
+        - `t`: 时刻
+        """
+        return int(np.clip(round(t * self.fps), 0, len(self) - 1))
+
+    def get(self, obj: BaseGeometry, attr: str) -> np.ndarray:
+        """
+        读取几何对象计算属性的逐帧数组
+
+        - `obj`: 几何对象
+        - `attr`: 属性名称
+        """
+        return self.tracks[self._lookup(obj)][attr]
+
+    def valid_frames(self, obj: BaseGeometry) -> np.ndarray:
+        """几何对象在每一帧中是否计算成功，形如 (F,)"""
+        return self.valid[self._lookup(obj)]
+
+    def _lookup(self, obj: BaseGeometry) -> int:
+        index = self._index.get(id(obj))
+        if index is None:
+            raise KeyError(f"几何对象 {obj.name} 不在预计算的轨迹中")
+        return index
+
+    def apply_frame(self, frame: int):
+        """
+        将第 `frame` 帧的属性写回所有几何对象
+
+        - `frame`: 帧序号
+
+        仅写入属性与 `on_error` 标记，不会触发更新传播。自由点的构造参数同时被设置。
+        上一次写入后未被修改、且本帧与上一次写入帧的值相同的对象被跳过，其版本号保持不变
+        """
+        for i, obj in enumerate(self.objects):
+            applied = self._applied[i]
+            if applied is not None and applied[1] == obj._version and not obj.dirty and self._same_frames(i, applied[0], frame):
+                continue
+            if obj.dirty:
+                obj._clear_dirty()
+            obj.on_error = not bool(self.valid[i, frame])
+            if not obj.on_error:
+                for attr, values in self.tracks[i].items():
+                    setattr(obj, attr, _decode(obj, attr, values[frame]))
+                if not obj.dependencies and obj.adapter.construct_type == "Free":
+                    obj.adapter.args.coord = obj.coord.copy()
+            obj._bump_version()
+            self._applied[i] = (frame, obj._version)
+
+    def _same_frames(self, index: int, a: int, b: int) -> bool:
+        """对象在两帧中的有效标记与属性值是否相同"""
+        if a == b:
+            return True
+        if self.valid[index, a] != self.valid[index, b]:
+            return False
+        return all(np.array_equal(values[a], values[b], equal_nan=True) for values in self.tracks[index].values())
+
+    def apply_time(self, t: float) -> int:
+        """
+        将时刻 `t` 所在帧的属性写回所有几何对象
+
+        - `t`: 时刻
+
+        Returns: 写入的帧序号
+        """
+        frame = self.frame_index(t)
+        self.apply_frame(frame)
+        return frame
+
+class _Plan(NamedTuple):
+    """预计算的输入"""
+    objects: List[BaseGeometry]
+    coords: Dict[Point, np.ndarray]
+    frames: int
+    program: Optional[GeometryProgram]
+    dim: int
+
+def _plan(objects: Iterable[BaseGeometry], motions: Mapping[Point, Motion], duration: float, fps: float) -> _Plan:
+    """计算自由点的逐帧坐标并编译几何对象，不受 `GeometryProgram` 支持时 `program` 为 None"""
+    if fps <= 0 or duration < 0:
+        raise ValueError(f"帧率须为正数且时长不能为负数: fps = {fps}, duration = {duration}")
+    times = np.arange(int(round(duration * fps)) + 1) / fps
+
+    coords: Dict[Point, np.ndarray] = {}
+    for point, motion in motions.items():
+        if not isinstance(point, Point) or point.adapter.construct_type != "Free":
+            raise ValueError(f"只有自由点可以指定运动: {point.name}")
+        coord = np.asarray(motion(times) if callable(motion) else motion, dtype=np.float64)
+        if coord.shape != (len(times), len(point.coord)):
+            raise ValueError(f"自由点 {point.name} 的运动须为形如 {(len(times), len(point.coord))} 的数组: {coord.shape}")
+        coords[point] = coord
+
+    objects = upstream_order([*objects, *coords])
+    try:
+        program = GeometryProgram.compile(objects)
+    except (ValueError, NotImplementedError):
+        dim = next((len(obj.coord) for obj in objects if isinstance(obj, Point)), 3)
+        return _Plan(objects, coords, len(times), None, dim)
+    return _Plan(objects, coords, len(times), program, 3)
+
+def _shapes(plan: _Plan) -> List[Dict[str, Tuple[int, ...]]]:
+    """每个对象各属性单帧的形状"""
+    shapes = []
+    for obj in plan.objects:
+        shape: Dict[str, Tuple[int, ...]] = {}
+        for attr, length in LAYOUTS[geometry_kind(obj)].items():
+            if attr == "result_points":
+                shape[attr] = (MAX_ROOTS, plan.dim)
+            else:
+                shape[attr] = () if length == 1 else (plan.dim,)
+        shapes.append(shape)
+    return shapes
+
+def _fill(plan: _Plan, tracks: List[Dict[str, np.ndarray]], valid: np.ndarray, chunk: int = BAKE_CHUNK):
+    """
+    计算全部帧并写入 `tracks` 与 `valid`
+
+    `GeometryProgram` 支持的场景每次以 `run_batch` 计算 `chunk` 帧，其余场景在批量更新中逐帧计算，
+    结束后自由点恢复原坐标。逐帧计算时传播过程中的计算错误被捕获，出错对象的 `on_error` 标记决定该帧是否有效
+    """
+    program = plan.program
+    if program is not None:
+        for start in range(0, plan.frames, chunk):
+            stop = min(start + chunk, plan.frames)
+            if plan.coords:
+                result = program.run_batch({point: coord[start:stop] for point, coord in plan.coords.items()})
+                registers, valid[:, start:stop] = result.registers, result._valid
+            else:
+                registers = np.tile(program.registers, (stop - start, 1))
+                valid[:, start:stop] = ~np.array(program.errors, dtype=bool)[:, None]
+            for i, track in enumerate(tracks):
+                for attr, slot in program._slots[i].items():
+                    track[attr][start:stop] = registers[:, slot].reshape(track[attr][start:stop].shape)
+        return
+
+    initial = {point: point.coord.copy() for point in plan.coords}
+    try:
+        for frame in range(plan.frames):
+            _set_coords({point: coord[frame] for point, coord in plan.coords.items()}, plan.objects)
+            for i, obj in enumerate(plan.objects):
+                valid[i, frame] = not obj.on_error
+                for attr, values in tracks[i].items():
+                    values[frame] = _encode(attr, getattr(obj, attr), plan.dim) if valid[i, frame] else np.nan
+    finally:
+        _set_coords(initial, plan.objects)
+
+def _set_coords(coords: Mapping[Point, np.ndarray], objects: List[BaseGeometry]):
+    """
+    在一次批量更新中设置自由点坐标
+
+    - `coords`: 自由点及其坐标
+    - `objects`: 预计算的全部几何对象
+
+    传播会完成全部对象的计算后才抛出首个异常，此时出错的对象及其下游已被标记 `on_error`，此处不再抛出。
+    没有对象被标记 `on_error` 的异常并非计算错误，照常抛出
+    """
+    try:
+        with batch_update():
+            for point, coord in coords.items():
+                point.set_coord(coord)
+    except Exception:
+        if not any(obj.on_error for obj in objects):
+            raise
+
+def _encode(attr: str, value: Any, dim: int) -> Any:
+    """将属性值编码为数值，交点坐标补齐为 MAX_ROOTS 行"""
+    if attr == "turn":
+        return TURN_CCW if value == "Counterclockwise" else TURN_CW
+    if attr == "result_points":
+        points = np.asarray(value, dtype=np.float64).reshape(-1, dim)
+        packed = np.full((MAX_ROOTS, dim), np.nan)
+        packed[:len(points)] = points
+        return packed
+    return value
+
+def _decode(obj: BaseGeometry, attr: str, value: Any) -> Any:
+    """将逐帧数组中的值还原为几何对象的属性值"""
+    if attr == "turn":
+        return "Counterclockwise" if value > 0 else "Clockwise"
+    if attr == "num_results":
+        return int(value)
+    if attr == "result_points":
+        # 跟踪交点时保留全部槽位
+        return value.copy() if obj.args.track else value[~np.isnan(value[:, 0])].copy()
+    return value.copy() if isinstance(value, np.ndarray) else float(value)
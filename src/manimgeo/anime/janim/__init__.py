@@ -4,8 +4,13 @@ import sys
 if sys.version_info < (3, 12):
     raise ImportError("janim 库要求 Python 版本 >= 3.12", name = "janim")
 
-from ...utils.version import check_library_version
-if not check_library_version("janim", None, "2.3.0"):
-    raise ImportError("janim 版本要求 <= 2.3.0")
+def __getattr__(name: str):
+    # 首次访问管理器时才检查版本并导入 janim，导入本模块本身不加载 janim
+    if name == "GeoJAnimManager":
+        from ...utils.version import check_library_version
+        if not check_library_version("janim", None, "2.3.0"):
+            raise ImportError("janim 版本要求 <= 2.3.0")
 
-from ...anime.janim.janim_manager import GeoJAnimManager
\ No newline at end of file
+        from ...anime.janim.janim_manager import GeoJAnimManager
+        return GeoJAnimManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,27 +1,50 @@
 from ...components import *
+from ...math.base import Number
 from ...anime.manager import GeoManager
+from ...anime.bake import BakedGeometry
 from ...anime.state import StateManager
 from ...anime.janim.error_func import ErrorFunctionJAnim as JAnimError
 from janim.logger import log
 
 from janim.imports import Timeline, VItem, DataUpdater
-from typing import Sequence, Callable, Optional
+from typing import Sequence, Callable, Dict, List, Literal, Optional, Tuple, Union
+import numpy as np
 
 def dim_23(x: np.ndarray) -> np.ndarray:
     return np.append(x, 0)
 
 class GeoJAnimManager(GeoManager):
-    """管理 JAnim Component 和几何对象之间的自动映射"""
+    """
+    管理 JAnim Component 和几何对象之间的自动映射
+
+    管理器的 `DataUpdater` 均挂载在辅助 `VItem` 上，更新全部已注册的对象。每个采样时刻读取所有自由点的位置，
+    在一次批量更新中完成计算，再将结果分发到所有 `VItem`。自由点的运动事先已知时，
+    可以传入 `BakedGeometry`，DataUpdater 只按帧读取预计算的轨迹
+    """
     on_error_exec: Union[None, Literal["vis", "stay"], Callable[[bool, BaseGeometry, VItem], None]]
     state_manager = StateManager("janim", JAnimError.set_visible_by_state)
-    current_helper_vitem: List[VItem] =  []
     current_timeline: Timeline = None
+    # 承载 DataUpdater 的辅助物件，随管理器释放
+    helper_vitem: Optional[VItem]
+    # 最近一次由 `create_vitems_with_add_updater` 加入时间轴的 DataUpdater
+    updater: Optional[DataUpdater]
+    leaves: List[Tuple[Point, VItem]]
+    nodes: List[Tuple[BaseGeometry, VItem]]
+    # 每个 VItem 最近一次同步时几何对象的版本号
+    versions: Dict[int, int]
 
     def __init__(self, timeline: Optional[Timeline] = None):
         """初始化 JAnim 几何动画管理器，可传入 timeline"""
         super().__init__()
         self.start_trace()
         self.on_error_exec = "vis"
+        self.helper_vitem = None
+        self.updater = None
+        self.leaves = []
+        self.nodes = []
+        self.versions = {}
+        # 最近一次计算的采样时刻
+        self._last_t: Optional[float] = None
         if timeline != None:
             self.current_timeline = timeline
 
@@ -33,7 +56,10 @@ class GeoJAnimManager(GeoManager):
             **kwargs
         ) -> List[VItem]:
         """
-        通过几何对象创建 VItem，创建对应 Updater 后立刻添加到时间轴
+        通过几何对象创建 VItem，并创建管理器的 DataUpdater 后立刻添加到时间轴
+
+        每次调用以给定的 `duration` 与 `kwargs` 加入一个新的 DataUpdater，每个 DataUpdater 都更新管理器中已注册的全部对象。
+        多个 DataUpdater 的时间段重叠时，同一采样时刻只计算一次
         """
         if timeline == None:
             if self.current_timeline == None:
@@ -41,13 +67,9 @@ class GeoJAnimManager(GeoManager):
             else:
                 timeline = self.current_timeline
 
-        vitems, updaters = [], []
-        for obj in objs:
-            vitem, updater = self.create_vitem_from_geometry(obj)
-            vitems.append(vitem)
-            updaters.append(updater)
-
-        timeline.prepare(*updaters, duration=duration, **kwargs)
+        vitems = [self._create_vitem(obj) for obj in objs]
+        self.updater = self.create_updater()
+        timeline.prepare(self.updater, duration=duration, **kwargs)
         return vitems
 
     def create_vitems_from_geometry(
@@ -55,17 +77,24 @@ class GeoJAnimManager(GeoManager):
             objs: Sequence[Union[Point, Line, Circle]]
         ):
         """
-        通过几何对象创建 VItem，并创建对应 Updater
+        通过几何对象创建 VItem，并创建对应 DataUpdater
         """
         return [self.create_vitem_from_geometry(geo) for geo in objs]
 
     def create_vitem_from_geometry(
             self,
             obj: Union[Point, Line, Circle]
-        ):
+        ) -> Tuple[VItem, DataUpdater]:
         """
         通过几何对象创建 VItem，并创建对应 DataUpdater
+
+        Returns: `(vitem, updater)`，`updater` 与 `create_updater` 的返回值相同，更新管理器中已注册的全部对象，
+        因此只需将其中一个加入时间轴
         """
+        return self._create_vitem(obj), self.create_updater()
+
+    def _create_vitem(self, obj: Union[Point, Line, Circle]) -> VItem:
+        """通过几何对象创建 VItem，并注册到管理器"""
         vitem: VItem
 
         match obj:
@@ -86,8 +115,8 @@ class GeoJAnimManager(GeoManager):
             
         # log.debug(f"init: {obj.name} -> {id(vitem)}")
         self._adapt_vitems(obj, vitem)
-        updater = self.register_updater(obj, vitem)
-        return vitem, updater
+        self.register_updater(obj, vitem)
+        return vitem
     
     def _adapt_vitems(self, obj: BaseGeometry, vitem: VItem):
         """控制物件具体位置等更新"""
@@ -132,16 +161,88 @@ class GeoJAnimManager(GeoManager):
                 raise NotImplementedError(f"Cannot create vitem from object of type: {type(obj)}")
             
     def register_updater(self, obj: BaseGeometry, vitem: VItem):
-        """为 VItem 物件注册更新器"""
-        helper_vitem = VItem()
-        self.current_helper_vitem.append(helper_vitem)
-
+        """关联几何对象与 VItem 物件，由管理器的 DataUpdater 统一更新"""
         if isinstance(obj, Point) and obj.adapter.construct_type == "Free":
             # 自由点，叶子节点
-            return DataUpdater(helper_vitem, lambda data, p: self.update_leaf(vitem.current(), obj), skip_null_items=False)
+            self.leaves.append((obj, vitem))
         else:
             # 非自由对象
-            return DataUpdater(helper_vitem, lambda data, p: self.update_node(vitem.current(), obj), skip_null_items=False)
+            self.nodes.append((obj, vitem))
+
+    def create_updater(self, baked: Optional[BakedGeometry] = None, **kwargs) -> DataUpdater:
+        """
+        创建管理器的 DataUpdater，更新所有已注册的对象
+
+        - `baked`: 预计算的轨迹，给出时 DataUpdater 按动画进度读取对应帧，不再计算几何对象
+        - `kwargs`: 将要传递给 `DataUpdater` 的其它参数
+
+        DataUpdater 挂载在管理器的辅助物件上，每次调用返回新的 DataUpdater，辅助物件只创建一次
+        """
+        if self.helper_vitem is None:
+            self.helper_vitem = VItem()
+        self._last_t = None
+        if baked is not None:
+            return DataUpdater(self.helper_vitem, lambda data, p: self.update_baked(baked, p.alpha * baked.duration), skip_null_items=False, **kwargs)
+        return DataUpdater(self.helper_vitem, lambda data, p: self.update_timeline(p.global_t), skip_null_items=False, **kwargs)
+
+    def release(self):
+        """释放辅助物件、DataUpdater 与已注册的对象，之后创建的 DataUpdater 重新开始记录"""
+        self.helper_vitem = None
+        self.updater = None
+        self.leaves = []
+        self.nodes = []
+        self.versions = {}
+        self._last_t = None
+
+    def update_timeline(self, t: Optional[float] = None):
+        """
+        管理器的 Updater，每个采样时刻计算一次
+
+        - `t`: 采样时刻，与上一次相同时跳过计算
+
+        读取所有自由点 VItem 的位置，在一次批量更新中设置移动过的自由点，之后将计算结果应用到版本号变化的 VItem
+        """
+        if not self.start_update:
+            return
+        if t is not None and t == self._last_t:
+            return
+        self._last_t = t
+
+        with batch_update():
+            for obj, vitem in self.leaves:
+                self.update_leaf(vitem.current(), obj)
+
+        for obj, vitem in self.nodes:
+            if self._changed(obj, vitem):
+                self.update_node(vitem.current(), obj)
+
+    def update_baked(self, baked: BakedGeometry, t: float):
+        """
+        按预计算的轨迹更新所有 VItem
+
+        - `baked`: 预计算的轨迹
+        - `t`: 轨迹中的时刻
+
+        将 `t` 所在帧的属性写回几何对象后同步全部 VItem，自由点的 VItem 同样移动到轨迹上
+        """
+        if not self.start_update:
+            return
+
+        baked.apply_time(t)
+        for obj, vitem in self.leaves:
+            if self._changed(obj, vitem):
+                self._adapt_vitems(obj, vitem.current())
+        for obj, vitem in self.nodes:
+            if self._changed(obj, vitem):
+                self.update_node(vitem.current(), obj)
+
+    def _changed(self, obj: BaseGeometry, vitem: VItem) -> bool:
+        """几何对象的版本号（`BaseGeometry.version`）是否与 VItem 上一次同步时不同，并记录当前版本号"""
+        version = obj.version
+        if self.versions.get(id(vitem)) == version:
+            return False
+        self.versions[id(vitem)] = version
+        return True
 
     def update_leaf(self, vitem: VItem, obj: BaseGeometry):
         """叶子 Updater，读取部件信息并应用至 FreePoint 坐标"""
@@ -152,7 +253,9 @@ class GeoJAnimManager(GeoManager):
         if isinstance(obj, Point):
             from janim.imports import Dot
             vitem: Dot
-            obj.set_coord(vitem.points.box.center[:2])
+            coord = vitem.points.box.center[:2]
+            if not np.array_equal(coord, obj.coord):
+                obj.set_coord(coord)
         else:
             log.warning(f"Object {obj.name} has been register for updater. But {type(obj).__name__} is not a support update type")
 
@@ -181,6 +284,8 @@ class GeoJAnimManager(GeoManager):
          - `"stay"`: 几何对象将保持静止，直到错误消失
          - `(on_error: bool, obj: BaseGeometry, vitem: VItem) -> None`: 自定义回调函数
         """
+        # 错误处理策略改变后，所有 VItem 需要重新同步
+        self.versions.clear()
         if exec == None:
             # TODO
             pass
@@ -27,6 +27,20 @@ class GeoManager:
         """
         self.__exit__()
 
+    def batch(self):
+        """
+        批量更新事务，等同于 `batch_update()`
+
+        事务内移动多个自由点时，下游对象只会在事务结束时合并计算一次：
+
+        ```python
+        with manager.batch():
+            A.set_coord(...)
+            B.set_coord(...)
+        ```
+        """
+        return batch_update()
+
     def __enter__(self):
         """
         追踪所有部件几何运动
@@ -1,7 +1,12 @@
 __all__ = ["GeoManimGLManager"]
 
-from ...utils.version import check_library_version
-if not check_library_version("manimgl", "1.6.0", None):
-    raise ImportError("manimgl 版本要求 >= 1.6.0")
+def __getattr__(name: str):
+    # 首次访问管理器时才检查版本并导入 manimgl，导入本模块本身不加载 manimgl
+    if name == "GeoManimGLManager":
+        from ...utils.version import check_library_version
+        if not check_library_version("manimgl", "1.6.0", None):
+            raise ImportError("manimgl 版本要求 >= 1.6.0")
 
-from ...anime.manimgl.manimgl_manager import GeoManimGLManager
\ No newline at end of file
+        from ...anime.manimgl.manimgl_manager import GeoManimGLManager
+        return GeoManimGLManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
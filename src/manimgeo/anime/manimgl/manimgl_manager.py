@@ -1,24 +1,54 @@
 from ...components import *
 from ...anime.manager import GeoManager
+from ...anime.bake import BakedGeometry
 from ...anime.state import StateManager
 from ...anime.manimgl.error_func import ErrorFunctionManimGL as GLError
 
 from manimlib import Mobject
-from typing import Sequence, Callable
+from typing import Sequence, Callable, Dict, List, Literal, Optional, Tuple, Union
+import numpy as np
 
 def dim_23(x: np.ndarray) -> np.ndarray:
     return np.append(x, 0)
 
 class GeoManimGLManager(GeoManager):
-    """管理 ManimGL Mobject 和几何对象之间的自动映射"""
+    """
+    管理 ManimGL Mobject 和几何对象之间的自动映射
+
+    默认为每个 Mobject 注册一个更新器。以 `scene_updater=True` 创建时，管理器只使用一个场景级更新器，
+    需通过 `install_scene_updater` 安装：
+
+    ```python
+    manager = GeoManimGLManager(scene_updater=True)
+    mobjects = manager.create_mobjects_from_geometry([A, B, circle])
+    self.add(manager.install_scene_updater(), *mobjects)
+    ```
+
+    场景级更新器每帧收集所有移动过的自由点，在一次批量更新中完成计算，
+    之后只同步版本号变化的几何对象对应的 Mobject。自由点的运动事先已知时，
+    可以传入 `BakedGeometry`，更新器只按帧读取预计算的轨迹
+    """
     on_error_exec: Union[None, Literal["vis", "stay"], Callable[[bool, BaseGeometry, Mobject], None]]
     state_manager = StateManager("manimgl", GLError.set_visible_by_state)
     ids: List[int]
+    scene_updater: bool
+    # 场景级更新器模式下的自由点与其余对象
+    leaves: List[Tuple[Point, Mobject]]
+    nodes: Dict[int, List[Tuple[BaseGeometry, Mobject]]]
+    # 每个 Mobject 最近一次同步时几何对象的版本号
+    versions: Dict[int, int]
 
-    def __init__(self):
+    def __init__(self, scene_updater: bool = False):
+        """
+        - `scene_updater`: 是否使用单个场景级更新器，默认为 False，为每个 Mobject 注册更新器
+        """
         super().__init__()
         self.on_error_exec = "vis"
         self.ids = []
+        self.scene_updater = scene_updater
+        self.leaves = []
+        self.nodes = {}
+        self.versions = {}
 
     def create_mobjects_from_geometry(
             self,
@@ -102,7 +132,16 @@ class GeoManimGLManager(GeoManager):
     def register_updater(self, obj: BaseGeometry, mobj: Mobject):
         """
         注册更新器
+
+        场景级更新器模式下仅记录对象与 Mobject 的对应关系，由 `update_scene` 统一更新
         """
+        if self.scene_updater:
+            if isinstance(obj, Point) and obj.adapter.construct_type == "Free":
+                self.leaves.append((obj, mobj))
+            else:
+                self.nodes.setdefault(id(obj), []).append((obj, mobj))
+            return
+
         if isinstance(obj, Point) and obj.adapter.construct_type == "Free":
             # 自由点，叶子节点
             self.ids.append(id(mobj))
@@ -112,19 +151,105 @@ class GeoManimGLManager(GeoManager):
             mobj.add_updater(lambda mobj: self.update_node(mobj, obj))
 
     def update_leaf(self, mobj: Mobject, obj: BaseGeometry):
-        """叶子 Updater，读取部件信息并应用至 FreePoint 坐标"""
+        """
+        叶子 Updater，读取部件信息并应用至 FreePoint 坐标
+
+        Mobject 位置与自由点坐标相同时跳过，静止的场景不会触发更新传播
+        """
         
         if not self.start_update:
             return
         
         if isinstance(obj, Point) and id(mobj) in self.ids:
-            obj.set_coord(mobj.get_center()[:2])
+            center = mobj.get_center()[:2]
+            if not np.array_equal(center, obj.coord):
+                obj.set_coord(center)
+
+    def install_scene_updater(self, host: Optional[Mobject] = None, baked: Optional[BakedGeometry] = None) -> Mobject:
+        """
+        安装场景级更新器，需以 `scene_updater=True` 创建管理器
+
+        - `host`: 承载更新器的 Mobject，默认为新建的空 Mobject，需要添加到场景中
+        - `baked`: 预计算的轨迹，给出时更新器按安装后经过的时间读取对应帧，不再计算几何对象
+
+        Returns: 承载更新器的 Mobject
+        """
+        if not self.scene_updater:
+            raise ValueError("场景级更新器需要以 scene_updater=True 创建管理器")
+        if host is None:
+            host = Mobject()
+        if baked is None:
+            host.add_updater(lambda _: self.update_scene())
+        else:
+            elapsed = 0.0
+            def baked_updater(_: Mobject, dt: float):
+                nonlocal elapsed
+                elapsed += dt
+                self.update_baked(baked, elapsed)
+            host.add_updater(baked_updater)
+        return host
+
+    def update_baked(self, baked: BakedGeometry, t: float):
+        """
+        按预计算的轨迹更新所有 Mobject
+
+        - `baked`: 预计算的轨迹
+        - `t`: 轨迹中的时刻
+
+        将 `t` 所在帧的属性写回几何对象后同步全部 Mobject，自由点的 Mobject 同样移动到轨迹上
+        """
+        if not self.start_update:
+            return
+
+        baked.apply_time(t)
+        for obj, mobj in self.leaves:
+            version = obj.version
+            if self.versions.get(id(mobj)) != version:
+                self.versions[id(mobj)] = version
+                self._adapt_mobjects(obj, mobj)
+        for pairs in self.nodes.values():
+            for obj, mobj in pairs:
+                self.update_node(mobj, obj)
+
+    def update_scene(self):
+        """
+        场景级更新器，每帧调用一次
+
+        读取所有自由点 Mobject 的位置，在一次批量更新中设置移动过的自由点，
+        之后检查全部已注册对象，仅同步版本号变化的几何对象对应的 Mobject。
+        没有自由点移动时，在其他位置被修改的几何对象（如直接调用 `set_coord` 或修改构造参数）同样会被同步
+        """
+        if not self.start_update:
+            return
+
+        moved: List[Tuple[Point, np.ndarray]] = []
+        for obj, mobj in self.leaves:
+            coord = mobj.get_center()[:2]
+            if not np.array_equal(coord, obj.coord):
+                moved.append((obj, coord))
+        if moved:
+            with batch_update():
+                for obj, coord in moved:
+                    obj.set_coord(coord)
+
+        for pairs in self.nodes.values():
+            for obj, mobj in pairs:
+                self.update_node(mobj, obj)
 
     def update_node(self, mobj: Mobject, obj: BaseGeometry):
-        """被约束对象 Updater，读取约束更改后信息应用到 Mobject"""
+        """
+        被约束对象 Updater，读取约束更改后信息应用到 Mobject
+
+        几何对象的版本号（`BaseGeometry.version`）与上一次同步时相同时直接跳过
+        """
 
         if not self.start_update:
             return
+
+        version = obj.version
+        if self.versions.get(id(mobj)) == version:
+            return
+        self.versions[id(mobj)] = version
         
         # 更新状态自动机并自动处理错误对象
         self.state_manager.update(obj, mobj)
@@ -144,6 +269,8 @@ class GeoManimGLManager(GeoManager):
          - `"stay"`: 几何对象将保持静止，直到错误消失
          - `(on_error: bool, obj: BaseGeometry, mobj: Mobject) -> None`: 自定义回调函数
         """
+        # 错误处理策略改变后，所有 Mobject 需要重新同步
+        self.versions.clear()
         if exec == None:
             # TODO
             pass
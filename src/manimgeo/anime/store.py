@@ -0,0 +1,148 @@
+"""
+预计算轨迹的磁盘存储
+
+每个对象的每个计算属性以及有效掩码分别写入一个内存映射的 `.npy` 文件，按构造的哈希值分目录存放。
+再次渲染或交互预览时直接映射已有文件，不再重新计算
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Optional, Union
+from pydantic import BaseModel
+from numpy.lib.format import open_memmap
+import hashlib
+import json
+import numpy as np
+
+from ..components import BaseGeometry, Point
+from .bake import BAKE_CHUNK, BakedGeometry, Motion, _Plan, _fill, _plan, _shapes
+
+# 存储格式版本，格式变化时使旧的存储失效
+STORE_VERSION = 1
+
+class TrajectoryStore:
+    """
+    预计算轨迹的磁盘存储
+
+    ```python
+    store = TrajectoryStore("cache/trajectories")
+    baked = store.bake([circle, P], {A: motion}, duration=4, fps=60)
+    ```
+
+    目录结构为 `root/<构造哈希>/`，其中 `valid.npy` 为形如 (对象数, F) 的有效掩码，
+    `<对象序号>.<属性>.npy` 为该属性的逐帧数组，`meta.json` 在全部帧写入后生成。
+    构造哈希由几何对象的类型、构造方式、参数、依赖关系、自由点的逐帧坐标与帧率决定
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        """
+        - `root`: 存储目录，不存在时自动创建
+        """
+        self.root = Path(root)
+
+    def bake(
+            self,
+            objects: Iterable[BaseGeometry],
+            motions: Mapping[Point, Motion],
+            duration: float,
+            fps: float = 60,
+            chunk: int = BAKE_CHUNK,
+        ) -> BakedGeometry:
+        """
+        读取或预计算几何对象在每一帧的属性，参数同 `BakedGeometry.bake`
+
+        - `chunk`: 每次批量计算并写入的帧数
+
+        已存在相同构造的存储时直接以只读方式映射，否则逐块计算并写入文件
+
+        Returns: 逐帧数组为内存映射的 `BakedGeometry`
+        """
+        plan = _plan(objects, motions, duration, fps)
+        key = construction_key(plan, fps)
+        baked = self._open(key, plan, fps)
+        if baked is not None:
+            return baked
+
+        path = self.root / key
+        path.mkdir(parents=True, exist_ok=True)
+        valid = open_memmap(path / "valid.npy", mode="w+", dtype=bool, shape=(len(plan.objects), plan.frames))
+        tracks = [
+            {attr: open_memmap(path / f"{i}.{attr}.npy", mode="w+", dtype=np.float64, shape=(plan.frames, *shape)) for attr, shape in shapes.items()}
+            for i, shapes in enumerate(_shapes(plan))
+        ]
+        _fill(plan, tracks, valid, chunk)
+
+        for array in [valid, *(values for track in tracks for values in track.values())]:
+            array.flush()
+        meta = {
+            "version": STORE_VERSION,
+            "fps": fps,
+            "frames": plan.frames,
+            "objects": [{"name": obj.name, "attrs": list(track)} for obj, track in zip(plan.objects, tracks)],
+        }
+        (path / "meta.json").write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+        return self._open(key, plan, fps)
+
+    def load(
+            self,
+            objects: Iterable[BaseGeometry],
+            motions: Mapping[Point, Motion],
+            duration: float,
+            fps: float = 60,
+        ) -> Optional[BakedGeometry]:
+        """
+        以只读方式映射已有的存储，参数同 `BakedGeometry.bake`
+
+        Returns: 逐帧数组为内存映射的 `BakedGeometry`，不存在相同构造的存储时返回 None
+        """
+        plan = _plan(objects, motions, duration, fps)
+        return self._open(construction_key(plan, fps), plan, fps)
+
+    def _open(self, key: str, plan: _Plan, fps: float) -> Optional[BakedGeometry]:
+        """映射构造哈希对应的存储，未完成写入的存储视为不存在"""
+        path = self.root / key
+        if not (path / "meta.json").exists():
+            return None
+        valid = np.load(path / "valid.npy", mmap_mode="r")
+        tracks = [
+            {attr: np.load(path / f"{i}.{attr}.npy", mmap_mode="r") for attr in shapes}
+            for i, shapes in enumerate(_shapes(plan))
+        ]
+        return BakedGeometry(plan.objects, tracks, valid, fps)
+
+def construction_key(plan: _Plan, fps: float) -> str:
+    """
+    计算构造哈希
+
+    - `plan`: 预计算的输入
+    - `fps`: 帧率
+    """
+    index = {id(obj): i for i, obj in enumerate(plan.objects)}
+    coords = {id(point): coord for point, coord in plan.coords.items()}
+    digest = hashlib.sha256()
+    digest.update(repr((STORE_VERSION, float(fps), plan.frames, plan.program is not None)).encode())
+    for obj in plan.objects:
+        coord = coords.get(id(obj))
+        if coord is None:
+            digest.update(repr((type(obj).__name__, _args_key(obj.args, index))).encode())
+        else:
+            # 指定运动的自由点只由逐帧坐标决定，与当前坐标无关
+            digest.update(repr((type(obj).__name__, "motion")).encode())
+            digest.update(np.ascontiguousarray(coord).tobytes())
+    return digest.hexdigest()[:32]
+
+def _args_key(value: Any, index: Mapping[int, int]) -> Any:
+    """将参数转换为稳定的表示，几何对象以其拓扑序号表示"""
+    if isinstance(value, BaseGeometry):
+        return ("geometry", index[id(value)])
+    if isinstance(value, BaseModel):
+        return (type(value).__name__, tuple((name, _args_key(getattr(value, name), index)) for name in type(value).model_fields))
+    if isinstance(value, np.ndarray):
+        # 整数坐标与相同值的浮点坐标视为相同
+        if value.dtype.kind in "iuf":
+            value = value.astype(np.float64)
+        return (value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, (list, tuple)):
+        return tuple(_args_key(item, index) for item in value)
+    return value
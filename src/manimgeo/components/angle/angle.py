@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pydantic import Field, model_validator
+from pydantic import Field
 from typing import TYPE_CHECKING, Literal, List, Any
 
 from ..base import BaseGeometry
@@ -17,15 +17,6 @@ class Angle(BaseGeometry):
     turn: Literal["Clockwise", "Counterclockwise"] = Field(default="Counterclockwise", description="角方向", init=False)
     args: AngleConstructArgs = Field(discriminator='construct_type', description="角构造参数")
 
-    @model_validator(mode='before')
-    @classmethod
-    def set_adapter_before_validation(cls, data: Any) -> Any:
-        """在验证前设置 adapter 字段"""
-        if isinstance(data, dict) and 'args' in data:
-            # 假设 args 已经是 Pydantic 模型或可以被 AngleAdapter 接受
-            data['adapter'] = AngleAdapter(args=data['args'])
-        return data
-
     @property
     def construct_type(self) -> AngleConstructType:
         return self.args.construct_type
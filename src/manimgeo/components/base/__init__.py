@@ -1,10 +1,7 @@
-from .base_pydantic import BaseModelN
+from .base_pydantic import BaseModelN, set_trusted_construction, is_trusted_construction, trusted_construction, register_types_namespace
+from .base_intern import set_interning, is_interning, interning, clear_interned
 from .base_argsmodel import ArgsModelBase
 from .base_geometry import BaseGeometry
-from .base_adapter import GeometryAdapter
+from .base_adapter import GeometryAdapter, set_output_reuse, is_output_reuse, output_reuse
+from .base_propagation import propagate, topological_order, batch_update, set_lazy_update, is_lazy_update, set_early_cutoff, is_early_cutoff
 
-# 重建
-BaseModelN.model_rebuild()
-BaseGeometry.model_rebuild()
-ArgsModelBase.model_rebuild()
-GeometryAdapter.model_rebuild()
\ No newline at end of file
@@ -1,19 +1,99 @@
 from __future__ import annotations
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
+from contextlib import contextmanager
 from ..base import BaseModelN
-from typing import TYPE_CHECKING, List, Generic
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, List, Generic, Optional, Tuple
+import numpy as np
 
 if TYPE_CHECKING:
     from .base_geometry import BaseGeometry
 
 from .base_argsmodel import _ArgsModelT
 
+# 构造方式的计算函数，接收适配器与参数模型，结果写入适配器的输出属性
+type ConstructHandler = Callable[[Any, Any], None]
+
+# 是否在多次计算之间复用输出数组
+_output_reuse = False
+
+def set_output_reuse(enabled: bool = True):
+    """
+    启用或关闭输出数组复用
+
+    启用后，适配器在多次计算之间复用每个输出属性的数组，计算结果原地写入，交点求解复用结果对象，
+    稳定的动画更新几乎不再分配内存。此时几何对象持有的属性数组会被之后的计算原地覆盖：
+    调用方持有的属性数组（如 `old = A.coord`、逐帧收集的 `M.coord`）随之改变，需要保留时应先复制
+
+    关闭时（默认）每次计算得到新数组，调用方此前持有的属性数组保持不变
+    """
+    global _output_reuse
+    _output_reuse = enabled
+
+def is_output_reuse() -> bool:
+    """是否启用输出数组复用"""
+    return _output_reuse
+
+@contextmanager
+def output_reuse():
+    """在上下文中临时启用输出数组复用，退出时恢复原状态"""
+    previous = _output_reuse
+    set_output_reuse(True)
+    try:
+        yield
+    finally:
+        set_output_reuse(previous)
+
 class GeometryAdapter(BaseModelN, Generic[_ArgsModelT]):
-    """几何对象参数适配器基类"""
+    """
+    几何对象参数适配器基类
+
+    每个子类持有一张构造方式到计算函数的分派表，计算函数通过 `register` 注册，
+    在适配器构造时按 `construct_type` 解析一次
+    """
     # 适配器直接持有参数模型
     args: _ArgsModelT = Field(description="适配器依赖的参数模型")
 
+    # 构造方式到计算函数的分派表，每个子类各自持有一份
+    _handlers: ClassVar[Dict[str, ConstructHandler]] = {}
+    # 构造时解析的计算函数
+    _handler: Optional[ConstructHandler] = PrivateAttr(default=None)
+
+    # 派生属性（如线长度、圆面积），更新时不计算，几何对象首次读取时由 `derive` 计算
+    derived_attrs: ClassVar[Tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any):
+        super().__pydantic_init_subclass__(**kwargs)
+        # 继承父类已注册的计算函数，子类注册的计算函数不影响父类
+        cls._handlers = dict(cls._handlers)
+
+    @classmethod
+    def register(cls, construct_type: str) -> Callable[[ConstructHandler], ConstructHandler]:
+        """
+        注册构造方式的计算函数，仅供库内部使用
+
+        ```python
+        @PointAdapter.register("MidPP")
+        def _mid_pp(adapter: PointAdapter, args: MidPPArgs):
+            ...
+        ```
+
+        - `construct_type`: 构造方式，与参数模型的 `construct_type` 一致
+
+        几何对象的参数模型是封闭的判别联合类型（如 `PointConstructArgs`），无法在库外注册新的参数模型，
+        因此不支持第三方构造方式。新增构造方式时需同时在对应的 `args` 模块中定义参数模型并加入联合类型，
+        在 `GeometryProgram` 中添加计算核。已构造的适配器仍使用构造时解析的计算函数
+        """
+        def decorator(handler: ConstructHandler) -> ConstructHandler:
+            cls._handlers[construct_type] = handler
+            return handler
+        return decorator
+
+    def model_post_init(self, __context: Any):
+        """解析构造方式对应的计算函数"""
+        self._handler = self._handlers.get(self.construct_type)
+
     @property
     def construct_type(self) -> str:
         # 所有 ArgsModel 都需要有一个 construct_type 字段
@@ -22,21 +102,98 @@ class GeometryAdapter(BaseModelN, Generic[_ArgsModelT]):
     def __repr__(self):
         # 原始 BaseModelN 的 __repr__ 方法开销巨大，改为简化输出
         return f"{self.__class__.__name__}(args={self.args})"
+
+    def __repr_args__(self):
+        # 派生属性仅在 derive 后才是最新值，不出现在嵌套输出与错误信息中
+        derived = self.derived_attrs
+        for name, value in super().__repr_args__():
+            if name not in derived:
+                yield name, value
     
     def bind_attributes(self, target: "BaseGeometry", attrs: List[str]):
         """
         将适配器计算得到的参数绑定到几何对象
 
+        向量属性不经复制，几何对象与适配器共享同一数组，数组未变化时无需再次写入；
+        其余属性直接写入几何对象的 `__dict__`，跳过 pydantic 的 `__setattr__`。
+        派生属性被移出几何对象的 `__dict__`，首次读取时经 `BaseGeometry.__getattr__` 调用 `derive`
+
         - `target`: 目标几何对象
         - `attrs`: 需要绑定的属性列表
         """
+        source = self.__dict__
+        fields = target.__dict__
+        derived = self.derived_attrs
         for attr in attrs:
-            if hasattr(self, attr):
-                setattr(target, attr, getattr(self, attr))
-            else:
+            if attr in derived:
+                fields.pop(attr, None)
+                continue
+            try:
+                value = source[attr]
+            except KeyError:
                 # 如果 target 期望某个属性而适配器没有，则抛出异常
-                raise AttributeError(f"适配器 '{self.__class__.__name__}' 缺少属性: '{attr}'，无法绑定到目标对象 '{target.name}'")
+                raise AttributeError(f"适配器 '{self.__class__.__name__}' 缺少属性: '{attr}'，无法绑定到目标对象 '{target.name}'") from None
+            if fields.get(attr) is not value:
+                fields[attr] = value
+
+    def derive(self):
+        """
+        由最近一次计算的结果计算全部派生属性
+
+        派生属性仅在调用后才是最新值，直接读取适配器时需先调用本方法
+        """
+
+    def _store(self, name: str, value: Any) -> np.ndarray:
+        """
+        将计算结果复制到名为 `name` 的输出数组，并返回该数组
+
+        用于与上游对象或构造参数共享内存的值（如 `args.coord`、`line.start`），
+        新计算得到的数组应使用 `_take`
+
+        - `name`: 输出属性名称
+        - `value`: 计算结果
+        """
+        buffer = self._output(name, value)
+        np.copyto(buffer, value)
+        return buffer
+
+    def _take(self, name: str, value: np.ndarray) -> np.ndarray:
+        """
+        将新计算得到的数组作为名为 `name` 的输出属性，并返回输出数组
+
+        默认直接使用该数组而不复制；输出数组复用模式下写入复用的数组，见 `set_output_reuse`
+
+        - `name`: 输出属性名称
+        - `value`: 计算结果，不能与上游对象或构造参数共享内存
+        """
+        if _output_reuse:
+            return self._store(name, value)
+        value = np.asarray(value, dtype=np.float64)
+        self.__dict__[name] = value
+        return value
+
+    def _output(self, name: str, like: Any) -> np.ndarray:
+        """
+        获取名为 `name` 的输出数组，供 `out=` 形式的计算使用
+
+        默认每次分配新数组；输出数组复用模式下返回上一次的数组，形状不一致时重新分配
+
+        - `name`: 输出属性名称
+        - `like`: 形状与计算结果一致的数组
+        """
+        shape = np.shape(like)
+        if _output_reuse:
+            buffer = self.__dict__.get(name)
+            if isinstance(buffer, np.ndarray) and buffer.shape == shape and buffer.dtype == np.float64 and buffer.flags.writeable:
+                return buffer
+        buffer = np.empty(shape)
+        self.__dict__[name] = buffer
+        return buffer
 
     def __call__(self):
         """根据 construct_type 规定的计算方法计算具体参数"""
-        raise NotImplementedError("子类须实现 __call__ 以执行具体计算")
+        # __pydantic_private__ 为实例槽位，直接读取以跳过 pydantic 的 __getattr__
+        handler = self.__pydantic_private__["_handler"] # type: ignore[index]
+        if handler is None:
+            raise NotImplementedError(f"{type(self).__name__} 不支持的构造方式: {self.construct_type}")
+        handler(self, self.args)
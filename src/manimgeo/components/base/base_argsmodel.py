@@ -2,11 +2,14 @@ from __future__ import annotations
 
 from .base_pydantic import BaseModelN
 from pydantic import Field
-from typing import List, TypeVar, TYPE_CHECKING
+from typing import Dict, List, Tuple, TypeVar, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .base_geometry import BaseGeometry
 
+# 各参数模型类中可能包含依赖对象的字段名称
+_dep_fields: Dict[type, Tuple[str, ...]] = {}
+
 # 适配器的泛型参数模型
 class ArgsModelBase(BaseModelN):
     """适配器参数模型基类"""
@@ -38,8 +41,14 @@ class ArgsModelBase(BaseModelN):
         
         dep_objects: List[BaseGeometry] = []
 
-        for field_name, field_info in self.__class__.model_fields.items():
-            field_value = getattr(self, field_name)
+        cls = self.__class__
+        names = _dep_fields.get(cls)
+        if names is None:
+            names = _dep_fields[cls] = tuple(name for name in cls.model_fields if name != "construct_type")
+
+        fields = self.__dict__
+        for field_name in names:
+            field_value = fields.get(field_name)
             
             # 基本几何对象
             if isinstance(field_value, BaseGeometry):
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from pydantic import Field, ValidationError
+from pydantic import BaseModel, Field, PrivateAttr, ValidationError
 from .base_pydantic import BaseModelN
-from typing import List, Optional, Any, Generic, Hashable
+import numpy as np
+from typing import Dict, List, Optional, Any, Generic, Hashable, Set, Tuple
+from itertools import count
 
 from .base_adapter import GeometryAdapter
+from .base_propagation import propagate, is_batching, defer, pull, cutoff_epoch, outputs_close
+from .base_intern import GeometryMeta, forget_interned
 
 # 日志
 import logging
@@ -12,15 +16,61 @@ logger = logging.getLogger(__name__)
 
 from .base_argsmodel import _ArgsModelT
 
-class BaseGeometry(BaseModelN, Generic[_ArgsModelT]):
+# __pydantic_private__ 槽位的读取函数
+_get_private = BaseModel.__dict__["__pydantic_private__"].__get__
+
+# 全局版本计数器，不同对象、不同时刻的版本号互不相同
+_versions = count(1)
+
+class BaseGeometry(BaseModelN, Generic[_ArgsModelT], metaclass=GeometryMeta):
     """几何对象基类"""
     name: str = Field(description="几何对象名称")
     attrs: List[str] = Field(default_factory=list, description="几何对象属性列表", init=False)
     
-    adapter: GeometryAdapter[Any] = Field(description="几何对象参数适配器", init=False)
+    adapter: GeometryAdapter[Any] = Field(default=None, description="几何对象参数适配器，由子类在 model_post_init 中创建", init=False)
     dependencies: List[BaseGeometry] = Field(default_factory=list, description="当前几何对象直接依赖的其他几何对象列表", init=False)
     dependents: List[BaseGeometry] = Field(default_factory=list, description="依赖于当前几何对象的其他几何对象列表", init=False)
     on_error: bool = Field(default=False, description="是否在更新过程中发生错误", init=False)
+    dirty: bool = Field(default=False, description="惰性模式下，是否等待重新计算", init=False)
+
+    # 惰性模式下暂存的过期属性值
+    _stale_attrs: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    # 提前截止模式下，上一次传播时的计算属性快照及其轮次
+    _snapshot: Optional[Tuple[int, Dict[str, Any]]] = PrivateAttr(default=None)
+    # 挂载的坐标池，见 `manimgeo.program.GeometryArena`
+    _arena: Optional[Any] = PrivateAttr(default=None)
+    # 下游对象的 id，用于快速判断是否已添加
+    _dependent_ids: Set[int] = PrivateAttr(default_factory=set)
+    # 结构复用模式下的构造键，见 `set_interning`
+    _intern_key: Optional[Hashable] = PrivateAttr(default=None)
+    # 计算属性的版本号，见 `version`
+    _version: int = PrivateAttr(default=0)
+
+    def __getattr__(self, item: str) -> Any:
+        # 私有属性直接从 __pydantic_private__ 读取，跳过 pydantic 的 __getattr__
+        if item[0] == "_":
+            try:
+                return _get_private(self)[item]
+            except (AttributeError, KeyError, TypeError):
+                pass
+        # 惰性模式下，脏对象的计算属性被移出 __dict__，首次访问时才触发计算
+        fields = self.__dict__
+        if fields.get("dirty", False) and (item == "on_error" or item in fields.get("attrs", ())):
+            pull(self)
+            if item in fields:
+                return fields[item]
+        # 派生属性在每次计算后被移出 __dict__，首次访问时由适配器计算
+        adapter = fields.get("adapter")
+        if adapter is not None and item in adapter.derived_attrs and item in fields.get("attrs", ()):
+            adapter.derive()
+            source = adapter.__dict__
+            for name in adapter.derived_attrs:
+                fields[name] = source[name]
+            arena = _get_private(self).get("_arena")
+            if arena is not None:
+                arena.store(self, derived=True)
+            return fields[item]
+        return super().__getattr__(item)
 
     def __repr__(self):
         # 原始 BaseModelN 的 __repr__ 方法开销巨大，改为简化输出
@@ -40,6 +90,22 @@ class BaseGeometry(BaseModelN, Generic[_ArgsModelT]):
             return NotImplemented
         return id(self) == id(other)
 
+    @property
+    def version(self) -> int:
+        """
+        计算属性的版本号
+
+        每次计算或错误标记变化时分配新的全局唯一版本号，版本号不变时计算属性与错误标记均未改变。
+        动画管理器据此跳过未变化对象的同步。惰性模式下读取时先完成计算
+        """
+        if self.__dict__.get("dirty", False):
+            pull(self)
+        return _get_private(self)["_version"]
+
+    def _bump_version(self):
+        """分配新的版本号，计算属性被直接写入时调用"""
+        _get_private(self)["_version"] = next(_versions)
+
     def get_name(self, default_name: str):
         """以统一方式设置几何对象名称"""
         if default_name != "":
@@ -47,13 +113,28 @@ class BaseGeometry(BaseModelN, Generic[_ArgsModelT]):
         else:
             return f"{type(self).__name__}[{self.adapter.construct_type}]@{id(self) % 100000}"
 
+    @classmethod
+    def Many(cls, construct_type: str, **args: Any) -> Any:
+        """
+        以同一构造方式批量构造几何对象，返回 `manimgeo.program.GeometryArray`
+
+        - `construct_type`: 构造方式，如 `"MidPP"`
+        - `args`: 构造参数，名称与参数模型的字段一致，几何参数可以是 `GeometryArray`
+
+        批量构造的对象不是 pydantic 模型，也不参与更新传播，见 `GeometryArray.construct`
+        """
+        from ...program.bulk import GeometryArray
+        return GeometryArray.construct(cls, construct_type, **args)
+
     def add_dependent(self, obj: BaseGeometry):
         """
         添加依赖于当前对象的下游对象
         
         - `obj`: 下游依赖对象
         """
-        if obj not in self.dependents:
+        # 按 id 判断，避免在下游众多时逐个调用 __eq__
+        if id(obj) not in self._dependent_ids:
+            self._dependent_ids.add(id(obj))
             self.dependents.append(obj)
 
     def remove_dependent(self, obj: Optional[BaseGeometry]):
@@ -64,8 +145,10 @@ class BaseGeometry(BaseModelN, Generic[_ArgsModelT]):
         """
         if obj is None:
             self.dependents.clear()
+            self._dependent_ids.clear()
         else:
-            if obj in self.dependents:
+            if id(obj) in self._dependent_ids:
+                self._dependent_ids.discard(id(obj))
                 self.dependents.remove(obj)
 
     def _add_dependency(self, obj: BaseGeometry):
@@ -96,12 +179,17 @@ class BaseGeometry(BaseModelN, Generic[_ArgsModelT]):
     def board_update_msg(self, on_error: bool = False):
         """
         向所有下游依赖项发出更新信号
+
+        下游对象将按照拓扑顺序各自计算一次，详见 `base_propagation.propagate`
         
-        - `on_error`: 是否在更新过程中发生错误，默认为 False
+        - `on_error`: 是否在更新过程中发生错误，默认为 False。若为 True，下游对象仅被标记为错误
+
+        处于批量更新事务（`batch_update`）中时，传播将推迟到事务结束
         """
-        for dep in self.dependents:
-            dep.update() # 递归更新下游
-            dep.on_error = on_error
+        if is_batching():
+            defer(self)
+            return
+        propagate([self], precomputed=[self], on_error=on_error)
 
     def _extract_dependencies_from_args(self, args_model: _ArgsModelT):
         """
@@ -134,34 +222,95 @@ class BaseGeometry(BaseModelN, Generic[_ArgsModelT]):
                     raise TypeError(f"传入的参数模型类型 {type(new_args_model).__name__} 与当前适配器期望的类型 {type(self.adapter.args).__name__} 不匹配。")
                 
                 self.adapter.args = new_args_model
+                # 构造参数已改变，不再与原构造键对应
+                forget_interned(self)
             
             except (TypeError, ValidationError) as e:
                 logger.error(f"更新对象 {self.name} 的参数失败: {e}")
+                self._mark_error()
                 self.board_update_msg(True)
-                self.on_error = True
                 return
             
             except Exception as e:
                 logger.error(f"更新对象 {self.name} 的参数时发生未知错误: {e}")
+                self._mark_error()
                 self.board_update_msg(True)
-                self.on_error = True
                 return
         
         try:
-            # 调用适配器进行计算
-            self.adapter()
-            # 将参数从适配器绑定到几何对象
-            self.adapter.bind_attributes(self, self.attrs)
+            self._compute()
             
         except Exception as e:
             logger.warning(f"节点 {self.name} ({type(self).__name__}) 计算失败", exc_info=True)
             
-            # 传播更新消息并标记错误
+            # 标记错误并传播至下游
+            self._mark_error()
             self.board_update_msg(True)
-            self.on_error = True
             raise e
         
         # 成功更新，清除错误标记
         self.on_error = False
         # 向下游广播更新信息
         self.board_update_msg()
+
+    def _mark_error(self):
+        """
+        标记为错误状态
+
+        同时丢弃提前截止的快照，恢复后的首次计算总会被视为变化，以清除下游的错误标记
+        """
+        self.on_error = True
+        self._snapshot = None
+        self._bump_version()
+
+    def _outputs_changed(self) -> bool:
+        """
+        将计算属性与上一次传播时的快照比较，判断是否发生变化，并在变化时更新快照
+
+        容差取自 `GeoConfig`，由于总是与快照而非上一帧比较，缓慢漂移的累积误差不会超过容差
+        """
+        # 派生属性由其余计算属性决定，无需比较，也避免触发计算
+        derived = self.adapter.derived_attrs
+        values = {name: getattr(self, name) for name in self.attrs if name not in derived}
+        snapshot = self._snapshot
+        epoch = cutoff_epoch()
+        if (
+            snapshot is not None and snapshot[0] == epoch
+            and all(outputs_close(snapshot[1].get(name), value) for name, value in values.items())
+        ):
+            return False
+
+        self._snapshot = (epoch, {
+            name: value.copy() if isinstance(value, np.ndarray) else value
+            for name, value in values.items()
+        })
+        return True
+
+    def _mark_dirty(self):
+        """
+        标记为等待重新计算
+
+        计算属性与错误标记被移出 `__dict__` 暂存，之后首次访问时经 `__getattr__` 触发计算
+        """
+        fields = self.__dict__
+        self._stale_attrs = {name: fields.pop(name) for name in [*self.attrs, "on_error"] if name in fields}
+        self.dirty = True
+
+    def _clear_dirty(self):
+        """清除脏标记，并恢复暂存的属性值"""
+        self.__dict__.update(self._stale_attrs)
+        self._stale_attrs = {}
+        self.dirty = False
+
+    def _compute(self):
+        """仅计算当前对象自身，不向下游传播"""
+        if self.dirty:
+            self._clear_dirty()
+        # 调用适配器进行计算
+        self.adapter()
+        # 将参数从适配器绑定到几何对象
+        self.adapter.bind_attributes(self, self.attrs)
+        # 挂载坐标池时，将结果写入池中的固定位置
+        if self._arena is not None:
+            self._arena.store(self)
+        self._bump_version()
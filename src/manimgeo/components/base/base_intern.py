@@ -0,0 +1,112 @@
+"""
+结构相同构造的复用（hash-consing）
+
+启用后，以相同构造方式、相同依赖对象及相同数值参数重复构造几何对象时，
+直接返回已存在的对象，而不是创建新的节点
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, Hashable, List, Optional
+from weakref import WeakValueDictionary
+from pydantic import BaseModel
+import numpy as np
+
+from .base_pydantic import BaseModelN
+
+_interning = False
+# 构造键到几何对象的弱引用表，对象被回收后自动移除
+_interned: WeakValueDictionary[Hashable, Any] = WeakValueDictionary()
+
+def set_interning(enabled: bool = True):
+    """
+    启用或关闭结构相同构造的复用
+
+    启用后，构造键 (几何类型, 构造方式, 依赖对象, 数值参数) 相同的构造直接返回已存在的对象，
+    对象名称以首次构造时为准。没有依赖的对象（如自由点）总是新建
+    """
+    global _interning
+    _interning = enabled
+
+def is_interning() -> bool:
+    """是否启用结构相同构造的复用"""
+    return _interning
+
+@contextmanager
+def interning():
+    """在上下文中临时启用结构相同构造的复用，退出时恢复原状态"""
+    previous = _interning
+    set_interning(True)
+    try:
+        yield
+    finally:
+        set_interning(previous)
+
+def clear_interned():
+    """清空已记录的构造"""
+    _interned.clear()
+
+class _Unhashable(Exception):
+    """参数中包含无法作为构造键的值"""
+
+def _value_key(value: Any, deps: List[int]) -> Hashable:
+    """将参数值转换为可哈希的键，几何对象以 id 表示"""
+    if isinstance(type(value), GeometryMeta):
+        # 已记录的对象持有其依赖，依赖存活期间 id 不会被复用
+        deps.append(id(value))
+        return ("geometry", id(value))
+    if isinstance(value, BaseModel):
+        return (type(value), tuple(_value_key(getattr(value, name), deps) for name in type(value).model_fields))
+    if isinstance(value, np.ndarray):
+        return (value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, (list, tuple)):
+        return tuple(_value_key(item, deps) for item in value)
+    if value is None or isinstance(value, (str, int, float, bool, np.number)):
+        return value
+    raise _Unhashable
+
+def intern_key(cls: type, args: Any) -> Optional[Hashable]:
+    """
+    计算构造键，不能复用的构造返回 None
+
+    - `cls`: 几何对象类
+    - `args`: 参数模型实例
+    """
+    if not isinstance(args, BaseModel):
+        return None
+    deps: List[int] = []
+    try:
+        key = (cls, _value_key(args, deps))
+    except _Unhashable:
+        return None
+    return key if deps else None
+
+class GeometryMeta(type(BaseModelN)):
+    """几何对象的元类，在创建实例前查找结构相同的已有对象"""
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        if not _interning:
+            return super().__call__(*args, **kwargs)
+        key = intern_key(cls, kwargs.get("args"))
+        if key is None:
+            return super().__call__(*args, **kwargs)
+        existing = _interned.get(key)
+        if existing is not None:
+            return existing
+        obj = super().__call__(*args, **kwargs)
+        obj._intern_key = key
+        _interned[key] = obj
+        return obj
+
+def forget_interned(obj: Any):
+    """
+    移除几何对象的构造记录，构造参数被替换时调用
+
+    - `obj`: 几何对象
+    """
+    key = obj._intern_key
+    if key is not None:
+        if _interned.get(key) is obj:
+            del _interned[key]
+        obj._intern_key = None
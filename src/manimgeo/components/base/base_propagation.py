@@ -0,0 +1,314 @@
+"""
+依赖图更新传播引擎
+
+几何对象之间通过 `dependencies` 与 `dependents` 构成有向无环图，当某个对象发生变化时，
+需要让所有受影响的下游对象按照拓扑顺序各自重新计算一次
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Set
+import numpy as np
+
+from ...math.base import close
+
+if TYPE_CHECKING:
+    from .base_geometry import BaseGeometry
+
+# 日志
+import logging
+logger = logging.getLogger(__name__)
+
+# 批量更新状态：嵌套深度与延迟传播的起始对象
+_batch_depth: int = 0
+_batch_pending: Dict[int, BaseGeometry] = {}
+
+# 是否启用惰性（拉取式）求值
+_lazy_update: bool = False
+
+def set_lazy_update(enabled: bool = True):
+    """
+    启用或关闭惰性求值
+
+    惰性模式下，对象变化只会将其下游标记为脏，下游对象的计算属性（如 `Point.coord`、`Circle.radius`）
+    以及 `on_error` 会在首次被访问时才重新计算，未被读取的辅助构造不再产生开销
+
+    - `enabled`: 是否启用
+    """
+    global _lazy_update
+    _lazy_update = enabled
+
+def is_lazy_update() -> bool:
+    """当前是否启用惰性求值"""
+    return _lazy_update
+
+# 是否启用提前截止，以及快照所属的轮次
+_early_cutoff: bool = False
+_cutoff_epoch: int = 0
+
+def set_early_cutoff(enabled: bool = True):
+    """
+    启用或关闭提前截止
+
+    启用后，每个对象计算完成时会将计算属性与上一次传播时的快照比较（容差取自 `GeoConfig` 的 atol 与 rtol），
+    若没有变化则不再计算其下游，部分静止的场景每帧几乎没有开销
+
+    - `enabled`: 是否启用
+    """
+    global _early_cutoff, _cutoff_epoch
+    _early_cutoff = enabled
+    # 关闭期间快照不再维护，切换后旧快照全部失效
+    _cutoff_epoch += 1
+
+def is_early_cutoff() -> bool:
+    """当前是否启用提前截止"""
+    return _early_cutoff
+
+def cutoff_epoch() -> int:
+    """当前快照轮次，`set_early_cutoff` 每次调用后递增"""
+    return _cutoff_epoch
+
+def outputs_close(old: Any, new: Any) -> bool:
+    """
+    判断计算属性在容差内是否未发生变化
+
+    数组与数值按 `GeoConfig` 的容差比较，字符串按值比较，
+    其余类型（如 `MultipleComponents` 的对象列表）无法可靠比较，总是视为发生变化
+    """
+    if isinstance(new, np.ndarray):
+        return isinstance(old, np.ndarray) and old.shape == new.shape and close(old, new)
+    if isinstance(new, (int, float)) and not isinstance(new, bool):
+        return isinstance(old, (int, float)) and not isinstance(old, bool) and close(new, old)
+    if isinstance(new, (str, bool)):
+        return type(old) is type(new) and old == new
+    return False
+
+def topological_order(roots: Iterable[BaseGeometry]) -> List[BaseGeometry]:
+    """
+    收集 `roots` 及其所有下游对象，并按拓扑顺序返回
+
+    使用显式栈进行迭代深度优先遍历，深层依赖链不会触发 Python 递归深度限制。
+    结果为深度优先后序的逆序，保证任一对象都排在其所有受影响的上游对象之后
+
+    - `roots`: 发生变化的起始对象
+    """
+    visited: Set[int] = set()
+    postorder: List[BaseGeometry] = []
+
+    for root in roots:
+        if id(root) in visited:
+            continue
+        visited.add(id(root))
+        stack = [(root, iter(root.dependents))]
+
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if id(child) not in visited:
+                    visited.add(id(child))
+                    stack.append((child, iter(child.dependents)))
+                    break
+            else:
+                # 所有下游均已访问，节点出栈
+                stack.pop()
+                postorder.append(node)
+
+    postorder.reverse()
+    return postorder
+
+def propagate(
+        roots: Iterable[BaseGeometry],
+        precomputed: Optional[Iterable[BaseGeometry]] = None,
+        on_error: bool = False
+    ):
+    """
+    对 `roots` 的全部下游对象执行一次按拓扑顺序的更新，每个对象最多计算一次
+
+    - `roots`: 发生变化的起始对象
+    - `precomputed`: 已经完成计算的对象（通常为 `roots` 本身），若其上游均未在本次传播中变化则不会被重复计算
+    - `on_error`: 起始对象是否处于错误状态，若为 True，则所有下游对象仅被标记为错误而不进行计算
+
+    某个对象计算失败时，其所有下游对象将被标记为错误并跳过计算，其余分支照常更新。
+    全部传播完成后，若存在计算失败的对象，则重新抛出第一个异常
+
+    启用提前截止时（见 `set_early_cutoff`），仅当存在上游对象的计算属性实际发生变化时才计算当前对象
+
+    惰性模式下不进行计算，仅将下游对象标记为脏，见 `set_lazy_update`
+    """
+    roots = list(roots)
+    if _lazy_update:
+        mark_dirty(roots, precomputed)
+        return
+
+    order = topological_order(roots)
+    root_ids: Set[int] = {id(root) for root in roots}
+    skipped: Set[int] = {id(node) for node in (precomputed or [])}
+    failed: Set[int] = {id(root) for root in roots} if on_error else set()
+    first_error: Optional[Exception] = None
+
+    # 未启用提前截止时，所有受影响的对象都视为发生变化
+    cutoff = _early_cutoff
+    changed: Set[int] = set() if cutoff else {id(node) for node in order}
+
+    for node in order:
+        upstream_changed = False
+        upstream_failed = False
+        for dep in node.dependencies:
+            if id(dep) in failed:
+                upstream_failed = True
+                break
+            if id(dep) in changed:
+                upstream_changed = True
+
+        if upstream_failed:
+            node._mark_error()
+            failed.add(id(node))
+            continue
+
+        if id(node) in skipped and not upstream_changed:
+            # 已计算完成，且没有上游在本次传播中变化
+            if node.on_error:
+                failed.add(id(node))
+            elif cutoff and node._outputs_changed():
+                changed.add(id(node))
+            continue
+
+        if not upstream_changed and id(node) not in root_ids:
+            # 提前截止：上游均未变化
+            continue
+
+        try:
+            node._compute()
+        except Exception as e:
+            logger.warning(f"节点 {node.name} ({type(node).__name__}) 计算失败", exc_info=True)
+            node._mark_error()
+            failed.add(id(node))
+            if first_error is None:
+                first_error = e
+            continue
+
+        node.on_error = False
+        if cutoff and node._outputs_changed():
+            changed.add(id(node))
+
+    if first_error is not None:
+        raise first_error
+
+def mark_dirty(roots: Iterable[BaseGeometry], precomputed: Optional[Iterable[BaseGeometry]] = None):
+    """
+    将 `roots` 的全部下游对象标记为脏
+
+    已经为脏的对象，其下游必然也已为脏，遍历在此处截止
+
+    - `roots`: 发生变化的起始对象
+    - `precomputed`: 已经完成计算的对象，不会被标记
+
+    启用提前截止时，计算属性未发生变化的 `precomputed` 对象不会标记其下游
+    """
+    skipped: Set[int] = {id(node) for node in (precomputed or [])}
+    stack: List[BaseGeometry] = []
+    for root in roots:
+        if id(root) in skipped:
+            if _early_cutoff and not root.on_error and not root._outputs_changed():
+                continue
+            stack.extend(root.dependents)
+        else:
+            stack.append(root)
+
+    while stack:
+        node = stack.pop()
+        if node.dirty:
+            continue
+        node._mark_dirty()
+        stack.extend(node.dependents)
+
+def pull(node: BaseGeometry):
+    """
+    按需计算脏对象
+
+    沿 `dependencies` 收集 `node` 所有脏的上游对象，按拓扑顺序逐个计算并清除脏标记。
+    计算失败的对象仅被标记为错误（保留原有属性值）而不抛出异常，其下游对象同样被标记为错误
+
+    - `node`: 需要读取属性的对象
+    """
+    # 迭代后序遍历脏上游，后序即拓扑顺序
+    visited: Set[int] = {id(node)}
+    order: List[BaseGeometry] = []
+    stack = [(node, iter(node.dependencies))]
+    while stack:
+        current, parents = stack[-1]
+        for parent in parents:
+            if id(parent) not in visited and parent.dirty:
+                visited.add(id(parent))
+                stack.append((parent, iter(parent.dependencies)))
+                break
+        else:
+            stack.pop()
+            order.append(current)
+
+    for current in order:
+        current._clear_dirty()
+        if any(dep.on_error for dep in current.dependencies):
+            current._mark_error()
+            continue
+        try:
+            current._compute()
+        except Exception:
+            logger.warning(f"节点 {current.name} ({type(current).__name__}) 计算失败", exc_info=True)
+            current._mark_error()
+            continue
+        current.on_error = False
+
+def is_batching() -> bool:
+    """当前是否处于批量更新事务中"""
+    return _batch_depth > 0
+
+def defer(root: BaseGeometry):
+    """
+    在批量更新事务中登记发生变化的对象，传播将推迟到事务结束时进行
+
+    - `root`: 已完成自身计算的对象
+    """
+    _batch_pending[id(root)] = root
+
+@contextmanager
+def batch_update() -> Iterator[None]:
+    """
+    批量更新事务
+
+    事务内对几何对象的修改（如 `Point.set_coord`）只计算对象自身，下游传播被推迟。
+    最外层事务结束时，对所有变化对象的下游并集执行一次合并的拓扑传播：
+
+    ```python
+    with batch_update():
+        A.set_coord(...)
+        B.set_coord(...)
+        C.set_coord(...)
+    ```
+
+    事务可以嵌套，仅在最外层退出时传播。事务内抛出异常时仍会传播已发生的修改，
+    若传播本身再次失败，该错误被记录并附加到原异常的说明中，原异常照常抛出
+    """
+    global _batch_depth
+    _batch_depth += 1
+    try:
+        yield
+    except BaseException as e:
+        _batch_depth -= 1
+        try:
+            _flush_batch()
+        except Exception as flush_error:
+            logger.error("批量更新事务异常退出后，传播已发生的修改失败", exc_info=True)
+            e.add_note(f"批量更新事务异常退出后，传播已发生的修改失败: {flush_error!r}")
+        raise
+    else:
+        _batch_depth -= 1
+        _flush_batch()
+
+def _flush_batch():
+    """最外层事务结束时，对推迟的起始对象执行合并传播"""
+    if _batch_depth == 0 and _batch_pending:
+        roots = list(_batch_pending.values())
+        _batch_pending.clear()
+        propagate(roots, precomputed=roots)
@@ -1,7 +1,129 @@
 from pydantic import BaseModel, ConfigDict
+from contextlib import contextmanager
+from copy import copy
+from typing import Any, Callable, Dict, Optional, Tuple
+
+_trusted = False
+
+def set_trusted_construction(enabled: bool = True):
+    """
+    启用或关闭可信构造模式
+
+    启用后，所有模型（参数模型、适配器与几何对象）的构造均跳过 pydantic 验证及验证器，
+    行为与 `model_construct` 一致，但仍会执行 `model_post_init`。调用方需保证传入的参数类型正确，
+    适用于程序化生成大量节点的场景
+    """
+    global _trusted
+    _trusted = enabled
+
+def is_trusted_construction() -> bool:
+    """是否处于可信构造模式"""
+    return _trusted
+
+@contextmanager
+def trusted_construction():
+    """在上下文中临时启用可信构造模式，退出时恢复原状态"""
+    previous = _trusted
+    set_trusted_construction(True)
+    try:
+        yield
+    finally:
+        set_trusted_construction(previous)
+
+_object_setattr = object.__setattr__
+
+# 无需复制的默认值类型
+_IMMUTABLE = (str, int, float, bool, type(None))
+
+# 各模型类的字段默认值：(字段名, 是否必填, 默认值工厂, 默认值)
+type _Defaults = Tuple[Tuple[str, bool, Optional[Callable[[], Any]], Any], ...]
+_defaults: Dict[type, _Defaults] = {}
+
+def _field_defaults(cls: type[BaseModel]) -> _Defaults:
+    """
+    获取并缓存模型类的字段默认值
+
+    `FieldInfo.get_default` 每次调用都会检查默认值工厂的签名，逐个节点构造时开销明显
+    """
+    defaults = _defaults.get(cls)
+    if defaults is None:
+        entries = []
+        for name, field in cls.__pydantic_fields__.items():
+            if field.is_required():
+                entries.append((name, True, None, None))
+            elif field.default_factory is not None:
+                if field.default_factory_takes_validated_data:
+                    raise TypeError(f"可信构造模式不支持依赖其他字段的默认值工厂: {cls.__name__}.{name}")
+                entries.append((name, False, field.default_factory, None))
+            else:
+                entries.append((name, False, None, field.default))
+        defaults = _defaults[cls] = tuple(entries)
+    return defaults
+
+# 延迟构建模型时解析前向引用使用的命名空间，由 components 模块导入完成时注册
+_types_namespace_registry: Dict[str, Any] = {}
+
+def register_types_namespace(namespace: Dict[str, Any]):
+    """
+    注册解析前向引用（如参数模型中的 `Point`）使用的命名空间
+
+    - `namespace`: 名称到类型的映射
+    """
+    _types_namespace_registry.update(namespace)
 
 class BaseModelN(BaseModel):
     model_config = ConfigDict(
         arbitrary_types_allowed=True, # 忽略 np 字段验证
         frozen=False, # 允许对象可变
-    )
\ No newline at end of file
+        defer_build=True, # 首次验证时才构建验证器，加快导入
+    )
+
+    @classmethod
+    def model_rebuild(
+        cls,
+        *,
+        force: bool = False,
+        raise_errors: bool = True,
+        _parent_namespace_depth: int = 2,
+        _types_namespace: Optional[Dict[str, Any]] = None,
+    ) -> Optional[bool]:
+        """
+        构建模型的验证器，默认使用已注册的命名空间解析前向引用
+
+        延迟构建的模型在首次验证时由 pydantic 自动调用本方法
+        """
+        if _types_namespace is None and _types_namespace_registry:
+            _types_namespace = _types_namespace_registry
+        return super().model_rebuild(
+            force=force,
+            raise_errors=raise_errors,
+            _parent_namespace_depth=_parent_namespace_depth + 1,
+            _types_namespace=_types_namespace,
+        )
+
+    def __init__(self, /, **data: Any):
+        if _trusted:
+            self._construct_unchecked(data)
+        else:
+            super().__init__(**data)
+
+    def _construct_unchecked(self, data: Dict[str, Any]):
+        """跳过验证直接填充字段，等价于在当前实例上执行 `model_construct`"""
+        cls = type(self)
+        values: Dict[str, Any] = {}
+        for name, required, factory, default in _field_defaults(cls):
+            if name in data:
+                values[name] = data[name]
+            elif required:
+                continue
+            elif factory is not None:
+                values[name] = factory() # type: ignore
+            else:
+                # 默认值均为浮点数组或字符串列表等扁平结构，浅复制即可
+                values[name] = default if isinstance(default, _IMMUTABLE) else copy(default)
+        _object_setattr(self, '__dict__', values)
+        _object_setattr(self, '__pydantic_fields_set__', set(data))
+        _object_setattr(self, '__pydantic_extra__', None)
+        _object_setattr(self, '__pydantic_private__', None)
+        if cls.__pydantic_post_init__:
+            self.model_post_init(None)
@@ -9,86 +9,93 @@ from ...math import (
 from ..base import GeometryAdapter
 from .args import *
 from pydantic import Field
-from typing import cast
 import numpy as np
 
+# 默认法向量，XY 平面
+_XY_NORMAL = np.array([0.0, 0.0, 1.0])
+
 class CircleAdapter(GeometryAdapter[CircleConstructArgs]):
-    center: np.ndarray = Field(default=np.zeros(3), description="计算圆心坐标", init=False)
+    center: np.ndarray = Field(default_factory=lambda: np.zeros(3), description="计算圆心坐标", init=False)
     radius: Number = Field(default=0.0, description="计算圆半径", init=False)
-    normal: np.ndarray = Field(default=np.array([0.0, 0.0, 1.0]), description="计算圆所在平面的法向量", init=False) # 新增
+    normal: np.ndarray = Field(default_factory=lambda: _XY_NORMAL.copy(), description="计算圆所在平面的法向量", init=False) # 新增
     area: Number = Field(default=0.0, description="计算圆面积", init=False)
     circumference: Number = Field(default=0.0, description="计算圆周长", init=False)
 
-    def __call__(self):
-        """根据 self.args 执行具体计算"""
-
-        match self.construct_type:
-            case "CNR":
-                args = cast(CNRArgs, self.args)
-                self.center = args.center.coord.copy()
-                self.radius = args.radius
-                self.normal = args.normal.vec / np.linalg.norm(args.normal.vec) # 归一化
-
-            case "PR":
-                args = cast(PRArgs, self.args)
-                self.center = args.center.coord.copy()
-                self.radius = args.radius
-                if args.normal:
-                    self.normal = args.normal.vec / np.linalg.norm(args.normal.vec)
-                else:
-                    self.normal = np.array([0.0, 0.0, 1.0]) # 默认 XY 平面
-
-            case "PP":
-                args = cast(PPArgs, self.args)
-                self.center = args.center.coord.copy()
-                self.radius = np.linalg.norm(args.point.coord - args.center.coord) # type: ignore
-                if args.normal:
-                    self.normal = args.normal.vec / np.linalg.norm(args.normal.vec)
-                else:
-                    self.normal = np.array([0.0, 0.0, 1.0]) # 默认 XY 平面
-
-            case "L":
-                args = cast(LArgs, self.args)
-                start = args.radius_segment.start.copy()
-                end = args.radius_segment.end.copy()
-                self.center = start
-                self.radius = np.linalg.norm(end - start) # type: ignore
-                if args.normal:
-                    self.normal = args.normal.vec / np.linalg.norm(args.normal.vec)
-                else:
-                    self.normal = np.array([0.0, 0.0, 1.0]) # 默认 XY 平面
-
-            case "PPP":
-                args = cast(PPPArgs, self.args)
-                self.radius, self.center = circumcenter(
-                    args.point1.coord, args.point2.coord, args.point3.coord
-                )
-                A, B, C = plane_get_ABCD(args.point1.coord, args.point2.coord, args.point3.coord)
-                normal_vec = np.array([A, B, C])
-                self.normal = normal_vec / np.linalg.norm(normal_vec) # 归一化
-
-            case "TranslationCirV":
-                args = cast(TranslationCirVArgs, self.args)
-                self.center = args.circle.center + args.vector.vec
-                self.radius = args.circle.radius
-                self.normal = args.circle.normal # 继承原圆法向量
-
-            case "InverseCirCir":
-                args = cast(InverseCirCirArgs, self.args)
-                self.center, self.radius, self.normal = inverse_circle( # 修改
-                    args.circle.center, args.circle.radius, args.circle.normal, # 修改
-                    args.base_circle.center, args.base_circle.radius, args.base_circle.normal # 修改
-                )
-
-            case "InscribePPP":
-                args = cast(InscribePPPArgs, self.args)
-                self.radius, self.center = inscribed(args.point1.coord, args.point2.coord, args.point3.coord)
-                A, B, C = plane_get_ABCD(args.point1.coord, args.point2.coord, args.point3.coord)
-                normal_vec = np.array([A, B, C])
-                self.normal = normal_vec / np.linalg.norm(normal_vec) # 归一化
-
-            case _:
-                raise NotImplementedError(f"Invalid constructing method: {self.construct_type}")
+    derived_attrs = ("area", "circumference")
 
+    def derive(self):
+        """计算圆面积与周长"""
         self.area = np.pi * self.radius ** 2
         self.circumference = 2 * np.pi * self.radius
+
+    def _store_normal(self, normal):
+        """
+        将归一化的法向量写入输出数组
+
+        - `normal`: 法向量，为 None 时使用 XY 平面法向量
+        """
+        if normal is None:
+            self._store("normal", _XY_NORMAL)
+            return
+        buffer = self._store("normal", normal)
+        buffer /= np.linalg.norm(buffer) # 归一化
+
+# 各构造方式的计算函数
+
+@CircleAdapter.register("CNR")
+def _cnr(adapter: CircleAdapter, args: CNRArgs):
+    adapter._store("center", args.center.coord)
+    adapter.radius = args.radius
+    adapter._store_normal(args.normal.vec)
+
+@CircleAdapter.register("PR")
+def _pr(adapter: CircleAdapter, args: PRArgs):
+    adapter._store("center", args.center.coord)
+    adapter.radius = args.radius
+    adapter._store_normal(args.normal.vec if args.normal else None)
+
+@CircleAdapter.register("PP")
+def _pp(adapter: CircleAdapter, args: PPArgs):
+    adapter._store("center", args.center.coord)
+    adapter.radius = np.linalg.norm(args.point.coord - args.center.coord) # type: ignore
+    adapter._store_normal(args.normal.vec if args.normal else None)
+
+@CircleAdapter.register("L")
+def _l(adapter: CircleAdapter, args: LArgs):
+    adapter._store("center", args.radius_segment.start)
+    adapter.radius = args.radius_segment.length
+    adapter._store_normal(args.normal.vec if args.normal else None)
+
+@CircleAdapter.register("PPP")
+def _ppp(adapter: CircleAdapter, args: PPPArgs):
+    radius, center = circumcenter(
+        args.point1.coord, args.point2.coord, args.point3.coord
+    )
+    A, B, C = plane_get_ABCD(args.point1.coord, args.point2.coord, args.point3.coord)
+    adapter.radius = radius
+    adapter._take("center", center)
+    adapter._store_normal((A, B, C))
+
+@CircleAdapter.register("TranslationCirV")
+def _translation_cirv(adapter: CircleAdapter, args: TranslationCirVArgs):
+    np.add(args.circle.center, args.vector.vec, out=adapter._output("center", args.circle.center))
+    adapter.radius = args.circle.radius
+    adapter._store("normal", args.circle.normal) # 继承原圆法向量
+
+@CircleAdapter.register("InverseCirCir")
+def _inverse_circir(adapter: CircleAdapter, args: InverseCirCirArgs):
+    center, adapter.radius, normal = inverse_circle(
+        args.circle.center, args.circle.radius, args.circle.normal,
+        args.base_circle.center, args.base_circle.radius, args.base_circle.normal
+    )
+    adapter._take("center", center)
+    # 反演圆的法向量即原圆的法向量，需要复制
+    adapter._store("normal", normal)
+
+@CircleAdapter.register("InscribePPP")
+def _inscribe_ppp(adapter: CircleAdapter, args: InscribePPPArgs):
+    radius, center = inscribed(args.point1.coord, args.point2.coord, args.point3.coord)
+    A, B, C = plane_get_ABCD(args.point1.coord, args.point2.coord, args.point3.coord)
+    adapter.radius = radius
+    adapter._take("center", center)
+    adapter._store_normal((A, B, C))
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pydantic import Field, model_validator
+from pydantic import Field
 from typing import TYPE_CHECKING, List, Any, Optional
 import numpy as np
 
@@ -24,15 +24,6 @@ class Circle(BaseGeometry):
 
     args: CircleConstructArgs = Field(discriminator='construct_type', description="圆构造参数")
 
-    @model_validator(mode='before')
-    @classmethod
-    def set_adapter_before_validation(cls, data: Any) -> Any:
-        """在验证前设置 adapter 字段"""
-        if isinstance(data, dict) and 'args' in data:
-            # 假设 args 已经是 Pydantic 模型或可以被 CircleAdapter 接受
-            data['adapter'] = CircleAdapter(args=data['args'])
-        return data
-
     @property
     def construct_type(self) -> CircleConstructType:
         return self.args.construct_type
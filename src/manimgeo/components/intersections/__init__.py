@@ -0,0 +1,7 @@
+"""
+Intersections 类，表示两个几何对象的全部交点
+"""
+
+from .intersections import Intersections
+from .adapter import IntersectionsAdapter
+from .args import IntersectionsConstructArgsList
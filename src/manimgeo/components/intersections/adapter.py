@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from pydantic import Field
+import numpy as np
+
+from ...math import (
+    intersection_line_line,
+    intersection_line_circle,
+    intersection_circle_circle,
+    track_roots,
+)
+from ..base import GeometryAdapter
+from .args import *
+
+# 跟踪交点时的槽位数量，两个几何对象至多有两个交点
+TRACK_SLOTS = 2
+
+class IntersectionsAdapter(GeometryAdapter[IntersectionsConstructArgs]):
+    result_points: np.ndarray = Field(default=np.empty((0, 3)), description="计算交点坐标", init=False)
+    num_results: int = Field(default=0, description="计算交点数量", init=False)
+
+    def __call__(self):
+        """根据 self.args 执行具体计算，每次更新仅求解一次"""
+        previous = self.result_points
+        super().__call__()
+
+        if self.args.track:
+            # 按上一次的交点位置分配槽位，空槽位为 NaN
+            self.result_points = track_roots(previous, self.result_points, TRACK_SLOTS)
+            self.num_results = int((~np.isnan(self.result_points[:, 0])).sum())
+        else:
+            self.num_results = len(self.result_points)
+
+
+# 各构造方式的计算函数
+
+@IntersectionsAdapter.register("LL")
+def _ll(adapter: IntersectionsAdapter, args: LLArgs):
+    result = intersection_line_line(
+        args.line1.start, args.line1.end,
+        args.line2.start, args.line2.end,
+        args.line1.line_type, args.line2.line_type,
+        args.as_infinity
+    )
+    adapter.result_points = np.empty((0, 3)) if result is None else result[None]
+
+@IntersectionsAdapter.register("LCir")
+def _lcir(adapter: IntersectionsAdapter, args: LCirArgs):
+    adapter.result_points = intersection_line_circle(
+        args.line.start, args.line.end,
+        args.circle.center, args.circle.radius, args.circle.normal,
+        args.line.line_type, args.as_infinity
+    )
+
+@IntersectionsAdapter.register("CirCir")
+def _circir(adapter: IntersectionsAdapter, args: CirCirArgs):
+    adapter.result_points = intersection_circle_circle(
+        args.circle1.center, args.circle1.radius, args.circle1.normal,
+        args.circle2.center, args.circle2.radius, args.circle2.normal
+    )
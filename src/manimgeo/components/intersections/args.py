@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from ..base import ArgsModelBase
+from typing import TYPE_CHECKING, Union, Literal
+
+if TYPE_CHECKING:
+    from ..circle import Circle
+    from ..line import Line
+
+class LLArgs(ArgsModelBase):
+    construct_type: Literal["LL"] = "LL"
+    line1: Line
+    line2: Line
+    as_infinity: bool = False
+    track: bool = False
+
+class LCirArgs(ArgsModelBase):
+    construct_type: Literal["LCir"] = "LCir"
+    line: Line
+    circle: Circle
+    as_infinity: bool = False
+    track: bool = False
+
+class CirCirArgs(ArgsModelBase):
+    construct_type: Literal["CirCir"] = "CirCir"
+    circle1: Circle
+    circle2: Circle
+    track: bool = False
+
+# 所有参数模型的联合类型
+type IntersectionsConstructArgs = Union[
+    LLArgs, LCirArgs, CirCirArgs
+]
+
+IntersectionsConstructArgsList = [
+    LLArgs, LCirArgs, CirCirArgs
+]
+
+type IntersectionsConstructType = Literal[
+    "LL", "LCir", "CirCir"
+]
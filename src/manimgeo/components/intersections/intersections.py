@@ -0,0 +1,118 @@
+"""
+Intersections 交点类
+"""
+
+from __future__ import annotations
+
+from pydantic import Field, PrivateAttr
+from typing import TYPE_CHECKING, Any, Dict, List
+import numpy as np
+
+from ..base import BaseGeometry
+from .adapter import IntersectionsAdapter
+from .args import *
+
+if TYPE_CHECKING:
+    from ..circle import Circle
+    from ..line import Line
+    from ..point import Point
+
+class Intersections(BaseGeometry):
+    """
+    两个几何对象的全部交点
+
+    每次更新只求解一次，各个交点通过 `root` 得到的子节点 `Point` 读取共享的求解结果：
+
+    ```python
+    intersections = Intersections.CirCir(circle1, circle2)
+    P, Q = intersections.root(0), intersections.root(1)
+    ```
+
+    默认情况下交点按求解顺序编号，几何对象运动时编号可能互换。构造时传入 `track=True` 可跟踪交点：
+    每次更新将交点分配到与上一次位置最近的槽位，此时 `result_points` 固定为两行，不存在的交点为 NaN
+    """
+    attrs: List[str] = Field(default=["result_points", "num_results"], description="交点属性列表", init=False)
+    result_points: np.ndarray = Field(default=np.empty((0, 3)), description="形如 (num_results, 3) 的交点坐标，跟踪交点时形如 (2, 3)", init=False)
+    num_results: int = Field(default=0, description="交点数量", init=False)
+    args: IntersectionsConstructArgs = Field(discriminator='construct_type', description="交点构造参数")
+
+    # 已创建的交点子节点
+    _roots: Dict[int, Point] = PrivateAttr(default_factory=dict)
+
+    @property
+    def construct_type(self) -> IntersectionsConstructType:
+        return self.args.construct_type
+
+    def model_post_init(self, __context: Any):
+        """模型初始化后，更新名字并添加依赖关系"""
+        self.adapter = IntersectionsAdapter(args=self.args)
+        self.name = self.get_name(self.name)
+        # 添加依赖关系
+        self._extract_dependencies_from_args(self.args)
+        self.update() # 首次计算
+
+    def __len__(self) -> int:
+        return self.num_results
+
+    def root(self, index: int, name: str = "") -> Point:
+        """
+        获取第 `index` 个交点，同一下标总是返回同一个 `Point`
+
+        第 `index` 个交点不存在时不抛出异常，返回的点被标记为错误（`on_error`），
+        并在之后的更新中交点出现时恢复
+
+        - `index`: 交点下标
+        - `name`: 首次创建时使用的名称
+        """
+        root = self._roots.get(index)
+        if root is None:
+            from ..point import Point
+            root = Point.Root(self, index, name)
+            self._roots[index] = root
+        return root
+
+    # 构造方法
+
+    @classmethod
+    def LL(cls, line1: Line, line2: Line, as_infinity: bool = False, name: str = "", track: bool = False) -> Intersections:
+        """
+        构造两线交点
+
+        - `line1`: 第一条线
+        - `line2`: 第二条线
+        - `as_infinity`: 是否视为无限长直线
+        - `track`: 是否跟踪交点，保持连续运动时交点编号不变
+        """
+        return Intersections(
+            name=name,
+            args=LLArgs(line1=line1, line2=line2, as_infinity=as_infinity, track=track)
+        )
+
+    @classmethod
+    def LCir(cls, line: Line, circle: Circle, as_infinity: bool = False, name: str = "", track: bool = False) -> Intersections:
+        """
+        构造线与圆的交点
+
+        - `line`: 线
+        - `circle`: 圆
+        - `as_infinity`: 是否将线视为无限长直线
+        - `track`: 是否跟踪交点，保持连续运动时交点编号不变
+        """
+        return Intersections(
+            name=name,
+            args=LCirArgs(line=line, circle=circle, as_infinity=as_infinity, track=track)
+        )
+
+    @classmethod
+    def CirCir(cls, circle1: Circle, circle2: Circle, name: str = "", track: bool = False) -> Intersections:
+        """
+        构造两圆交点
+
+        - `circle1`: 第一个圆
+        - `circle2`: 第二个圆
+        - `track`: 是否跟踪交点，保持连续运动时交点编号不变
+        """
+        return Intersections(
+            name=name,
+            args=CirCirArgs(circle1=circle1, circle2=circle2, track=track)
+        )
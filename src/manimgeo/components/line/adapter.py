@@ -7,58 +7,63 @@ from ...math import (
     vertical_line_unit_direction,
 )
 from pydantic import Field
-from typing import cast
 import numpy as np
 
 from ..base import GeometryAdapter
 from .args import *
 
 class LineAdapter(GeometryAdapter[LineConstructArgs]): # 继承 GeometryAdapter 并指定参数模型类型
-    start: np.ndarray = Field(default=np.zeros(3), description="计算线首坐标", init=False)
-    end: np.ndarray = Field(default=np.zeros(3), description="计算线尾坐标", init=False)
+    start: np.ndarray = Field(default_factory=lambda: np.zeros(3), description="计算线首坐标", init=False)
+    end: np.ndarray = Field(default_factory=lambda: np.zeros(3), description="计算线尾坐标", init=False)
     length: Number = Field(default=0.0, description="计算线长度", init=False)
 
-    unit_direction: np.ndarray = Field(default=np.zeros(3), description="计算线单位方向向量", init=False)
+    unit_direction: np.ndarray = Field(default_factory=lambda: np.zeros(3), description="计算线单位方向向量", init=False)
 
-    def __call__(self):
-        """根据 self.args 执行具体计算"""
+    derived_attrs = ("length", "unit_direction")
 
-        match self.construct_type:
-            case "PP":
-                args = cast(PPArgs, self.args)
-                self.start = args.point1.coord
-                self.end = args.point2.coord
+    def derive(self):
+        """计算线长度与单位方向向量"""
+        # 单位方向向量数组先存放方向向量，再原地归一化
+        direction = self._output("unit_direction", self.start)
+        np.subtract(self.end, self.start, out=direction)
+        self.length = float(np.linalg.norm(direction))
+        if not close(self.length, 0):
+            direction /= self.length
+        else:
+            direction.fill(0)
 
-            case "PV":
-                args = cast(PVArgs, self.args)
-                self.start = args.start.coord
-                self.end = args.start.coord + args.vector.vec
 
-            case "TranslationLV":
-                args = cast(TranslationLVArgs, self.args)
-                self.start = args.line.start + args.vector.vec
-                self.end = args.line.end + args.vector.vec
+# 各构造方式的计算函数
 
-            case "VerticalPL":
-                args = cast(VerticalPLArgs, self.args)
-                if not is_point_on_line(args.point.coord, args.line.start, args.line.end):
-                    self.start = vertical_point_to_line(args.point.coord, args.line.start, args.line.end)
-                    self.end = args.point.coord
-                else:
-                    direction = vertical_line_unit_direction(args.line.start, args.line.end)
-                    self.start = args.point.coord
-                    self.end = self.start + direction
+@LineAdapter.register("PP")
+def _pp(adapter: LineAdapter, args: PPArgs):
+    adapter._store("start", args.point1.coord)
+    adapter._store("end", args.point2.coord)
 
-            case "ParallelPL":
-                args = cast(ParallelPLArgs, self.args)
-                self.start = args.point.coord
-                self.end = args.point.coord + args.line.unit_direction * args.distance
+@LineAdapter.register("PV")
+def _pv(adapter: LineAdapter, args: PVArgs):
+    adapter._store("start", args.start.coord)
+    np.add(args.start.coord, args.vector.vec, out=adapter._output("end", args.start.coord))
 
-            case _:
-                raise NotImplementedError(f"不支持的直线构造方法: {self.construct_type}")
+@LineAdapter.register("TranslationLV")
+def _translation_lv(adapter: LineAdapter, args: TranslationLVArgs):
+    np.add(args.line.start, args.vector.vec, out=adapter._output("start", args.line.start))
+    np.add(args.line.end, args.vector.vec, out=adapter._output("end", args.line.end))
 
-        self.length = float(np.linalg.norm(self.end - self.start))
-        if not close(self.length, 0):
-            self.unit_direction = (self.end - self.start) / self.length
-        else:
-            self.unit_direction = np.zeros(3)
\ No newline at end of file
+@LineAdapter.register("VerticalPL")
+def _vertical_pl(adapter: LineAdapter, args: VerticalPLArgs):
+    if not is_point_on_line(args.point.coord, args.line.start, args.line.end):
+        foot = vertical_point_to_line(args.point.coord, args.line.start, args.line.end)
+        adapter._take("start", foot)
+        adapter._store("end", args.point.coord)
+    else:
+        direction = vertical_line_unit_direction(args.line.start, args.line.end)
+        start = adapter._store("start", args.point.coord)
+        np.add(start, direction, out=adapter._output("end", start))
+
+@LineAdapter.register("ParallelPL")
+def _parallel_pl(adapter: LineAdapter, args: ParallelPLArgs):
+    start = adapter._store("start", args.point.coord)
+    end = adapter._output("end", start)
+    np.multiply(args.line.unit_direction, args.distance, out=end)
+    end += start
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pydantic import Field, model_validator
+from pydantic import Field
 from typing import TYPE_CHECKING, List, Any, TypeVar, Type
 import numpy as np
 
@@ -28,16 +28,7 @@ class Line(BaseGeometry):
     unit_direction: np.ndarray = Field(default=np.zeros(2), description="线单位方向向量", init=False)
 
     args: LineConstructArgs = Field(discriminator='construct_type', description="线构造参数")
-    adapter: LineAdapter = Field(init=False) # adapter 初始化将在 model_post_init 中进行
-
-    @model_validator(mode='before')
-    @classmethod
-    def set_adapter_before_validation(cls, data: Any) -> Any:
-        """在验证前设置 adapter 字段"""
-        if isinstance(data, dict) and 'args' in data:
-            # 假设 args 已经是 Pydantic 模型或可以被 LineAdapter 接受
-            data['adapter'] = LineAdapter(args=data['args'])
-        return data
+    adapter: LineAdapter = Field(default=None, init=False) # adapter 初始化将在 model_post_init 中进行
 
     line_type: Literal["LineSegment", "Ray", "InfinityLine"] = Field(description="线类型，子类会尝试覆盖")
 
@@ -81,6 +72,21 @@ class Line(BaseGeometry):
             args=PPArgs(point1=start, point2=end),
         ) # type: ignore[call-arg]
     
+    @classmethod
+    def PPMany(cls, starts: Any, ends: Any) -> Any:
+        """
+        批量起始点构造线，返回 `manimgeo.program.GeometryArray`
+
+        - `starts`: 起点，`GeometryArray`、单个点或形如 (N, 3) 的坐标
+        - `ends`: 终点，同 `starts`
+        """
+        from ...program.bulk import GeometryArray
+        def as_points(points: Any) -> Any:
+            if isinstance(points, (GeometryArray, BaseGeometry)):
+                return points
+            return GeometryArray.free(np.atleast_2d(points))
+        return cls.Many("PP", point1=as_points(starts), point2=as_points(ends))
+
     @classmethod
     def PV(cls: Type[_LineT], start: Point, vector: Vector, name: str = "") -> _LineT:
         """
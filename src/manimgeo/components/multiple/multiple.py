@@ -4,7 +4,7 @@ MultipleComponents 多对象类
 
 from __future__ import annotations
 
-from pydantic import Field, model_validator
+from pydantic import Field
 from typing import TYPE_CHECKING, Any, List, Callable, Sequence
 
 from ..base import BaseGeometry
@@ -19,14 +19,6 @@ class MultipleComponents(BaseGeometry):
     geometry_objects: List[BaseGeometry] = Field(default_factory=list, description="多个几何对象", init=False)
     args: MultipleConstructArgs = Field(discriminator='construct_type', description="多几何对象构造参数")
 
-    @model_validator(mode='before')
-    @classmethod
-    def set_adapter_before_validation(cls, data: Any) -> Any:
-        """在验证前设置 adapter 字段"""
-        if isinstance(data, dict) and 'args' in data:
-            data['adapter'] = MultipleAdapter(args=data['args'])
-        return data
-    
     @property
     def construct_type(self) -> MultipleConstructType:
         return self.args.construct_type
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from pydantic import Field
-from typing import cast
+from pydantic import Field, PrivateAttr
+from typing import Optional
 import numpy as np
 
 from ...math import (
@@ -16,114 +16,141 @@ from ...math import (
 )
 from ..base import GeometryAdapter
 from .args import *
+from .intersections import PointIntersections
+
+# 默认旋转轴
+_Z_AXIS = np.array([0.0, 0.0, 1.0])
 
 class PointAdapter(GeometryAdapter[PointConstructArgs]):
     coord: np.ndarray = Field(default_factory=lambda: np.zeros(3), description="计算点坐标", init=False)
-    
-    def __call__(self):
-        """根据 self.args 执行具体计算"""
-
-        match self.construct_type:
-            case "Free":
-                args = cast(FreeArgs, self.args)
-                self.coord = args.coord
-
-            case "Constraint":
-                args = cast(ConstraintArgs, self.args)
-                self.coord = args.coord
-
-            case "MidPP":
-                args = cast(MidPPArgs, self.args)
-                self.coord = (args.point1.coord + args.point2.coord) / 2
-
-            case "MidL":
-                args = cast(MidLArgs, self.args)
-                self.coord = (args.line.start + args.line.end) / 2
-
-            case "ExtensionPP":
-                args = cast(ExtensionPPArgs, self.args)
-                self.coord = args.start.coord + args.factor * (args.through.coord - args.start.coord)
-
-            case "AxisymmetricPL":
-                args = cast(AxisymmetricPLArgs, self.args)
-                self.coord = axisymmetric_point(args.point.coord, args.line.start, args.line.end)
-
-            case "VerticalPL":
-                args = cast(VerticalPLArgs, self.args)
-                self.coord = vertical_point_to_line(args.point.coord, args.line.start, args.line.end)
-
-            case "ParallelPL":
-                args = cast(ParallelPLArgs, self.args)
-                self.coord = args.point.coord + args.distance * args.line.unit_direction
-
-            case "InversionPCir":
-                args = cast(InversionPCirArgs, self.args)
-                self.coord = inversion_point(args.point.coord, args.circle.center, args.circle.radius)
-
-            case "IntersectionLL":
-                args = cast(IntersectionLLArgs, self.args)
-                result = intersection_line_line(
-                    args.line1.start, args.line1.end,
-                    args.line2.start, args.line2.end,
-                    args.line1.line_type, args.line2.line_type,
-                    args.regard_infinite
-                )
-                if result is None:
-                    raise ValueError(f"两线无交点: {args.line1.name}, {args.line2.name}")
-                else:
-                    self.coord = result
-
-            case "Intersections":
-                from .intersections import PointIntersections
-                args = cast(IntersectionsArgs, self.args)
-                result = PointIntersections(int_type=args.int_type)()
-                result_num = result.num_results
-                result_points = result.result_points
-                
-                if result_num == 0:
-                    raise ValueError(f"两对象无交点：{args.int_type}")
-                elif result_num > 1:
-                    raise ValueError(f"多于一个交点的求解结果不可以 Point 类导出：{result_num} 个交点")
-                else:
-                    self.coord = result_points[0]
-                
-            case "TranslationPV":
-                args = cast(TranslationPVArgs, self.args)
-                self.coord = args.point.coord + args.vector.vec
-
-            case "CentroidPPP":
-                args = cast(CentroidPPPArgs, self.args)
-                self.coord = (args.point1.coord + args.point2.coord + args.point3.coord) / 3
-
-            case "CircumcenterPPP":
-                args = cast(CircumcenterPPPArgs, self.args)
-                _, self.coord = circumcenter(
-                    args.point1.coord, args.point2.coord, args.point3.coord
-                )
-
-            case "IncenterPPP":
-                args = cast(IncenterPPPArgs, self.args)
-                _, self.coord = inscribed(
-                    args.point1.coord, args.point2.coord, args.point3.coord
-                )
-
-            case "OrthocenterPPP":
-                args = cast(OrthocenterPPPArgs, self.args)
-                self.coord = orthocenter(
-                    args.point1.coord, args.point2.coord, args.point3.coord
-                )
-
-            case "Cir":
-                args = cast(CirArgs, self.args)
-                self.coord = args.circle.center
-
-            case "RotatePPA":
-                args = cast(RotatePPAArgs, self.args)
-                angle_num = args.angle.angle if args.angle.turn == 'Counterclockwise' else (2 * np.pi - args.angle.angle)
-                axis = args.axis.vec if args.axis is not None else np.array([0, 0, 1])
-                self.coord = point_3p_countclockwise(
-                    args.point.coord, args.center.coord, angle_num, axis
-                )
-
-            case _:
-                raise NotImplementedError(f"Invalid construct type: {self.construct_type}")
+
+    # 复用的交点求解器
+    _solver: Optional[PointIntersections] = PrivateAttr(default=None)
+
+# 各构造方式的计算函数，新计算的数组经 `_take` 直接使用，与上游共享内存的值经 `_store` 复制
+
+@PointAdapter.register("Free")
+def _free(adapter: PointAdapter, args: FreeArgs):
+    adapter._store("coord", args.coord)
+
+@PointAdapter.register("Constraint")
+def _constraint(adapter: PointAdapter, args: ConstraintArgs):
+    adapter._store("coord", args.coord)
+
+@PointAdapter.register("MidPP")
+def _mid_pp(adapter: PointAdapter, args: MidPPArgs):
+    coord = adapter._output("coord", args.point1.coord)
+    np.add(args.point1.coord, args.point2.coord, out=coord)
+    coord /= 2
+
+@PointAdapter.register("MidL")
+def _mid_l(adapter: PointAdapter, args: MidLArgs):
+    coord = adapter._output("coord", args.line.start)
+    np.add(args.line.start, args.line.end, out=coord)
+    coord /= 2
+
+@PointAdapter.register("ExtensionPP")
+def _extension_pp(adapter: PointAdapter, args: ExtensionPPArgs):
+    coord = adapter._output("coord", args.start.coord)
+    np.subtract(args.through.coord, args.start.coord, out=coord)
+    coord *= args.factor
+    coord += args.start.coord
+
+@PointAdapter.register("AxisymmetricPL")
+def _axisymmetric_pl(adapter: PointAdapter, args: AxisymmetricPLArgs):
+    adapter._take("coord", axisymmetric_point(args.point.coord, args.line.start, args.line.end))
+
+@PointAdapter.register("VerticalPL")
+def _vertical_pl(adapter: PointAdapter, args: VerticalPLArgs):
+    adapter._take("coord", vertical_point_to_line(args.point.coord, args.line.start, args.line.end))
+
+@PointAdapter.register("ParallelPL")
+def _parallel_pl(adapter: PointAdapter, args: ParallelPLArgs):
+    coord = adapter._output("coord", args.point.coord)
+    np.multiply(args.line.unit_direction, args.distance, out=coord)
+    coord += args.point.coord
+
+@PointAdapter.register("InversionPCir")
+def _inversion_pcir(adapter: PointAdapter, args: InversionPCirArgs):
+    adapter._take("coord", inversion_point(args.point.coord, args.circle.center, args.circle.radius))
+
+@PointAdapter.register("IntersectionLL")
+def _intersection_ll(adapter: PointAdapter, args: IntersectionLLArgs):
+    result = intersection_line_line(
+        args.line1.start, args.line1.end,
+        args.line2.start, args.line2.end,
+        args.line1.line_type, args.line2.line_type,
+        args.regard_infinite
+    )
+    if result is None:
+        raise ValueError(f"两线无交点: {args.line1.name}, {args.line2.name}")
+    else:
+        adapter._take("coord", result)
+
+@PointAdapter.register("Intersections")
+def _intersections(adapter: PointAdapter, args: IntersectionsArgs):
+    # 交点类型不变时复用求解器
+    if adapter._solver is None or adapter._solver.int_type is not args.int_type:
+        adapter._solver = PointIntersections(int_type=args.int_type)
+    result = adapter._solver()
+    result_num = result.num_results
+    result_points = result.result_points
+
+    if result_num == 0:
+        raise ValueError(f"两对象无交点：{args.int_type}")
+    elif result_num > 1:
+        raise ValueError(f"多于一个交点的求解结果不可以 Point 类导出：{result_num} 个交点")
+    else:
+        adapter._take("coord", result_points[0])
+
+@PointAdapter.register("TranslationPV")
+def _translation_pv(adapter: PointAdapter, args: TranslationPVArgs):
+    np.add(args.point.coord, args.vector.vec, out=adapter._output("coord", args.point.coord))
+
+@PointAdapter.register("CentroidPPP")
+def _centroid_ppp(adapter: PointAdapter, args: CentroidPPPArgs):
+    coord = adapter._output("coord", args.point1.coord)
+    np.add(args.point1.coord, args.point2.coord, out=coord)
+    coord += args.point3.coord
+    coord /= 3
+
+@PointAdapter.register("CircumcenterPPP")
+def _circumcenter_ppp(adapter: PointAdapter, args: CircumcenterPPPArgs):
+    _, center = circumcenter(
+        args.point1.coord, args.point2.coord, args.point3.coord
+    )
+    adapter._take("coord", center)
+
+@PointAdapter.register("IncenterPPP")
+def _incenter_ppp(adapter: PointAdapter, args: IncenterPPPArgs):
+    _, center = inscribed(
+        args.point1.coord, args.point2.coord, args.point3.coord
+    )
+    adapter._take("coord", center)
+
+@PointAdapter.register("OrthocenterPPP")
+def _orthocenter_ppp(adapter: PointAdapter, args: OrthocenterPPPArgs):
+    adapter._take("coord", orthocenter(
+        args.point1.coord, args.point2.coord, args.point3.coord
+    ))
+
+@PointAdapter.register("Cir")
+def _cir(adapter: PointAdapter, args: CirArgs):
+    adapter._store("coord", args.circle.center)
+
+@PointAdapter.register("RotatePPA")
+def _rotate_ppa(adapter: PointAdapter, args: RotatePPAArgs):
+    angle_num = args.angle.angle if args.angle.turn == 'Counterclockwise' else (2 * np.pi - args.angle.angle)
+    axis = args.axis.vec if args.axis is not None else _Z_AXIS
+    adapter._take("coord", point_3p_countclockwise(
+        args.point.coord, args.center.coord, angle_num, axis
+    ))
+
+@PointAdapter.register("Root")
+def _root(adapter: PointAdapter, args: RootArgs):
+    # 读取交点节点共享的求解结果
+    points = args.intersections.result_points
+    # 跟踪交点时，不存在的交点为 NaN
+    if args.index >= len(points) or np.isnan(points[args.index, 0]):
+        raise ValueError(f"交点 {args.index} 不存在：共 {args.intersections.num_results} 个交点")
+    adapter._store("coord", points[args.index])
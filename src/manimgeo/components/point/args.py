@@ -15,6 +15,7 @@ if TYPE_CHECKING:
     from ..circle import Circle
     from ..line import Line, LineSegment
     from ..vector import Vector
+    from ..intersections import Intersections
     from .point import Point
 
 class FreeArgs(ArgsModelBase):
@@ -124,25 +125,30 @@ class RotatePPAArgs(ArgsModelBase):
     angle: Angle
     axis: Vector | None = None
 
+class RootArgs(ArgsModelBase):
+    construct_type: Literal["Root"] = "Root"
+    intersections: Intersections
+    index: int
+
 # 所有参数模型的联合类型
 
 type PointConstructArgs = Union[
     FreeArgs, ConstraintArgs, MidPPArgs, MidLArgs, ExtensionPPArgs,
     AxisymmetricPLArgs, VerticalPLArgs, ParallelPLArgs, InversionPCirArgs,
     IntersectionLLArgs, IntersectionsArgs, TranslationPVArgs, CentroidPPPArgs, CircumcenterPPPArgs,
-    IncenterPPPArgs, OrthocenterPPPArgs, CirArgs, RotatePPAArgs
+    IncenterPPPArgs, OrthocenterPPPArgs, CirArgs, RotatePPAArgs, RootArgs
 ]
 
 PointConstructArgsList = [
     FreeArgs, ConstraintArgs, MidPPArgs, MidLArgs, ExtensionPPArgs,
     AxisymmetricPLArgs, VerticalPLArgs, ParallelPLArgs, InversionPCirArgs,
     IntersectionLLArgs, IntersectionsArgs, TranslationPVArgs, CentroidPPPArgs, CircumcenterPPPArgs,
-    IncenterPPPArgs, OrthocenterPPPArgs, CirArgs, RotatePPAArgs
+    IncenterPPPArgs, OrthocenterPPPArgs, CirArgs, RotatePPAArgs, RootArgs
 ]
 
 type PointConstructType = Literal[
     "Free", "Constraint", "MidPP", "MidL", "ExtensionPP",
     "AxisymmetricPL", "VerticalPL", "ParallelPL", "InversionPCir",
     "IntersectionLL", "Intersections", "TranslationPV", "CentroidPPP", "CircumcenterPPP",
-    "IncenterPPP", "OrthocenterPPP", "Cir", "RotatePPA"
+    "IncenterPPP", "OrthocenterPPP", "Cir", "RotatePPA", "Root"
 ]
\ No newline at end of file
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import numpy as np
-from pydantic import Field
-from ..base import BaseModelN
-from typing import TYPE_CHECKING, Union, List, Callable, cast
+from pydantic import Field, PrivateAttr
+from ..base import BaseModelN, is_output_reuse
+from typing import TYPE_CHECKING, Union, List, Callable, Optional, cast
 from ...math import (
     intersection_line_line,
+    intersection_line_circle,
+    intersection_circle_circle,
 )
 
 from ..line import LineSegment, Ray, InfinityLine
@@ -65,9 +67,14 @@ class IntResults(BaseModelN):
 class PointIntersections(BaseModelN):
     int_type: ConcreteIntType
 
+    # 输出数组复用模式下复用的求解结果
+    _results: Optional[IntResults] = PrivateAttr(default=None)
+
     def __call__(self) -> IntResults:
         """
         计算交点
+
+        输出数组复用模式下（见 `set_output_reuse`）每次计算复用同一个结果对象，需要保留上一次结果时应先调用 `filt` 或复制
         """
 
         match self.int_type:
@@ -80,26 +87,37 @@ class PointIntersections(BaseModelN):
                     as_infinty=self.int_type.as_infinity
                 )
 
-                if result is None:
-                    return IntResults(
-                        int_type=self.int_type,
-                        num_results=0,
-                        result_points=[]
-                    )
-                else:
-                    return IntResults(
-                        int_type=self.int_type,
-                        num_results=1,
-                        result_points=[result],
-                    )
+                result_points = [] if result is None else [result]
 
             case LCir():
-                # TODO
-                raise NotImplementedError
-            
+                self.int_type = cast(LCir, self.int_type)
+                result_points = list(intersection_line_circle(
+                    self.int_type.line.start, self.int_type.line.end,
+                    self.int_type.circle.center, self.int_type.circle.radius, self.int_type.circle.normal,
+                    self.int_type.line.line_type,
+                    as_infinty=self.int_type.as_infinity
+                ))
+
             case CirCir():
-                # TODO
-                raise NotImplementedError
-            
+                self.int_type = cast(CirCir, self.int_type)
+                result_points = list(intersection_circle_circle(
+                    self.int_type.circle1.center, self.int_type.circle1.radius, self.int_type.circle1.normal,
+                    self.int_type.circle2.center, self.int_type.circle2.radius, self.int_type.circle2.normal
+                ))
+
             case _:
                 raise ValueError(f"未知的交点类型: {self.int_type.__class__}")
+
+        results = self._results
+        if results is None or not is_output_reuse():
+            results = IntResults(
+                int_type=self.int_type,
+                num_results=len(result_points),
+                result_points=result_points
+            )
+            if is_output_reuse():
+                self._results = results
+        else:
+            results.num_results = len(result_points)
+            results.result_points = result_points
+        return results
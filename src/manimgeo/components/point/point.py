@@ -4,7 +4,7 @@ Point 几何类
 
 from __future__ import annotations
 
-from pydantic import Field, model_validator
+from pydantic import Field
 from typing import TYPE_CHECKING, Any, List
 import numpy as np
 
@@ -17,6 +17,7 @@ if TYPE_CHECKING:
     from ..line import Line, LineSegment, Ray, InfinityLine
     from ..vector import Vector
     from ..circle import Circle
+    from ..intersections import Intersections
     type ConcreteLine = Union[LineSegment, Ray, InfinityLine]
 
 from .intersections import (
@@ -31,15 +32,6 @@ class Point(BaseGeometry):
     coord: np.ndarray = Field(default=np.zeros(2), description="点坐标", init=False)
     args: PointConstructArgs = Field(discriminator='construct_type', description="点构造参数")
 
-    @model_validator(mode='before')
-    @classmethod
-    def set_adapter_before_validation(cls, data: Any) -> Any:
-        """在验证前设置 adapter 字段"""
-        if isinstance(data, dict) and 'args' in data:
-            # 假设 args 已经是 Pydantic 模型或可以被 PointAdapter 接受
-            data['adapter'] = PointAdapter(args=data['args'])
-        return data
-    
     @property
     def construct_type(self) -> PointConstructType:
         return self.args.construct_type
@@ -51,7 +43,12 @@ class Point(BaseGeometry):
         self.name = self.get_name(self.name)
         # 添加依赖关系
         self._extract_dependencies_from_args(self.args)
-        self.update() # 首次计算
+        try:
+            self.update() # 首次计算
+        except Exception:
+            # 交点可能暂时不存在（如两圆相离），此时交点已被标记为错误，待交点出现后自动恢复
+            if self.construct_type != "Root":
+                raise
     
     def set_coord(self, coord: np.ndarray):
         """
@@ -78,6 +75,15 @@ class Point(BaseGeometry):
             args=FreeArgs(coord=coord)
         )
     
+    @classmethod
+    def FreeMany(cls, coords: np.ndarray) -> Any:
+        """
+        批量构造自由点，返回 `manimgeo.program.GeometryArray`
+
+        `coords`: 形如 (N, 3) 的点坐标
+        """
+        return cls.Many("Free", coord=coords)
+
     @classmethod
     def Constraint(cls, coord: np.ndarray, name: str = "") -> Point:
         """
@@ -290,4 +296,19 @@ class Point(BaseGeometry):
         return Point(
             name=name,
             args=RotatePPAArgs(point=point, center=center, angle=angle, axis=axis)
+        )
+
+    @classmethod
+    def Root(cls, intersections: Intersections, index: int, name: str = "") -> Point:
+        """
+        构造交点节点的第 `index` 个交点，通常经由 `Intersections.root` 调用
+
+        第 `index` 个交点不存在时不抛出异常，返回的点被标记为错误
+
+        `intersections`: 交点节点  
+        `index`: 交点下标
+        """
+        return Point(
+            name=name,
+            args=RootArgs(intersections=intersections, index=index)
         )
\ No newline at end of file
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from pydantic import Field
-from typing import cast
 import numpy as np
 
 from ...math import (
@@ -12,52 +11,53 @@ from ..base import GeometryAdapter
 from .args import *
 
 class VectorAdapter(GeometryAdapter[VectorConstructArgs]): # 继承 GeometryAdapter 并指定参数模型类型
-    vec: np.ndarray = Field(default=np.zeros(3), description="计算向量坐标", init=False)
+    vec: np.ndarray = Field(default_factory=lambda: np.zeros(3), description="计算向量坐标", init=False)
     norm: Number = Field(default=0.0, description="计算向量模长", init=False)
-    unit_direction: np.ndarray = Field(default=np.zeros(3), description="计算向量单位方向", init=False)
+    unit_direction: np.ndarray = Field(default_factory=lambda: np.zeros(3), description="计算向量单位方向", init=False)
 
-    def __call__(self):
-        """根据 self.args 执行具体计算"""
+    derived_attrs = ("norm", "unit_direction")
 
-        match self.construct_type:
-            case "PP":
-                args = cast(PPArgs, self.args)
-                self.vec = args.end.coord - args.start.coord
+    def derive(self):
+        """计算向量模长与单位方向"""
+        self.norm = float(np.linalg.norm(self.vec))
+        direction = self._output("unit_direction", self.vec)
+        # 避免除以零
+        if not close(self.norm, 0):
+            np.divide(self.vec, self.norm, out=direction)
+        else:
+            direction.fill(0)
 
-            case "L":
-                args = cast(LArgs, self.args)
-                self.vec = args.line.end - args.line.start
 
-            case "N":
-                args = cast(NArgs, self.args)
-                self.vec = args.vec.copy()
+# 各构造方式的计算函数
 
-            case "NPP":
-                args = cast(NPPArgs, self.args)
-                self.vec = args.end - args.start
+@VectorAdapter.register("PP")
+def _pp(adapter: VectorAdapter, args: PPArgs):
+    np.subtract(args.end.coord, args.start.coord, out=adapter._output("vec", args.start.coord))
 
-            case "NNormDirection":
-                args = cast(NNormDirectionArgs, self.args)
-                self.vec = args.norm * unit_direction_vector(np.zeros_like(args.direction), args.direction)
+@VectorAdapter.register("L")
+def _l(adapter: VectorAdapter, args: LArgs):
+    np.subtract(args.line.end, args.line.start, out=adapter._output("vec", args.line.start))
 
-            case "AddVV":
-                args = cast(AddVVArgs, self.args)
-                self.vec = args.vec1.vec + args.vec2.vec
+@VectorAdapter.register("N")
+def _n(adapter: VectorAdapter, args: NArgs):
+    adapter._store("vec", args.vec)
 
-            case "SubVV":
-                args = cast(SubVVArgs, self.args)
-                self.vec = args.vec1.vec - args.vec2.vec
+@VectorAdapter.register("NPP")
+def _npp(adapter: VectorAdapter, args: NPPArgs):
+    adapter._take("vec", np.subtract(args.end, args.start))
 
-            case "MulNV":
-                args = cast(MulNVArgs, self.args)
-                self.vec = args.factor * args.vec.vec
+@VectorAdapter.register("NNormDirection")
+def _nnorm_direction(adapter: VectorAdapter, args: NNormDirectionArgs):
+    adapter._take("vec", args.norm * unit_direction_vector(np.zeros_like(args.direction), args.direction))
 
-            case _:
-                raise NotImplementedError(f"Invalid constructing method: {self.construct_type}")
+@VectorAdapter.register("AddVV")
+def _add_vv(adapter: VectorAdapter, args: AddVVArgs):
+    np.add(args.vec1.vec, args.vec2.vec, out=adapter._output("vec", args.vec1.vec))
 
-        self.norm = float(np.linalg.norm(self.vec))
-        # 避免除以零
-        if not close(self.norm, 0):
-            self.unit_direction = self.vec / self.norm
-        else:
-            self.unit_direction = np.zeros(3)
+@VectorAdapter.register("SubVV")
+def _sub_vv(adapter: VectorAdapter, args: SubVVArgs):
+    np.subtract(args.vec1.vec, args.vec2.vec, out=adapter._output("vec", args.vec1.vec))
+
+@VectorAdapter.register("MulNV")
+def _mul_nv(adapter: VectorAdapter, args: MulNVArgs):
+    np.multiply(args.vec.vec, args.factor, out=adapter._output("vec", args.vec.vec))
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pydantic import Field, model_validator
+from pydantic import Field
 from typing import TYPE_CHECKING, List, Any
 import numpy as np
 
@@ -20,15 +20,6 @@ class Vector(BaseGeometry):
 
     args: VectorConstructArgs = Field(discriminator='construct_type', description="向量构造参数")
 
-    @model_validator(mode='before')
-    @classmethod
-    def set_adapter_before_validation(cls, data: Any) -> Any:
-        """在验证前设置 adapter 字段"""
-        if isinstance(data, dict) and 'args' in data:
-            # 假设 args 已经是 Pydantic 模型或可以被 VectorAdapter 接受
-            data['adapter'] = VectorAdapter(args=data['args'])
-        return data
-
     @property
     def construct_type(self) -> VectorConstructType:
         return self.args.construct_type
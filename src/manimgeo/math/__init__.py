@@ -1,24 +1,46 @@
 """
 math 模块实现了具体几何计算相关的函数
+
+每个计算函数都有对应的 `*_batch` 批量版本，接受形如 (N, 3) 的数组并沿批量维度广播计算，
+返回计算结果与形如 (N,) 的有效掩码，退化的行不会抛出异常，而是被标记为无效并以 NaN 填充
+
+参数已知均为 float64 时，可通过 `trusted_math` 跳过 `array2float` 的参数检查与转换
 """
 
 from .angles import (
     angle_3p_countclockwise,
     point_3p_countclockwise,
+    angle_3p_countclockwise_batch,
+    point_3p_countclockwise_batch,
 )
 
 from .base import (
     close,
     array2float,
+    close_batch,
+    array2float_batch,
+    close_many,
+    set_trusted_math,
+    is_trusted_math,
+    trusted_math,
 )
 
 from .circles import (
     inverse_circle,
     inverse_circle_to_line,
+    inverse_circle_batch,
+    inverse_circle_to_line_batch,
 )
 
 from .intersections import (
     intersection_line_line,
+    intersection_line_circle,
+    intersection_circle_circle,
+    track_roots,
+    intersection_line_line_batch,
+    intersection_line_circle_batch,
+    intersection_circle_circle_batch,
+    track_roots_sequence,
 )
 
 from .lines import (
@@ -28,24 +50,38 @@ from .lines import (
     point_to_line_distance,
     get_parameter_t_on_line,
     is_point_on_line,
+    check_paramerized_line_range_batch,
+    vertical_point_to_line_batch,
+    vertical_line_unit_direction_batch,
+    point_to_line_distance_batch,
+    get_parameter_t_on_line_batch,
+    is_point_on_line_batch,
 )
 
 from .planes import (
     plane_get_ABCD,
+    plane_get_ABCD_batch,
 )
 
 from .points import (
     axisymmetric_point,
     inversion_point,
+    axisymmetric_point_batch,
+    inversion_point_batch,
 )
 
 from .three_points import (
     inscribed, 
     circumcenter, 
     orthocenter,
+    inscribed_batch,
+    circumcenter_batch,
+    orthocenter_batch,
 )
 
 from .vectors import (
     unit_direction_vector,
     get_two_vector_from_normal,
+    unit_direction_vector_batch,
+    get_two_vector_from_normal_batch,
 )
\ No newline at end of file
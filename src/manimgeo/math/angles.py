@@ -1,6 +1,6 @@
-from .base import close, array2float
+from .base import close, array2float, array2float_batch, close_batch, dot_batch, norm_batch, mask_invalid, Number
 from logging import getLogger
-from typing import Optional
+from typing import Optional, Tuple, Union
 import numpy as np
 
 logger = getLogger(__name__)
@@ -109,4 +109,75 @@ def point_3p_countclockwise(start: np.ndarray, center: np.ndarray, angle_rad: fl
         rotated_vec = (vec1 * cos_angle + np.cross(axis_vec, vec1) * sin_angle + axis_vec * np.dot(axis_vec, vec1) * (1 - cos_angle))
         return center + rotated_vec
     
-    raise ValueError(f"不支持的维度：{len(vec1)}")
\ No newline at end of file
+    raise ValueError(f"不支持的维度：{len(vec1)}")
+
+# 批量版本
+
+@array2float_batch
+def angle_3p_countclockwise_batch(start: np.ndarray, center: np.ndarray, end: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `angle_3p_countclockwise` 的批量版本
+
+    - `start`, `center`, `end`: 形如 (N, 3) 的三点
+
+    Returns: `Tuple[np.ndarray, np.ndarray]`, 弧度值 (N,)，`[0, 2*pi)`，与有效掩码 (N,)，存在零向量的行无效
+    """
+    vec1 = start - center
+    vec2 = end - center
+    norm_vec1 = norm_batch(vec1)
+    norm_vec2 = norm_batch(vec2)
+    valid = ~(close_batch(norm_vec1, 0) | close_batch(norm_vec2, 0))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        u1 = vec1 / norm_vec1[..., None]
+        u2 = vec2 / norm_vec2[..., None]
+        dot_product = dot_batch(u1, u2)
+        cross_product_vec = np.cross(u1, u2)
+        sin_abs = norm_batch(cross_product_vec)
+
+        # 在局部二维平面内计算角度，见 `angle_3p_countclockwise`
+        y_axis = np.cross(cross_product_vec / sin_abs[..., None], u1)
+        angle_rad = np.arctan2(dot_batch(u2, y_axis), dot_product)
+
+    angle_rad = np.where(angle_rad < 0, angle_rad + 2 * np.pi, angle_rad)
+    # 三点共线
+    collinear = close_batch(sin_abs, 0)
+    angle_rad = np.where(collinear, np.where(dot_product >= 0, 0.0, np.pi), angle_rad)
+    return mask_invalid(angle_rad, valid), valid
+
+@array2float_batch
+def point_3p_countclockwise_batch(
+        start: np.ndarray, center: np.ndarray, angle_rad: Union[np.ndarray, Number],
+        axis_vec: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `point_3p_countclockwise` 的批量版本，仅支持三维坐标
+
+    - `start`: 形如 (N, 3) 的始点
+    - `center`: 形如 (N, 3) 的中心点
+    - `angle_rad`: 形如 (N,) 的角度（弧度）或单个角度，逆时针为正
+    - `axis_vec`: 形如 (N, 3) 的旋转轴向量（默认使用 z 轴）
+
+    Returns: `Tuple[np.ndarray, np.ndarray]`, 终点坐标 (N, 3) 与有效掩码 (N,)，旋转轴为零向量的行无效。
+    始点与中心重合时终点为始点
+    """
+    vec1 = start - center
+    if axis_vec is None:
+        axis_vec = np.array([0.0, 0.0, 1.0])
+    norm_axis = norm_batch(axis_vec)
+    valid = np.broadcast_to(~close_batch(norm_axis, 0), np.broadcast_shapes(vec1.shape, np.shape(axis_vec))[:-1]).copy()
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        axis_vec = axis_vec / np.asarray(norm_axis)[..., None]
+
+    # Rodrigues 旋转公式
+    cos_angle = np.cos(angle_rad)[..., None]
+    sin_angle = np.sin(angle_rad)[..., None]
+    rotated_vec = (
+        vec1 * cos_angle
+        + np.cross(axis_vec, vec1) * sin_angle
+        + axis_vec * dot_batch(axis_vec, vec1)[..., None] * (1 - cos_angle)
+    )
+    coincide = close_batch(norm_batch(vec1), 0)
+    end = np.where(coincide[..., None], start, center + rotated_vec)
+    return mask_invalid(end, valid), valid
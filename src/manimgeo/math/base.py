@@ -1,7 +1,9 @@
 from ..utils.config import GeoConfig
-from typing import Union
+from contextlib import contextmanager
+from typing import Optional, Sequence, Union
 from logging import getLogger
 import functools
+import math
 import numpy as np
 
 type Number = Union[int, float]
@@ -13,44 +15,138 @@ def close(a: Union[np.ndarray, Number], b: Union[np.ndarray, Number]) -> bool:
     判断两个数值是否相近
     """
     if isinstance(a, np.ndarray) and isinstance(b, np.ndarray):
-        return np.allclose(a, b, atol=cfg.atol, rtol=cfg.rtol)
+        # 常见情形下数值均为有限值，直接比较差值，避免 np.allclose 的额外开销
+        if np.isfinite(a).all():
+            diff = np.abs(a - b)
+            if np.isfinite(diff).all():
+                return bool((diff <= cfg.atol + cfg.rtol * np.abs(b)).all())
+        return bool(np.allclose(a, b, atol=cfg.atol, rtol=cfg.rtol))
     elif isinstance(a, (int, float)) and isinstance(b, (int, float)):
-        if np.isnan(a) or np.isnan(b):
+        if math.isfinite(a) and math.isfinite(b):
+            return abs(a - b) <= cfg.atol + cfg.rtol * abs(b)
+        if math.isnan(a) or math.isnan(b):
             return False # NaN 永远不等于任何值，包括自身
-        if np.isinf(a) and np.isinf(b):
-            return (a == b) # 只有符号相同才相等 (inf == inf, -inf == -inf)
-        if np.isinf(a) or np.isinf(b):
-            return False # 一个是无穷大，另一个是有限数，则不相等
-        return abs(a - b) <= cfg.atol + cfg.rtol * abs(b)
+        return a == b # 只有符号相同的无穷大才相等 (inf == inf, -inf == -inf)，无穷大与有限数不相等
     else:
         raise TypeError("不允许比较类型不同的两个数据是否一致: {} and {}".format(type(a), type(b)))
-    
+
+def close_many(a: Union[np.ndarray, Sequence], b: Union[np.ndarray, Sequence]) -> np.ndarray:
+    """
+    `close` 的向量化版本，一次比较多组数值
+
+    - `a`, `b`: 形如 (N,) 或 (N, ...) 的数组或序列，沿第一维逐组比较
+
+    Returns: `np.ndarray`, 形如 (N,) 的布尔数组，第 i 个元素等价于 `close(a[i], b[i])`
+    """
+    result = close_batch(a, b)
+    if result.ndim > 1:
+        result = result.reshape(result.shape[0], -1).all(axis=1)
+    return result
+
+_trusted = False
+
+def set_trusted_math(enabled: bool = True):
+    """
+    启用或关闭可信快速模式
+
+    启用后，`array2float` 装饰的函数不再检查和转换参数类型，调用方需保证所有数组参数均为 float64 三维向量。
+    适用于参数来自内部寄存器等已知为 float64 的热循环
+    """
+    global _trusted
+    _trusted = enabled
+
+def is_trusted_math() -> bool:
+    """是否处于可信快速模式"""
+    return _trusted
+
+@contextmanager
+def trusted_math():
+    """在上下文中临时启用可信快速模式，退出时恢复原状态"""
+    previous = _trusted
+    set_trusted_math(True)
+    try:
+        yield
+    finally:
+        set_trusted_math(previous)
+
+def _needs_cast(arg) -> bool:
+    """参数是否为需要转换为 float64 的数组"""
+    return isinstance(arg, np.ndarray) and arg.dtype.kind != "f"
+
+def _cast(arg, name: Optional[str] = None) -> np.ndarray:
+    if len(arg) <= 2:
+        logger.warning(f"参数 {arg} 维度少于 3，可能引发计算错误" if name is None else f"参数 {name}: {arg} 维度少于 3，可能引发计算错误")
+    return arg.astype(np.float64)
+
 def array2float(func):
     """
     将参数中所有 np.ndarray 类型的参数自动转换为 float64
+
+    参数均已为浮点数组或处于可信快速模式时直接调用原函数
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _trusted:
+            return func(*args, **kwargs)
+
+        cast_args = any(_needs_cast(arg) for arg in args)
+        cast_kwargs = any(_needs_cast(v) for v in kwargs.values())
+        if not (cast_args or cast_kwargs):
+            return func(*args, **kwargs)
+
+        if cast_args:
+            args = tuple(_cast(arg) if _needs_cast(arg) else arg for arg in args)
+        if cast_kwargs:
+            kwargs = {k: _cast(v, k) if _needs_cast(v) else v for k, v in kwargs.items()}
+        return func(*args, **kwargs)
+
+    return wrapper
+
+def array2float_batch(func):
+    """
+    批量计算版本的 `array2float`，将参数中所有 np.ndarray 类型的参数自动转换为 float64
+
+    批量计算的参数形如 (N, 3)，不再检查参数长度
     """
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        processed_args = []
-
-        # 处理位置参数
-        for arg in args:
-            if isinstance(arg, np.ndarray) and not np.issubdtype(arg.dtype, np.floating):
-                processed_args.append(arg.astype(np.float64))
-                if len(arg) <= 2:
-                    logger.warning(f"参数 {arg} 维度少于 3，可能引发计算错误")
-            else:
-                processed_args.append(arg)
-        processed_kwargs = {}
-        
-        # 处理关键字参数
-        for k, v in kwargs.items():
-            if isinstance(v, np.ndarray) and not np.issubdtype(v.dtype, np.floating):
-                processed_kwargs[k] = v.astype(np.float64)
-                if len(v) <= 2:
-                    logger.warning(f"参数 {k}: {v} 维度少于 3，可能引发计算错误")
-            else:
-                processed_kwargs[k] = v
-        return func(*processed_args, **processed_kwargs)
-
-    return wrapper
\ No newline at end of file
+        if _trusted:
+            return func(*args, **kwargs)
+        args = tuple(arg.astype(np.float64) if _needs_cast(arg) else arg for arg in args)
+        kwargs = {k: v.astype(np.float64) if _needs_cast(v) else v for k, v in kwargs.items()}
+        return func(*args, **kwargs)
+
+    return wrapper
+
+def close_batch(a: Union[np.ndarray, Number], b: Union[np.ndarray, Number]) -> np.ndarray:
+    """
+    `close` 的逐元素版本，判断两组数值是否逐个相近
+
+    NaN 与任何值均不相近，无穷大仅与同号无穷大相近
+    """
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    with np.errstate(invalid="ignore"):
+        result = np.abs(a - b) <= cfg.atol + cfg.rtol * np.abs(b)
+    infinite = np.isinf(a) | np.isinf(b)
+    return np.where(infinite, a == b, result)
+
+def dot_batch(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """沿最后一维逐行计算点积"""
+    return np.einsum("...i,...i->...", a, b)
+
+def norm_batch(v: np.ndarray) -> np.ndarray:
+    """沿最后一维逐行计算模长"""
+    return np.sqrt(dot_batch(v, v))
+
+def mask_invalid(value: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """
+    将无效行置为 NaN
+
+    - `value`: 形如 (N,) 或 (N, 3) 的计算结果
+    - `valid`: 形如 (N,) 的有效掩码
+    """
+    value = np.asarray(value, dtype=np.float64)
+    if value.ndim > np.ndim(valid):
+        return np.where(np.asarray(valid)[..., None], value, np.nan)
+    return np.where(valid, value, np.nan)
@@ -1,5 +1,5 @@
-from .base import close, array2float, Number
-from typing import Tuple
+from .base import close, array2float, Number, array2float_batch, close_batch, dot_batch, norm_batch, mask_invalid
+from typing import Tuple, Union
 from logging import getLogger
 import numpy as np
 
@@ -143,4 +143,80 @@ def inverse_circle_to_line(
     line_point1 = inv_opposite_point + perpendicular1
     line_point2 = inv_opposite_point - perpendicular1
     
-    return line_point1, line_point2
\ No newline at end of file
+    return line_point1, line_point2
+
+# 批量版本
+
+@array2float_batch
+def inverse_circle_batch(
+        origin_circle_center: np.ndarray, origin_circle_radius: Union[np.ndarray, Number], origin_circle_normal: np.ndarray,
+        base_circle_center: np.ndarray, base_circle_r: Union[np.ndarray, Number], base_circle_normal: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    `inverse_circle` 的批量版本
+
+    - `origin_circle_center`, `origin_circle_radius`, `origin_circle_normal`: 形如 (N, 3)、(N,)、(N, 3) 的原圆参数
+    - `base_circle_center`, `base_circle_r`, `base_circle_normal`: 形如 (N, 3)、(N,)、(N, 3) 的基准圆参数
+
+    Returns: `Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]`, 反演圆圆心 (N, 3)、半径 (N,)、法向量 (N, 3) 与有效掩码 (N,)。
+    法向量不共线、原圆经过或包含基准圆圆心的行无效
+    """
+    coplanar = close_batch(norm_batch(np.cross(origin_circle_normal, base_circle_normal)), 0)
+
+    center_diff = origin_circle_center - base_circle_center
+    d = norm_batch(center_diff)
+    d_min = d - origin_circle_radius
+    d_max = d + origin_circle_radius
+    valid = coplanar & ~close_batch(d, 0) & (d_min > 0)
+
+    R_squared = np.asarray(base_circle_r) ** 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inv_d_min = R_squared / d_max
+        inv_d_max = R_squared / d_min
+        unit_direction = center_diff / d[..., None]
+
+    inv_radius = (inv_d_max - inv_d_min) / 2
+    inv_center_distance = (inv_d_max + inv_d_min) / 2
+    inv_center = base_circle_center + inv_center_distance[..., None] * unit_direction
+
+    normal = np.broadcast_to(origin_circle_normal, inv_center.shape)
+    return mask_invalid(inv_center, valid), mask_invalid(inv_radius, valid), mask_invalid(normal, valid), valid
+
+@array2float_batch
+def inverse_circle_to_line_batch(
+        origin_circle_center: np.ndarray, origin_circle_radius: Union[np.ndarray, Number], origin_circle_normal: np.ndarray,
+        base_circle_center: np.ndarray, base_circle_r: Union[np.ndarray, Number], base_circle_normal: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    `inverse_circle_to_line` 的批量版本，仅支持三维坐标
+
+    - `origin_circle_center`, `origin_circle_radius`, `origin_circle_normal`: 形如 (N, 3)、(N,)、(N, 3) 的原圆参数
+    - `base_circle_center`, `base_circle_r`, `base_circle_normal`: 形如 (N, 3)、(N,)、(N, 3) 的基准圆参数
+
+    Returns: `Tuple[np.ndarray, np.ndarray, np.ndarray]`, 反演直线上的两点 (N, 3) 与有效掩码 (N,)。
+    法向量不共线或原圆不经过基准圆圆心的行无效
+    """
+    coplanar = close_batch(norm_batch(np.cross(origin_circle_normal, base_circle_normal)), 0)
+
+    center_diff = origin_circle_center - base_circle_center
+    d = norm_batch(center_diff)
+    valid = coplanar & close_batch(d, origin_circle_radius) & ~close_batch(d, 0)
+
+    R_squared = np.asarray(base_circle_r) ** 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        unit_direction = center_diff / d[..., None]
+
+        # 原圆圆心的对径点及其反演点
+        opposite_point = origin_circle_center + np.asarray(origin_circle_radius)[..., None] * unit_direction
+        opposite_vec = opposite_point - base_circle_center
+        opposite_distance = norm_batch(opposite_vec)
+        inv_opposite_point = base_circle_center + (R_squared / opposite_distance ** 2)[..., None] * opposite_vec
+
+        # 反演直线垂直于两圆心连线，且位于原圆平面内
+        perpendicular = np.cross(unit_direction, origin_circle_normal)
+        perpendicular = perpendicular / norm_batch(perpendicular)[..., None]
+
+        line_point1 = inv_opposite_point + perpendicular
+        line_point2 = inv_opposite_point - perpendicular
+
+    return mask_invalid(line_point1, valid), mask_invalid(line_point2, valid), valid
@@ -2,10 +2,11 @@
 交点相关计算
 """
 
-from .base import close, array2float
+from .base import close, array2float, array2float_batch, close_batch, dot_batch, norm_batch, mask_invalid
 from logging import getLogger
+from itertools import permutations
 import numpy as np
-from typing import Literal
+from typing import Literal, Tuple
 
 logger = getLogger(__name__)
 
@@ -145,3 +146,396 @@ def intersection_line_line(
         return None
 
     return line1_start + t * D1
+
+def _chord_params(start: np.ndarray, direction: np.ndarray, center: np.ndarray, radius: float) -> np.ndarray:
+    """
+    求解与圆共面的直线 `start + t * direction` 与圆交点的参数
+
+    Returns: `np.ndarray`, 参数 t 从小到大排列，相切时仅含一个值，相离时为空
+    """
+    direction_norm_sq = np.dot(direction, direction)
+    t0 = np.dot(center - start, direction) / direction_norm_sq
+    dist = float(np.linalg.norm(start + t0 * direction - center))
+    if close(dist, radius):
+        return np.array([t0])
+    if dist > radius:
+        return np.empty(0)
+    dt = np.sqrt((radius ** 2 - dist ** 2) / direction_norm_sq)
+    return np.array([t0 - dt, t0 + dt])
+
+@array2float
+def intersection_line_circle(
+    line_start: np.ndarray,
+    line_end: np.ndarray,
+    center: np.ndarray,
+    radius: float,
+    normal: np.ndarray,
+    line_type: Literal["LineSegment", "Ray", "InfinityLine"],
+    as_infinty: bool = False
+) -> np.ndarray:
+    """
+    计算线与圆在三维空间中的交点。支持线段、射线和无限长直线
+
+    - `line_start`, `line_end`: 线的起点和终点
+    - `center`, `radius`, `normal`: 圆心、半径与圆所在平面的法向量
+    - `line_type`: 线类型 ("LineSegment", "Ray", "InfinityLine")
+    - `as_infinty`: 如果为True，将线视为无限长直线
+
+    线位于圆所在平面内时至多有两个交点，按线上参数从小到大排列；线穿过圆所在平面时至多有一个交点
+
+    Returns: `np.ndarray`, 形如 (k, 3) 的交点坐标，k 为 0、1 或 2。线的起点终点重合时抛出 ValueError
+    """
+    from .lines import check_paramerized_line_range_batch
+
+    if as_infinty:
+        line_type = "InfinityLine"
+
+    radius = float(radius)
+    direction = line_end - line_start
+    direction_norm = float(np.linalg.norm(direction))
+    if close(direction_norm, 0):
+        raise ValueError("线的起点与终点重合")
+
+    normal = normal / np.linalg.norm(normal)
+    normal_dot_direction = float(np.dot(normal, direction))
+    offset = float(np.dot(normal, center - line_start)) # 起点到圆所在平面的有向距离
+
+    if close(normal_dot_direction / direction_norm, 0):
+        if not close(offset, 0):
+            return np.empty((0, 3)) # 线与圆所在平面平行
+        t = _chord_params(line_start, direction, center, radius)
+    else:
+        # 线穿过圆所在平面，交点需落在圆上
+        t = np.array([offset / normal_dot_direction])
+        if not close(float(np.linalg.norm(line_start + t[0] * direction - center)), radius):
+            return np.empty((0, 3))
+
+    t = t[check_paramerized_line_range_batch(t, line_type)]
+    return line_start + t[:, None] * direction
+
+@array2float
+def intersection_circle_circle(
+    center1: np.ndarray,
+    radius1: float,
+    normal1: np.ndarray,
+    center2: np.ndarray,
+    radius2: float,
+    normal2: np.ndarray
+) -> np.ndarray:
+    """
+    计算两圆在三维空间中的交点
+
+    - `center1`, `radius1`, `normal1`: 第一个圆的圆心、半径与法向量
+    - `center2`, `radius2`, `normal2`: 第二个圆的圆心、半径与法向量
+
+    两圆共面时，交点依次为 `center1 + a * u + h * v` 与 `center1 + a * u - h * v`，
+    其中 `u` 为圆心连线方向，`v = normal1 × u`；两圆不共面时，交点位于两平面的交线上，按交线方向 `normal1 × normal2` 排列
+
+    Returns: `np.ndarray`, 形如 (k, 3) 的交点坐标，k 为 0、1 或 2。两圆重合时抛出 ValueError
+    """
+    radius1, radius2 = float(radius1), float(radius2)
+    normal1 = normal1 / np.linalg.norm(normal1)
+    normal2 = normal2 / np.linalg.norm(normal2)
+    delta = center2 - center1
+    line_direction = np.cross(normal1, normal2)
+
+    if close(float(np.linalg.norm(line_direction)), 0):
+        if not close(float(np.dot(normal1, delta)), 0):
+            return np.empty((0, 3)) # 两圆位于平行的不同平面
+
+        # 两圆共面
+        d = float(np.linalg.norm(delta))
+        if close(d, 0):
+            if close(radius1, radius2):
+                raise ValueError("两圆重合")
+            return np.empty((0, 3)) # 同心圆
+
+        u = delta / d
+        a = (radius1 ** 2 - radius2 ** 2 + d ** 2) / (2 * d)
+        if close(d, radius1 + radius2) or close(d, abs(radius1 - radius2)):
+            return (center1 + a * u)[None] # 相切
+        if d > radius1 + radius2 or d < abs(radius1 - radius2):
+            return np.empty((0, 3)) # 相离或内含
+
+        h = np.sqrt(max(radius1 ** 2 - a ** 2, 0))
+        v = np.cross(normal1, u)
+        return np.array([center1 + a * u + h * v, center1 + a * u - h * v])
+
+    # 两圆不共面，交点位于两平面交线与第一个圆的交点中
+    k = float(np.dot(normal1, normal2))
+    h1 = float(np.dot(normal1, center1))
+    h2 = float(np.dot(normal2, center2))
+    line_point = ((h1 - h2 * k) * normal1 + (h2 - h1 * k) * normal2) / (1 - k ** 2)
+    t = _chord_params(line_point, line_direction, center1, radius1)
+    points = line_point + t[:, None] * line_direction
+    return points[close_batch(norm_batch(points - center2), radius2)]
+
+def track_roots(previous: np.ndarray, current: np.ndarray, num_slots: int = 2) -> np.ndarray:
+    """
+    将当前交点分配到固定的槽位，使连续变化的交点保持编号不变
+
+    - `previous`: 形如 (num_slots, 3) 的上一次分配结果，不存在的交点为 NaN；形状不符时视为没有历史
+    - `current`: 形如 (k, 3) 的当前交点，k 不超过 `num_slots`
+    - `num_slots`: 槽位数量
+
+    交点优先分配到上一次存在交点的槽位，其次使总移动距离最小；没有历史时按原顺序分配
+
+    Returns: `np.ndarray`, 形如 (num_slots, 3) 的分配结果，空槽位以 NaN 填充
+    """
+    result = np.full((num_slots, 3), np.nan)
+    count = len(current)
+    if count == 0:
+        return result
+
+    known = ~np.isnan(previous[:, 0]) if previous.shape == (num_slots, 3) else np.zeros(num_slots, dtype=bool)
+    if not known.any():
+        result[:count] = current
+        return result
+
+    best_slots, best_cost = None, None
+    for slots in permutations(range(num_slots), count):
+        distance = 0.0
+        unknown = 0
+        for root, slot in zip(current, slots):
+            if known[slot]:
+                distance += float(np.linalg.norm(root - previous[slot]))
+            else:
+                unknown += 1
+        cost = (unknown, distance)
+        if best_cost is None or cost < best_cost:
+            best_slots, best_cost = slots, cost
+
+    result[list(best_slots)] = current
+    return result
+
+# 批量版本
+
+type LineType = Literal["LineSegment", "Ray", "InfinityLine"]
+
+@array2float_batch
+def intersection_line_line_batch(
+    line1_start: np.ndarray,
+    line1_end: np.ndarray,
+    line2_start: np.ndarray,
+    line2_end: np.ndarray,
+    line1_type: LineType,
+    line2_type: LineType,
+    as_infinty: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `intersection_line_line` 的批量版本
+
+    - `line1_start`, `line1_end`: 形如 (N, 3) 的第一条线的起点和终点
+    - `line2_start`, `line2_end`: 形如 (N, 3) 的第二条线的起点和终点
+    - `line1_type`, `line2_type`: 线类型 ("LineSegment", "Ray", "InfinityLine")
+    - `as_infinty`: 如果为True，将所有线视为无限长直线
+
+    Returns: `Tuple[np.ndarray, np.ndarray]`, 交点坐标 (N, 3) 与有效掩码 (N,)，无交点或重叠（非单点）的行无效
+    """
+    from .lines import check_paramerized_line_range_batch
+    tol = 1e-10  # 数值扰动
+
+    if as_infinty:
+        line1_type = "InfinityLine"
+        line2_type = "InfinityLine"
+
+    # 处理退化线（起点终点重合）
+    def _perturb(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+        degenerate = np.all(close_batch(start, end), axis=-1)
+        return np.where(degenerate[..., None], start + tol, end)
+    line1_end = _perturb(line1_start, line1_end)
+    line2_end = _perturb(line2_start, line2_end)
+
+    D1 = line1_end - line1_start
+    D2 = line2_end - line2_start
+    P1P2 = line2_start - line1_start
+
+    cross_D1D2 = np.cross(D1, D2)
+    cross_norm_sq = dot_batch(cross_D1D2, cross_D1D2)
+    parallel = close_batch(np.sqrt(cross_norm_sq), 0)
+    collinear = parallel & close_batch(norm_batch(np.cross(P1P2, D1)), 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # 共线情况：第二条线端点在第一条线上的参数
+        D1_norm_sq = dot_batch(D1, D1)
+        t2_start = dot_batch(line2_start - line1_start, D1) / D1_norm_sq
+        t2_end = dot_batch(line2_end - line1_start, D1) / D1_norm_sq
+
+        # 非平行情况：line1_start + t*D1 = line2_start + s*D2
+        t = dot_batch(np.cross(P1P2, D2), cross_D1D2) / cross_norm_sq
+        s = dot_batch(np.cross(P1P2, D1), cross_D1D2) / cross_norm_sq
+
+    # 共线情况：参数范围求交
+    inf = np.full(t2_start.shape, np.inf)
+    t2_low, t2_high = np.minimum(t2_start, t2_end), np.maximum(t2_start, t2_end)
+    range1 = {
+        "LineSegment": (np.zeros_like(inf), np.ones_like(inf)),
+        "Ray": (np.zeros_like(inf), inf),
+        "InfinityLine": (-inf, inf),
+    }[line1_type]
+    forward = dot_batch(D2, D1) >= 0
+    range2 = {
+        "LineSegment": (t2_low, t2_high),
+        "Ray": (np.where(forward, t2_low, -inf), np.where(forward, inf, t2_high)),
+        "InfinityLine": (-inf, inf),
+    }[line2_type]
+    low = np.maximum(range1[0], range2[0])
+    high = np.minimum(range1[1], range2[1])
+    single = close_batch(low, high)
+    collinear_point = line1_start + np.where(single, low, 0.0)[..., None] * D1
+
+    # 非平行情况：两线交于一点且参数在范围内
+    point1 = line1_start + t[..., None] * D1
+    point2 = line2_start + s[..., None] * D2
+    coplanar = close_batch(dot_batch(P1P2, cross_D1D2), 0)
+    meet = np.all(close_batch(point1, point2), axis=-1)
+    in_range = check_paramerized_line_range_batch(t, line1_type) & check_paramerized_line_range_batch(s, line2_type)
+
+    valid = np.where(parallel, collinear & single, coplanar & meet & in_range)
+    point = np.where(parallel[..., None], collinear_point, point1)
+    return mask_invalid(point, valid), valid
+
+def _chord_params_batch(
+    start: np.ndarray,
+    direction: np.ndarray,
+    center: np.ndarray,
+    radius: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `_chord_params` 的批量版本
+
+    Returns: `Tuple[np.ndarray, np.ndarray]`, 形如 (N, 2) 的参数 t 与有效掩码，相切时仅第一个参数有效
+    """
+    direction_norm_sq = dot_batch(direction, direction)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t0 = dot_batch(center - start, direction) / direction_norm_sq
+        dist = norm_batch(start + t0[..., None] * direction - center)
+        dt = np.sqrt(np.maximum(radius ** 2 - dist ** 2, 0) / direction_norm_sq)
+    tangent = close_batch(dist, radius)
+    secant = ~tangent & (dist < radius)
+    dt = np.where(tangent, 0.0, dt)
+    return np.stack([t0 - dt, t0 + dt], axis=-1), np.stack([tangent | secant, secant], axis=-1)
+
+@array2float_batch
+def intersection_line_circle_batch(
+    line_start: np.ndarray,
+    line_end: np.ndarray,
+    center: np.ndarray,
+    radius: np.ndarray,
+    normal: np.ndarray,
+    line_type: LineType,
+    as_infinty: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `intersection_line_circle` 的批量版本
+
+    - `line_start`, `line_end`: 形如 (N, 3) 的线的起点和终点
+    - `center`, `radius`, `normal`: 形如 (N, 3)、(N,)、(N, 3) 的圆心、半径与法向量
+    - `line_type`: 线类型 ("LineSegment", "Ray", "InfinityLine")
+    - `as_infinty`: 如果为True，将线视为无限长直线
+
+    Returns: `Tuple[np.ndarray, np.ndarray]`, 交点坐标 (N, 2, 3) 与有效掩码 (N, 2)，
+    第 i 行的有效交点 `points[i][valid[i]]` 与单次版本的结果一致
+    """
+    from .lines import check_paramerized_line_range_batch
+
+    if as_infinty:
+        line_type = "InfinityLine"
+
+    direction = line_end - line_start
+    direction_norm = norm_batch(direction)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normal = normal / norm_batch(normal)[..., None]
+        normal_dot_direction = dot_batch(normal, direction)
+        offset = dot_batch(normal, center - line_start)
+        parallel = close_batch(normal_dot_direction / direction_norm, 0)
+
+        # 线穿过圆所在平面
+        t_cross = offset / normal_dot_direction
+        on_circle = close_batch(norm_batch(line_start + t_cross[..., None] * direction - center), radius)
+
+    # 线位于圆所在平面内
+    t_chord, chord_valid = _chord_params_batch(line_start, direction, center, radius)
+    in_plane = parallel & close_batch(offset, 0)
+
+    t = np.where(parallel[..., None], t_chord, np.stack([t_cross, t_cross], axis=-1))
+    valid = np.where(
+        parallel[..., None],
+        chord_valid & in_plane[..., None],
+        np.stack([on_circle, np.zeros_like(on_circle)], axis=-1)
+    )
+    valid &= check_paramerized_line_range_batch(t, line_type) & ~close_batch(direction_norm, 0)[..., None]
+
+    points = line_start[..., None, :] + t[..., None] * direction[..., None, :]
+    return mask_invalid(points, valid), valid
+
+@array2float_batch
+def intersection_circle_circle_batch(
+    center1: np.ndarray,
+    radius1: np.ndarray,
+    normal1: np.ndarray,
+    center2: np.ndarray,
+    radius2: np.ndarray,
+    normal2: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `intersection_circle_circle` 的批量版本
+
+    - `center1`, `radius1`, `normal1`: 形如 (N, 3)、(N,)、(N, 3) 的第一个圆的圆心、半径与法向量
+    - `center2`, `radius2`, `normal2`: 形如 (N, 3)、(N,)、(N, 3) 的第二个圆的圆心、半径与法向量
+
+    Returns: `Tuple[np.ndarray, np.ndarray]`, 交点坐标 (N, 2, 3) 与有效掩码 (N, 2)，
+    第 i 行的有效交点 `points[i][valid[i]]` 与单次版本的结果一致，两圆重合的行无效
+    """
+    radius1 = np.asarray(radius1, dtype=np.float64)
+    radius2 = np.asarray(radius2, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normal1 = normal1 / norm_batch(normal1)[..., None]
+        normal2 = normal2 / norm_batch(normal2)[..., None]
+    delta = center2 - center1
+    line_direction = np.cross(normal1, normal2)
+    parallel = close_batch(norm_batch(line_direction), 0)
+    coplanar = parallel & close_batch(dot_batch(normal1, delta), 0)
+
+    # 两圆共面
+    d = norm_batch(delta)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        u = delta / d[..., None]
+        a = (radius1 ** 2 - radius2 ** 2 + d ** 2) / (2 * d)
+        h = np.sqrt(np.maximum(radius1 ** 2 - a ** 2, 0))
+    tangent = close_batch(d, radius1 + radius2) | close_batch(d, np.abs(radius1 - radius2))
+    secant = ~tangent & (d <= radius1 + radius2) & (d >= np.abs(radius1 - radius2))
+    h = np.where(tangent, 0.0, h)[..., None]
+    base = center1 + a[..., None] * u
+    v = np.cross(normal1, u)
+    planar_points = np.stack([base + h * v, base - h * v], axis=-2)
+    planar_valid = np.stack([tangent | secant, secant], axis=-1) & ~close_batch(d, 0)[..., None]
+
+    # 两圆不共面，交点位于两平面交线与第一个圆的交点中
+    k = dot_batch(normal1, normal2)
+    h1 = dot_batch(normal1, center1)
+    h2 = dot_batch(normal2, center2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        line_point = ((h1 - h2 * k)[..., None] * normal1 + (h2 - h1 * k)[..., None] * normal2) / (1 - k ** 2)[..., None]
+    t, chord_valid = _chord_params_batch(line_point, line_direction, center1, radius1)
+    spatial_points = line_point[..., None, :] + t[..., None] * line_direction[..., None, :]
+    on_circle2 = close_batch(norm_batch(spatial_points - center2[..., None, :]), radius2[..., None])
+
+    points = np.where(parallel[..., None, None], planar_points, spatial_points)
+    valid = np.where(parallel[..., None], planar_valid & coplanar[..., None], chord_valid & on_circle2)
+    return mask_invalid(points, valid), valid
+
+def track_roots_sequence(previous: np.ndarray, points: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """
+    `track_roots` 的序列版本，将各行视为按时间顺序排列的连续帧，逐行跟踪交点
+
+    - `previous`: 形如 (S, 3) 的第一行之前的分配结果
+    - `points`, `valid`: 形如 (N, S, 3) 与 (N, S) 的交点与有效掩码，如 `*_batch` 交点函数的返回值
+
+    Returns: `np.ndarray`, 形如 (N, S, 3) 的分配结果，空槽位以 NaN 填充
+    """
+    num_slots = points.shape[-2]
+    result = np.empty(points.shape)
+    for i in range(points.shape[0]):
+        previous = result[i] = track_roots(previous, points[i][valid[i]], num_slots)
+    return result
@@ -1,5 +1,5 @@
-from .base import close, array2float, Number
-from typing import Literal
+from .base import close, array2float, Number, array2float_batch, close_batch, dot_batch, norm_batch, mask_invalid
+from typing import Literal, Tuple
 from logging import getLogger
 import numpy as np
 
@@ -144,4 +144,133 @@ def is_point_on_line(point: np.ndarray, line_start: np.ndarray, line_end: np.nda
     
     # 计算参数 t
     t = get_parameter_t_on_line(point, line_start, line_end)
-    return check_paramerized_line_range(t, line_type)
\ No newline at end of file
+    return check_paramerized_line_range(t, line_type)
+
+# 批量版本
+
+def check_paramerized_line_range_batch(t: np.ndarray, line_type: Literal["LineSegment", "Ray", "InfinityLine"]) -> np.ndarray:
+    """
+    `check_paramerized_line_range` 的批量版本
+
+    - `t`: 形如 (N,) 的参数值
+    - `line_type`: 直线类型，可为 "LineSegment", "Ray", "InfinityLine"
+
+    Returns: `np.ndarray`, 形如 (N,) 的布尔数组
+    """
+    if line_type not in ["LineSegment", "Ray", "InfinityLine"]:
+        logger.error(f"未知的直线类型: {line_type}")
+        raise ValueError(f"未知的直线类型: {line_type}")
+
+    t = np.asarray(t, dtype=np.float64)
+    endpoint = close_batch(t, 0) | close_batch(t, 1)
+    if line_type == "LineSegment":
+        in_range = (t >= 0) & (t <= 1)
+    elif line_type == "Ray":
+        in_range = t >= 0
+    else:
+        in_range = ~np.isnan(t)
+    return endpoint | in_range
+
+@array2float_batch
+def vertical_line_unit_direction_batch(
+        line_start: np.ndarray, line_end: np.ndarray,
+        turn: Literal["clockwise", "counterclockwise"] = "counterclockwise"
+    ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `vertical_line_unit_direction` 的批量版本
+
+    - `line_start`, `line_end`: 形如 (N, 3) 的直线起点与终点
+    - `turn`: 方向，可为 "clockwise" 或 "counterclockwise"
+
+    Returns: `Tuple[np.ndarray, np.ndarray]`, 垂线方向向量 (N, 3) 与有效掩码 (N,)，直线退化为点的行无效
+    """
+    from .vectors import unit_direction_vector_batch
+
+    if turn not in ["clockwise", "counterclockwise"]:
+        logger.error(f"未知的转向类型: {turn}")
+        raise ValueError(f"未知的转向类型: {turn}")
+
+    direction, valid = unit_direction_vector_batch(line_start, line_end)
+    direction = np.stack([-direction[..., 1], direction[..., 0], direction[..., 2]], axis=-1)
+    return (direction if turn == "counterclockwise" else -direction), valid
+
+@array2float_batch
+def vertical_point_to_line_batch(point: np.ndarray, line_start: np.ndarray, line_end: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `vertical_point_to_line` 的批量版本
+
+    - `point`: 形如 (N, 3) 的点
+    - `line_start`, `line_end`: 形如 (N, 3) 的直线起点与终点
+
+    Returns: `Tuple[np.ndarray, np.ndarray]`, 垂足坐标 (N, 3) 与有效掩码 (N,)，直线退化为点时垂足为该点
+    """
+    v = line_end - line_start
+    v_squared_norm = dot_batch(v, v)
+    degenerate = close_batch(v_squared_norm, 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = dot_batch(point - line_start, v) / v_squared_norm
+    t = np.where(degenerate, 0.0, t)
+    foot = line_start + t[..., None] * v
+    return foot, np.ones(foot.shape[:-1], dtype=bool)
+
+@array2float_batch
+def point_to_line_distance_batch(point: np.ndarray, line_start: np.ndarray, line_end: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `point_to_line_distance` 的批量版本
+
+    - `point`: 形如 (N, 3) 的点
+    - `line_start`, `line_end`: 形如 (N, 3) 的直线起点与终点
+
+    Returns: `Tuple[np.ndarray, np.ndarray]`, 距离 (N,) 与有效掩码 (N,)，直线退化为点时为点到点的距离
+    """
+    direction = line_end - line_start
+    norm_val = norm_batch(direction)
+    degenerate = close_batch(norm_val, 0)
+
+    vec_ap = point - line_start
+    with np.errstate(divide="ignore", invalid="ignore"):
+        distance = norm_batch(np.cross(direction, vec_ap)) / norm_val
+    distance = np.where(degenerate, norm_batch(vec_ap), distance)
+    return distance, np.ones(distance.shape, dtype=bool)
+
+@array2float_batch
+def get_parameter_t_on_line_batch(point: np.ndarray, line_start: np.ndarray, line_end: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `get_parameter_t_on_line` 的批量版本
+
+    - `point`: 形如 (N, 3) 的点
+    - `line_start`, `line_end`: 形如 (N, 3) 的直线起点与终点
+
+    Returns: `Tuple[np.ndarray, np.ndarray]`, 参数 t (N,) 与有效掩码 (N,)，直线退化为点的行无效
+    """
+    direction = line_end - line_start
+    norm_sq = dot_batch(direction, direction)
+    valid = ~close_batch(norm_sq, 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = dot_batch(point - line_start, direction) / norm_sq
+    return mask_invalid(t, valid), valid
+
+@array2float_batch
+def is_point_on_line_batch(
+        point: np.ndarray, line_start: np.ndarray, line_end: np.ndarray,
+        line_type: Literal["LineSegment", "Ray", "InfinityLine"] = "InfinityLine"
+    ) -> np.ndarray:
+    """
+    `is_point_on_line` 的批量版本
+
+    - `point`: 形如 (N, 3) 的点
+    - `line_start`, `line_end`: 形如 (N, 3) 的线起点与终点
+    - `line_type`: 线类型，可为 "LineSegment", "Ray", "InfinityLine"
+
+    Returns: `np.ndarray`, 形如 (N,) 的布尔数组
+    """
+    distance, _ = point_to_line_distance_batch(point, line_start, line_end)
+    on_infinity_line = close_batch(distance, 0)
+
+    degenerate = close_batch(norm_batch(line_end - line_start), 0)
+    t, _ = get_parameter_t_on_line_batch(point, line_start, line_end)
+    in_range = check_paramerized_line_range_batch(t, line_type)
+    on_point = close_batch(norm_batch(point - line_start), 0)
+
+    return on_infinity_line & np.where(degenerate, on_point, in_range)
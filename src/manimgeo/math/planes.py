@@ -1,4 +1,4 @@
-from .base import close, array2float, Number
+from .base import close, array2float, Number, array2float_batch, close_batch, dot_batch, norm_batch, mask_invalid
 from typing import Tuple, Optional
 from logging import getLogger
 import numpy as np
@@ -58,4 +58,39 @@ def plane_get_ABCD(point1: np.ndarray, point2: np.ndarray, point3: np.ndarray, c
         # 平面不通过原点 (D_prime != 0)
         # 计算缩放因子 k = constant / D_prime
         k = constant / D_prime
-        return float(k * A_prime), float(k * B_prime), float(k * C_prime)
\ No newline at end of file
+        return float(k * A_prime), float(k * B_prime), float(k * C_prime)
+
+# 批量版本
+
+@array2float_batch
+def plane_get_ABCD_batch(
+        point1: np.ndarray, point2: np.ndarray, point3: np.ndarray,
+        constant: Optional[Number] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `plane_get_ABCD` 的批量版本
+
+    - `point1`, `point2`, `point3`: 形如 (N, 3) 的平面上的点
+    - `constant`: 平面方程的常数项，留空则根据是否经过原点设置为 1 或 0
+
+    Returns: `Tuple[np.ndarray, np.ndarray]`, 系数 (A, B, C) 组成的 (N, 3) 数组与有效掩码 (N,)。
+    三点共线，或平面经过原点而 `constant` 不为零的行无效
+    """
+    normal_vec = np.cross(point2 - point1, point3 - point1)
+    valid = ~close_batch(norm_batch(normal_vec), 0)
+
+    D_prime = dot_batch(normal_vec, point1)
+    through_origin = close_batch(D_prime, 0)
+    if constant is None:
+        constant_arr = np.where(through_origin, 0.0, D_prime)
+    else:
+        constant_arr = np.full(D_prime.shape, float(constant))
+
+    # 平面通过原点时，将法向量归一化为最大绝对值分量为 1
+    max_abs_comp = np.max(np.abs(normal_vec), axis=-1)
+    valid &= ~(through_origin & (~close_batch(constant_arr, 0) | close_batch(max_abs_comp, 0)))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = np.where(through_origin, 1.0 / max_abs_comp, constant_arr / D_prime)
+        coefficients = normal_vec * scale[..., None]
+    return mask_invalid(coefficients, valid), valid
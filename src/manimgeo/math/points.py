@@ -1,4 +1,5 @@
-from .base import close, array2float, Number
+from .base import close, array2float, Number, array2float_batch, close_batch, dot_batch, norm_batch, mask_invalid
+from typing import Tuple, Union
 from logging import getLogger
 import numpy as np
 
@@ -50,4 +51,47 @@ def inversion_point(point: np.ndarray, center: np.ndarray, r: Number) -> np.ndar
         raise ValueError("point 与 center 过于接近，无法计算反演")
         
     k = (r ** 2) / d_squared
-    return center + op * k
\ No newline at end of file
+    return center + op * k
+
+# 批量版本
+
+@array2float_batch
+def axisymmetric_point_batch(point: np.ndarray, line_start: np.ndarray, line_end: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `axisymmetric_point` 的批量版本
+
+    - `point`: 形如 (N, 3) 的原始点
+    - `line_start`, `line_end`: 形如 (N, 3) 的直线起点与终点
+
+    Returns: `Tuple[np.ndarray, np.ndarray]`, 对称点坐标 (N, 3) 与有效掩码 (N,)，直线退化为点的行无效
+    """
+    from .vectors import unit_direction_vector_batch
+    u, valid = unit_direction_vector_batch(line_start, line_end)
+
+    projection_length = dot_batch(point - line_start, u)
+    q = line_start + projection_length[..., None] * u
+
+    # 点已在直线上时，对称点为其本身
+    on_line = close_batch(norm_batch(point - q), 0)
+    symmetric_point = np.where(on_line[..., None], point, 2 * q - point)
+    return mask_invalid(symmetric_point, valid), valid
+
+@array2float_batch
+def inversion_point_batch(point: np.ndarray, center: np.ndarray, r: Union[np.ndarray, Number]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `inversion_point` 的批量版本
+
+    - `point`: 形如 (N, 3) 的原始点
+    - `center`: 形如 (N, 3) 的圆心
+    - `r`: 形如 (N,) 的半径或单个半径
+
+    Returns: `Tuple[np.ndarray, np.ndarray]`, 反演点坐标 (N, 3) 与有效掩码 (N,)，点与圆心重合的行无效
+    """
+    op = point - center
+    d_squared = dot_batch(op, op)
+    valid = ~close_batch(d_squared, 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = np.asarray(r) ** 2 / d_squared
+        inversion = center + op * k[..., None]
+    return mask_invalid(inversion, valid), valid
@@ -1,4 +1,4 @@
-from .base import close, array2float
+from .base import close, array2float, array2float_batch, close_batch, dot_batch, norm_batch, mask_invalid
 from logging import getLogger
 from typing import Tuple
 import numpy as np
@@ -111,3 +111,93 @@ def orthocenter(p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> np.ndarray:
     x, y = coeffs[0], coeffs[1]
     orthocenter = p1 + x * v1 + y * v2
     return orthocenter
+
+# 批量版本
+
+@array2float_batch
+def inscribed_batch(p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    `inscribed` 的批量版本
+
+    - `p1`, `p2`, `p3`: 形如 (N, 3) 的三角形顶点
+
+    Returns: `Tuple[np.ndarray, np.ndarray, np.ndarray]`, 内切圆半径 (N,)、圆心 (N, 3) 与有效掩码 (N,)。
+    与 `inscribed` 一致，退化三角形的半径为 0，圆心为三点重心
+    """
+    a_len = norm_batch(p2 - p3)
+    b_len = norm_batch(p3 - p1)
+    c_len = norm_batch(p1 - p2)
+
+    perimeter = a_len + b_len + c_len
+    s = perimeter / 2.0
+    area_squared_term = s * (s - a_len) * (s - b_len) * (s - c_len)
+    degenerate = close_batch(perimeter, 0) | close_batch(area_squared_term, 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = np.sqrt(np.maximum(area_squared_term, 0)) / s
+        incenter = (a_len[..., None] * p1 + b_len[..., None] * p2 + c_len[..., None] * p3) / perimeter[..., None]
+
+    r = np.where(degenerate, 0.0, r)
+    incenter = np.where(degenerate[..., None], (p1 + p2 + p3) / 3.0, incenter)
+    return r, incenter, np.ones(r.shape, dtype=bool)
+
+@array2float_batch
+def circumcenter_batch(p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    `circumcenter` 的批量版本
+
+    - `p1`, `p2`, `p3`: 形如 (N, 3) 的三角形顶点
+
+    Returns: `Tuple[np.ndarray, np.ndarray, np.ndarray]`, 外接圆半径 (N,)、圆心 (N, 3) 与有效掩码 (N,)，
+    三点共线（按容差判断）的行无效
+    """
+    v1 = p2 - p1
+    v2 = p3 - p1
+
+    dot_v1_v1 = dot_batch(v1, v1)
+    dot_v1_v2 = dot_batch(v1, v2)
+    dot_v2_v2 = dot_batch(v2, v2)
+
+    # 2x2 方程组 [[2 v1.v1, 2 v1.v2], [2 v1.v2, 2 v2.v2]] [x, y] = [v1.v1, v2.v2] 的克莱姆法则解
+    # 行列式的四分之一即 |v1 x v2|^2
+    det = dot_v1_v1 * dot_v2_v2 - dot_v1_v2 ** 2
+    valid = ~close_batch(norm_batch(np.cross(v1, v2)), 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = dot_v2_v2 * (dot_v1_v1 - dot_v1_v2) / (2 * det)
+        y = dot_v1_v1 * (dot_v2_v2 - dot_v1_v2) / (2 * det)
+
+    center = p1 + x[..., None] * v1 + y[..., None] * v2
+    r = norm_batch(center - p1)
+    return mask_invalid(r, valid), mask_invalid(center, valid), valid
+
+@array2float_batch
+def orthocenter_batch(p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `orthocenter` 的批量版本
+
+    - `p1`, `p2`, `p3`: 形如 (N, 3) 的三角形顶点
+
+    Returns: `Tuple[np.ndarray, np.ndarray]`, 垂心坐标 (N, 3) 与有效掩码 (N,)，三点共线的行无效
+    """
+    v1 = p2 - p1
+    v2 = p3 - p1
+    v_p2p3 = p3 - p2
+
+    area_norm = norm_batch(np.cross(v1, v2))
+
+    dot_v1_v_p2p3 = dot_batch(v1, v_p2p3)
+    dot_v2_v_p2p3 = dot_batch(v2, v_p2p3)
+    dot_v1_v2 = dot_batch(v1, v2)
+    dot_v2_v2 = dot_batch(v2, v2)
+
+    # [[v1.p2p3, v2.p2p3], [v1.v2, v2.v2]] [x, y] = [0, v1.v2] 的克莱姆法则解
+    det = dot_v1_v_p2p3 * dot_v2_v2 - dot_v2_v_p2p3 * dot_v1_v2
+    valid = (area_norm >= 1e-9) & (det != 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = -dot_v2_v_p2p3 * dot_v1_v2 / det
+        y = dot_v1_v_p2p3 * dot_v1_v2 / det
+
+    orthocenter = p1 + x[..., None] * v1 + y[..., None] * v2
+    return mask_invalid(orthocenter, valid), valid
@@ -1,4 +1,4 @@
-from .base import close, array2float
+from .base import close, array2float, array2float_batch, close_batch, norm_batch, mask_invalid
 from logging import getLogger
 from typing import Tuple
 import numpy as np
@@ -23,6 +23,22 @@ def unit_direction_vector(start: np.ndarray, end: np.ndarray) -> np.ndarray:
     
     return direction_vector / norm
 
+@array2float_batch
+def unit_direction_vector_batch(start: np.ndarray, end: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `unit_direction_vector` 的批量版本
+
+    - `start`, `end`: 形如 (N, 3) 的起点与终点
+
+    Returns: `Tuple[np.ndarray, np.ndarray]`, 单位方向向量 (N, 3) 与有效掩码 (N,)，起点终点重合的行无效
+    """
+    direction_vector = end - start
+    norm = norm_batch(direction_vector)
+    valid = ~close_batch(norm, 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        unit = direction_vector / norm[..., None]
+    return mask_invalid(unit, valid), valid
+
 @array2float
 def get_two_vector_from_normal(normal: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """
@@ -56,4 +72,28 @@ def get_two_vector_from_normal(normal: np.ndarray) -> Tuple[np.ndarray, np.ndarr
     v2 = np.cross(unit_normal, v1)
     v2 = v2 / np.linalg.norm(v2)
         
-    return v1, v2
\ No newline at end of file
+    return v1, v2
+
+@array2float_batch
+def get_two_vector_from_normal_batch(normal: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    `get_two_vector_from_normal` 的批量版本
+
+    - `normal`: 形如 (N, 3) 的法向量
+
+    Returns: `Tuple[np.ndarray, np.ndarray, np.ndarray]`, 两个单位正交向量 (N, 3) 与有效掩码 (N,)，零向量的行无效
+    """
+    norm_val = norm_batch(normal)
+    valid = norm_val != 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        unit_normal = normal / norm_val[..., None]
+
+        # 选择与法向量分量绝对值最小的轴作为参考向量，并列时依次优先 x、y
+        reference = np.eye(3)[np.argmin(np.abs(np.nan_to_num(unit_normal)), axis=-1)]
+
+        v1 = np.cross(reference, unit_normal)
+        v1 = v1 / norm_batch(v1)[..., None]
+        v2 = np.cross(unit_normal, v1)
+        v2 = v2 / norm_batch(v2)[..., None]
+
+    return mask_invalid(v1, valid), mask_invalid(v2, valid), valid
@@ -0,0 +1,33 @@
+"""
+program 模块将几何构造图编译为扁平的指令序列，在连续的寄存器数组上执行
+
+`GeometryArena` 使用相同的寄存器布局，将几何对象自身的属性存放在连续的数组中，
+`GeometryArray` 则以一个数组表示批量构造的 N 个同类几何对象
+"""
+
+from .program import (
+    GeometryProgram,
+    BatchResult,
+    RegisterView,
+    Instruction,
+    LAYOUTS,
+)
+
+from .arena import (
+    GeometryArena,
+)
+
+from .bulk import (
+    GeometryArray,
+)
+
+from .kernels import (
+    KERNELS,
+    TURN_CCW,
+    TURN_CW,
+    MAX_ROOTS,
+)
+
+from .batch_kernels import (
+    BATCH_KERNELS,
+)
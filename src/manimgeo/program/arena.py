@@ -0,0 +1,199 @@
+"""
+几何对象共享的坐标池
+
+坐标池将一组几何对象的计算属性按拓扑顺序存放在一块连续的 float64 数组中，
+几何对象的向量属性（如 `coord`、`start`、`center`）直接成为该数组的视图
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+
+from ..components import BaseGeometry
+from .program import LAYOUTS, Slot, encode_attr, geometry_kind, upstream_order
+
+class GeometryArena:
+    """
+    几何对象共享的坐标池
+
+    ```python
+    arena = GeometryArena.attach([circle, P])
+    saved = arena.snapshot()
+    A.set_coord(np.array([1.0, 2.0, 0.0]))
+    arena.restore(saved)
+    ```
+
+    挂载后，对象及其适配器的向量属性成为 `buffer` 的视图。输出数组复用模式下（见 `set_output_reuse`）
+    适配器直接将结果写入坐标池的固定位置；默认模式下每次计算得到新数组，计算后被复制到固定位置，
+    此时坐标池只用于快照与恢复。标量属性（如 `radius`）仍以 Python 数值保存，同时在 `buffer` 中保留一份副本。
+    因此整个场景的快照只需复制一次 `buffer`
+
+    寄存器布局与 `GeometryProgram` 一致，见 `LAYOUTS`。挂载后新建的对象不在池中，需要重新挂载
+    """
+
+    def __init__(self):
+        self.objects: List[BaseGeometry] = []
+        self.buffer: np.ndarray = np.zeros(0)
+        self._index: Dict[int, int] = {}
+        # 每个对象的属性、寄存器位置及向量属性的视图（标量属性为 None）
+        self._entries: List[List[Tuple[str, Slot, Optional[np.ndarray]]]] = []
+
+    @classmethod
+    def attach(cls, objects: Iterable[BaseGeometry]) -> GeometryArena:
+        """
+        将几何对象及其全部上游对象挂载到新的坐标池
+
+        - `objects`: 需要挂载的几何对象
+
+        仅支持三维坐标的 `Point`、`Line`、`Circle`、`Angle`、`Vector` 与 `Intersections`，
+        已挂载到其他坐标池的对象抛出 `ValueError`
+        """
+        arena = cls()
+        arena.objects = upstream_order(objects)
+        for obj in arena.objects:
+            if obj._arena is not None:
+                raise ValueError(f"几何对象 {obj.name} 已挂载到其他坐标池")
+
+        size = 0
+        layouts = []
+        for obj in arena.objects:
+            layout = LAYOUTS[geometry_kind(obj)]
+            layouts.append((size, layout))
+            size += sum(layout.values())
+        arena.buffer = np.zeros(size)
+
+        for i, (obj, (offset, layout)) in enumerate(zip(arena.objects, layouts)):
+            entries = []
+            for attr, length in layout.items():
+                if length == 3:
+                    slot: Slot = slice(offset, offset + 3)
+                    view = arena.buffer[slot]
+                else:
+                    # 标量与展平的交点坐标不作为视图绑定
+                    slot = offset if length == 1 else slice(offset, offset + length)
+                    view = None
+                entries.append((attr, slot, view))
+                offset += length
+            arena._index[id(obj)] = i
+            arena._entries.append(entries)
+
+        for obj in arena.objects:
+            arena.store(obj)
+            obj._arena = arena
+            # 适配器的输出数组同样替换为视图，输出数组复用模式下计算结果直接写入坐标池
+            outputs = obj.adapter.__dict__
+            for attr, _, view in arena._entries[arena._index[id(obj)]]:
+                if view is not None and attr in outputs:
+                    outputs[attr] = view
+        return arena
+
+    def detach(self):
+        """将所有对象移出坐标池，向量属性恢复为各自独立的数组"""
+        for obj, entries in zip(self.objects, self._entries):
+            obj._arena = None
+            for attr, _, view in entries:
+                if view is None:
+                    continue
+                value = view.copy()
+                if obj.__dict__.get(attr) is view:
+                    setattr(obj, attr, value)
+                if obj.adapter.__dict__.get(attr) is view:
+                    obj.adapter.__dict__[attr] = value
+        self.objects = []
+        self._index = {}
+        self._entries = []
+
+    def store(self, obj: BaseGeometry, derived: bool = False):
+        """
+        将几何对象当前的计算属性写入坐标池，由 `BaseGeometry` 在每次计算后调用
+
+        - `obj`: 已挂载的几何对象
+        - `derived`: 为 False 时仅写入派生属性以外的属性；为 True 时仅写入派生属性，
+          由 `BaseGeometry` 在派生属性被读取并计算后调用
+
+        派生属性（如线的 `length`）不在每次计算后写入，以免强制计算；其在坐标池中的值
+        在被读取或调用 `snapshot` 时才更新
+        """
+        buffer = self.buffer
+        derived_attrs = obj.adapter.derived_attrs
+        for attr, slot, view in self._entries[self._index[id(obj)]]:
+            if (attr in derived_attrs) != derived:
+                continue
+            value = getattr(obj, attr)
+            if view is not None:
+                if value is view:
+                    continue
+                if np.shape(value) != (3,):
+                    raise ValueError(f"坐标池仅支持三维坐标: {obj.name}.{attr} = {value}")
+                np.copyto(view, value)
+                setattr(obj, attr, view)
+            else:
+                buffer[slot] = encode_attr(attr, value)
+
+    def snapshot(self) -> np.ndarray:
+        """
+        获取整个场景计算属性的快照
+
+        尚未读取的派生属性在此时计算并写入坐标池，惰性模式下等待重新计算的对象除外
+        """
+        for obj in self.objects:
+            if obj.dirty:
+                continue
+            fields = obj.__dict__
+            for attr in obj.adapter.derived_attrs:
+                if attr not in fields:
+                    # 读取时经 BaseGeometry.__getattr__ 计算并写入坐标池
+                    getattr(obj, attr)
+                    break
+        return self.buffer.copy()
+
+    def restore(self, snapshot: np.ndarray):
+        """
+        将所有对象的计算属性恢复为快照中的值
+
+        - `snapshot`: `snapshot` 返回的快照
+
+        自由点的构造参数与适配器的输出属性同时被恢复，之后重新计算的派生属性与交点跟踪读取恢复后的值；
+        错误标记保持不变
+        """
+        np.copyto(self.buffer, snapshot)
+        for obj, entries in zip(self.objects, self._entries):
+            if obj.dirty:
+                # 惰性模式下等待重新计算的对象在读取时会覆盖恢复的值
+                continue
+            outputs = obj.adapter.__dict__
+            for attr, slot, view in entries:
+                value = view if view is not None else self._decode(obj, attr, self.buffer[slot])
+                setattr(obj, attr, value)
+                if attr in outputs:
+                    outputs[attr] = value
+            if not obj.dependencies and obj.adapter.construct_type == "Free":
+                obj.adapter.args.coord = obj.coord.copy()
+            obj._bump_version()
+
+    def _decode(self, obj: BaseGeometry, attr: str, value: Any) -> Any:
+        """将寄存器中的值还原为几何对象的属性值"""
+        if attr == "turn":
+            return "Counterclockwise" if value > 0 else "Clockwise"
+        if attr == "num_results":
+            return int(value)
+        if attr == "result_points":
+            points = value.reshape(-1, 3)
+            return points.copy() if obj.args.track else points[:int(self.buffer[self.slot(obj, "num_results")])].copy()
+        return float(value)
+
+    def slot(self, obj: BaseGeometry, attr: str) -> Slot:
+        """
+        获取几何对象计算属性在坐标池中的位置
+
+        - `obj`: 几何对象
+        - `attr`: 属性名称
+        """
+        index = self._index.get(id(obj))
+        if index is None:
+            raise KeyError(f"几何对象 {obj.name} 不在坐标池中")
+        for name, slot, _ in self._entries[index]:
+            if name == attr:
+                return slot
+        raise KeyError(f"几何对象 {obj.name} 没有属性 {attr}")
@@ -0,0 +1,386 @@
+"""
+GeometryProgram 批量执行使用的计算核
+
+与 `kernels` 中的计算核一一对应，参数帧中的寄存器视图形如 (N, 3) 或 (N,)，
+返回 `(outputs, valid)`：`outputs` 与单次计算核的返回值一致，`valid` 为形如 (N,) 的有效掩码，
+所有行均有效时可以直接返回 True
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Tuple
+import numpy as np
+
+from ..math.base import close_batch, norm_batch
+from ..math import (
+    axisymmetric_point_batch,
+    vertical_point_to_line_batch,
+    vertical_line_unit_direction_batch,
+    is_point_on_line_batch,
+    inversion_point_batch,
+    intersection_line_line_batch,
+    intersection_line_circle_batch,
+    intersection_circle_circle_batch,
+    track_roots_sequence,
+    circumcenter_batch,
+    inscribed_batch,
+    orthocenter_batch,
+    point_3p_countclockwise_batch,
+    angle_3p_countclockwise_batch,
+    inverse_circle_batch,
+    plane_get_ABCD_batch,
+)
+from .kernels import TURN_CCW, MAX_ROOTS, ccw_angle
+
+type BatchKernel = Callable[[Any], Tuple[Tuple[Any, ...], Any]]
+
+BATCH_KERNELS: Dict[Tuple[str, str], BatchKernel] = {}
+
+def batch_kernel(kind: str, construct_type: str):
+    """
+    注册批量计算核
+
+    - `kind`: 几何对象种类，如 `"Point"`
+    - `construct_type`: 构造方式
+    """
+    def decorator(func: BatchKernel) -> BatchKernel:
+        BATCH_KERNELS[(kind, construct_type)] = func
+        return func
+    return decorator
+
+def unit_normal_batch(normal: Any) -> Tuple[np.ndarray, Any]:
+    """归一化法向量，缺省时为 XY 平面法向量"""
+    if normal is None:
+        return np.array([0.0, 0.0, 1.0]), True
+    norm = norm_batch(normal)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return normal / norm[..., None], ~close_batch(norm, 0)
+
+def plane_normal_batch(p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """三点所在平面的单位法向量"""
+    normal_vec, valid = plane_get_ABCD_batch(p1, p2, p3)
+    return normal_vec / norm_batch(normal_vec)[..., None], valid
+
+# 派生属性
+
+def _unit_or_zero(vec: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    norm = norm_batch(vec)
+    zero = close_batch(norm, 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        unit = np.where(zero[..., None], 0.0, vec / norm[..., None])
+    return norm, unit
+
+def finish_line_batch(start: np.ndarray, end: np.ndarray) -> Tuple[Any, ...]:
+    """补全线长度与单位方向"""
+    length, unit_direction = _unit_or_zero(end - start)
+    return start, end, length, unit_direction
+
+def finish_vector_batch(vec: np.ndarray) -> Tuple[Any, ...]:
+    """补全向量模长与单位方向"""
+    norm, unit_direction = _unit_or_zero(vec)
+    return vec, norm, unit_direction
+
+def finish_circle_batch(center: np.ndarray, radius: Any, normal: np.ndarray) -> Tuple[Any, ...]:
+    """补全圆面积与周长"""
+    return center, radius, normal, np.pi * radius ** 2, 2 * np.pi * radius
+
+BATCH_FINISHERS: Dict[str, Callable[..., Tuple[Any, ...]]] = {
+    "Line": finish_line_batch,
+    "Vector": finish_vector_batch,
+    "Circle": finish_circle_batch,
+}
+
+# Point
+
+@batch_kernel("Point", "MidPP")
+def point_mid_pp(a):
+    return ((a.point1.coord + a.point2.coord) / 2,), True
+
+@batch_kernel("Point", "MidL")
+def point_mid_l(a):
+    return ((a.line.start + a.line.end) / 2,), True
+
+@batch_kernel("Point", "ExtensionPP")
+def point_extension_pp(a):
+    return (a.start.coord + a.factor * (a.through.coord - a.start.coord),), True
+
+@batch_kernel("Point", "AxisymmetricPL")
+def point_axisymmetric_pl(a):
+    coord, valid = axisymmetric_point_batch(a.point.coord, a.line.start, a.line.end)
+    return (coord,), valid
+
+@batch_kernel("Point", "VerticalPL")
+def point_vertical_pl(a):
+    coord, valid = vertical_point_to_line_batch(a.point.coord, a.line.start, a.line.end)
+    return (coord,), valid
+
+@batch_kernel("Point", "ParallelPL")
+def point_parallel_pl(a):
+    return (a.point.coord + a.distance * a.line.unit_direction,), True
+
+@batch_kernel("Point", "InversionPCir")
+def point_inversion_pcir(a):
+    coord, valid = inversion_point_batch(a.point.coord, a.circle.center, a.circle.radius)
+    return (coord,), valid
+
+def _intersection_ll(line1, line2, as_infinity: bool):
+    coord, valid = intersection_line_line_batch(
+        line1.start, line1.end,
+        line2.start, line2.end,
+        line1.line_type, line2.line_type,
+        as_infinity
+    )
+    return (coord,), valid
+
+@batch_kernel("Point", "IntersectionLL")
+def point_intersection_ll(a):
+    return _intersection_ll(a.line1, a.line2, a.regard_infinite)
+
+@batch_kernel("Point", "IntersectionsLL")
+def point_intersections_ll(a):
+    int_type = a.int_type
+    return _intersection_ll(int_type.line1, int_type.line2, int_type.as_infinity)
+
+def _single_intersection(points: np.ndarray, valid: np.ndarray):
+    # 恰有一个有效交点的行有效
+    return (np.where(valid[..., :1], points[..., 0, :], points[..., 1, :]),), valid.sum(axis=-1) == 1
+
+@batch_kernel("Point", "IntersectionsLCir")
+def point_intersections_lcir(a):
+    line, circle = a.int_type.line, a.int_type.circle
+    return _single_intersection(*intersection_line_circle_batch(
+        line.start, line.end,
+        circle.center, circle.radius, circle.normal,
+        line.line_type, a.int_type.as_infinity
+    ))
+
+@batch_kernel("Point", "IntersectionsCirCir")
+def point_intersections_circir(a):
+    circle1, circle2 = a.int_type.circle1, a.int_type.circle2
+    return _single_intersection(*intersection_circle_circle_batch(
+        circle1.center, circle1.radius, circle1.normal,
+        circle2.center, circle2.radius, circle2.normal
+    ))
+
+@batch_kernel("Point", "TranslationPV")
+def point_translation_pv(a):
+    return (a.point.coord + a.vector.vec,), True
+
+@batch_kernel("Point", "CentroidPPP")
+def point_centroid_ppp(a):
+    return ((a.point1.coord + a.point2.coord + a.point3.coord) / 3,), True
+
+@batch_kernel("Point", "CircumcenterPPP")
+def point_circumcenter_ppp(a):
+    _, center, valid = circumcenter_batch(a.point1.coord, a.point2.coord, a.point3.coord)
+    return (center,), valid
+
+@batch_kernel("Point", "IncenterPPP")
+def point_incenter_ppp(a):
+    _, center, valid = inscribed_batch(a.point1.coord, a.point2.coord, a.point3.coord)
+    return (center,), valid
+
+@batch_kernel("Point", "OrthocenterPPP")
+def point_orthocenter_ppp(a):
+    coord, valid = orthocenter_batch(a.point1.coord, a.point2.coord, a.point3.coord)
+    return (coord,), valid
+
+@batch_kernel("Point", "Cir")
+def point_cir(a):
+    return (a.circle.center,), True
+
+@batch_kernel("Point", "RotatePPA")
+def point_rotate_ppa(a):
+    axis = a.axis.vec if a.axis is not None else None
+    angle_num = ccw_angle(a.angle.angle, a.angle.turn)
+    coord, valid = point_3p_countclockwise_batch(a.point.coord, a.center.coord, angle_num, axis)
+    return (coord,), valid
+
+@batch_kernel("Point", "Root")
+def point_root(a):
+    index = a.index
+    coord = a.intersections.result_points[..., 3 * index:3 * index + 3]
+    return (coord,), ~np.isnan(coord[..., 0])
+
+# Line
+
+@batch_kernel("Line", "PP")
+def line_pp(a):
+    return (a.point1.coord, a.point2.coord), True
+
+@batch_kernel("Line", "PV")
+def line_pv(a):
+    return (a.start.coord, a.start.coord + a.vector.vec), True
+
+@batch_kernel("Line", "TranslationLV")
+def line_translation_lv(a):
+    return (a.line.start + a.vector.vec, a.line.end + a.vector.vec), True
+
+@batch_kernel("Line", "VerticalPL")
+def line_vertical_pl(a):
+    point, start, end = a.point.coord, a.line.start, a.line.end
+    on_line = is_point_on_line_batch(point, start, end)[..., None]
+    foot, _ = vertical_point_to_line_batch(point, start, end)
+    direction, direction_valid = vertical_line_unit_direction_batch(start, end)
+    line_start = np.where(on_line, point, foot)
+    line_end = np.where(on_line, point + direction, point)
+    return (line_start, line_end), np.where(on_line[..., 0], direction_valid, True)
+
+@batch_kernel("Line", "ParallelPL")
+def line_parallel_pl(a):
+    return (a.point.coord, a.point.coord + a.line.unit_direction * a.distance), True
+
+# Circle
+
+@batch_kernel("Circle", "CNR")
+def circle_cnr(a):
+    normal, valid = unit_normal_batch(a.normal.vec)
+    return (a.center.coord, a.radius, normal), valid
+
+@batch_kernel("Circle", "PR")
+def circle_pr(a):
+    normal, valid = unit_normal_batch(a.normal.vec if a.normal is not None else None)
+    return (a.center.coord, a.radius, normal), valid
+
+@batch_kernel("Circle", "PP")
+def circle_pp(a):
+    normal, valid = unit_normal_batch(a.normal.vec if a.normal is not None else None)
+    return (a.center.coord, norm_batch(a.point.coord - a.center.coord), normal), valid
+
+@batch_kernel("Circle", "L")
+def circle_l(a):
+    start, end = a.radius_segment.start, a.radius_segment.end
+    normal, valid = unit_normal_batch(a.normal.vec if a.normal is not None else None)
+    return (start, norm_batch(end - start), normal), valid
+
+@batch_kernel("Circle", "PPP")
+def circle_ppp(a):
+    p1, p2, p3 = a.point1.coord, a.point2.coord, a.point3.coord
+    radius, center, valid = circumcenter_batch(p1, p2, p3)
+    normal, normal_valid = plane_normal_batch(p1, p2, p3)
+    return (center, radius, normal), valid & normal_valid
+
+@batch_kernel("Circle", "TranslationCirV")
+def circle_translation_cirv(a):
+    return (a.circle.center + a.vector.vec, a.circle.radius, a.circle.normal), True
+
+@batch_kernel("Circle", "InverseCirCir")
+def circle_inverse_circir(a):
+    center, radius, normal, valid = inverse_circle_batch(
+        a.circle.center, a.circle.radius, a.circle.normal,
+        a.base_circle.center, a.base_circle.radius, a.base_circle.normal
+    )
+    return (center, radius, normal), valid
+
+@batch_kernel("Circle", "InscribePPP")
+def circle_inscribe_ppp(a):
+    p1, p2, p3 = a.point1.coord, a.point2.coord, a.point3.coord
+    radius, center, valid = inscribed_batch(p1, p2, p3)
+    normal, normal_valid = plane_normal_batch(p1, p2, p3)
+    return (center, radius, normal), valid & normal_valid
+
+# Angle
+
+@batch_kernel("Angle", "PPP")
+def angle_ppp(a):
+    angle, valid = angle_3p_countclockwise_batch(a.start.coord, a.center.coord, a.end.coord)
+    return (angle, TURN_CCW), valid
+
+@batch_kernel("Angle", "LL")
+def angle_ll(a):
+    same_start = np.all(close_batch(a.line1.start, a.line2.start), axis=-1)
+    angle, valid = angle_3p_countclockwise_batch(a.line1.end, a.line1.start, a.line2.end)
+    return (angle, TURN_CCW), valid & same_start
+
+@batch_kernel("Angle", "LP")
+def angle_lp(a):
+    angle, valid = angle_3p_countclockwise_batch(a.line.end, a.line.start, a.point.coord)
+    return (angle, TURN_CCW), valid
+
+@batch_kernel("Angle", "TurnA")
+def angle_turn_a(a):
+    return (2 * np.pi - a.angle.angle, -a.angle.turn), True
+
+@batch_kernel("Angle", "AddAA")
+def angle_add_aa(a):
+    an0 = ccw_angle(a.angle1.angle, a.angle1.turn)
+    an1 = ccw_angle(a.angle2.angle, a.angle2.turn)
+    return ((an0 + an1) % (2 * np.pi), TURN_CCW), True
+
+@batch_kernel("Angle", "SubAA")
+def angle_sub_aa(a):
+    an0 = ccw_angle(a.angle1.angle, a.angle1.turn)
+    an1 = ccw_angle(a.angle2.angle, a.angle2.turn)
+    return ((an0 - an1) % (2 * np.pi), TURN_CCW), True
+
+@batch_kernel("Angle", "MulNA")
+def angle_mul_na(a):
+    return ((a.factor * a.angle.angle) % (2 * np.pi), a.angle.turn), True
+
+# Vector
+
+@batch_kernel("Vector", "PP")
+def vector_pp(a):
+    return (a.end.coord - a.start.coord,), True
+
+@batch_kernel("Vector", "L")
+def vector_l(a):
+    return (a.line.end - a.line.start,), True
+
+@batch_kernel("Vector", "AddVV")
+def vector_add_vv(a):
+    return (a.vec1.vec + a.vec2.vec,), True
+
+@batch_kernel("Vector", "SubVV")
+def vector_sub_vv(a):
+    return (a.vec1.vec - a.vec2.vec,), True
+
+@batch_kernel("Vector", "MulNV")
+def vector_mul_nv(a):
+    return (a.factor * a.vec.vec,), True
+
+# Intersections
+# 单次计算中抛出异常的行（如重合的两圆）在批量计算中视为没有交点
+
+def _pack_roots_batch(a, points: np.ndarray, valid: np.ndarray):
+    """
+    将有效交点按顺序前移并展平，与单次计算的交点顺序一致
+
+    跟踪交点时将各行视为连续帧，从当前寄存器中的交点开始逐行分配槽位
+    """
+    if a.track:
+        previous = a.output.result_points[0].reshape(-1, 3)
+        points = track_roots_sequence(previous, points, valid)
+        packed = points.reshape(*points.shape[:-2], 3 * MAX_ROOTS)
+        return (packed, (~np.isnan(points[..., 0])).sum(axis=-1).astype(np.float64)), True
+
+    order = np.argsort(~valid, axis=-1, kind="stable")
+    points = np.take_along_axis(points, order[..., None], axis=-2)
+    packed = points.reshape(*points.shape[:-2], 3 * MAX_ROOTS)
+    return (packed, valid.sum(axis=-1).astype(np.float64)), True
+
+@batch_kernel("Intersections", "LL")
+def intersections_ll(a):
+    coord, valid = intersection_line_line_batch(
+        a.line1.start, a.line1.end,
+        a.line2.start, a.line2.end,
+        a.line1.line_type, a.line2.line_type,
+        a.as_infinity
+    )
+    points = np.stack([coord, np.full_like(coord, np.nan)], axis=-2)
+    return _pack_roots_batch(a, points, np.stack([valid, np.zeros_like(valid)], axis=-1))
+
+@batch_kernel("Intersections", "LCir")
+def intersections_lcir(a):
+    return _pack_roots_batch(a, *intersection_line_circle_batch(
+        a.line.start, a.line.end,
+        a.circle.center, a.circle.radius, a.circle.normal,
+        a.line.line_type, a.as_infinity
+    ))
+
+@batch_kernel("Intersections", "CirCir")
+def intersections_circir(a):
+    return _pack_roots_batch(a, *intersection_circle_circle_batch(
+        a.circle1.center, a.circle1.radius, a.circle1.normal,
+        a.circle2.center, a.circle2.radius, a.circle2.normal
+    ))
@@ -0,0 +1,219 @@
+"""
+批量构造的几何对象集合
+
+`GeometryArray` 以一个形如 (N, R) 的寄存器数组表示 N 个同类几何对象，
+寄存器布局与 `GeometryProgram` 一致，见 `LAYOUTS`。构造时直接调用批量计算核，
+不会创建 N 个 pydantic 模型
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional, Type
+from pydantic import BaseModel
+import numpy as np
+
+from ..components import (
+    BaseGeometry,
+    PointConstructArgsList,
+    LineConstructArgsList,
+    CircleConstructArgsList,
+    AngleConstructArgsList,
+    VectorConstructArgsList,
+    IntersectionsConstructArgsList,
+)
+from .batch_kernels import BATCH_KERNELS, BATCH_FINISHERS
+from .program import LAYOUTS, _KINDS, RegisterView, Slot, encode_attr, geometry_kind
+
+_ARGS_LISTS: Dict[str, List[Type[BaseModel]]] = {
+    "Point": PointConstructArgsList,
+    "Line": LineConstructArgsList,
+    "Circle": CircleConstructArgsList,
+    "Angle": AngleConstructArgsList,
+    "Vector": VectorConstructArgsList,
+    "Intersections": IntersectionsConstructArgsList,
+}
+
+def _layout_slots(kind: str) -> Dict[str, Slot]:
+    """获取单个对象的寄存器位置"""
+    slots: Dict[str, Slot] = {}
+    size = 0
+    for attr, length in LAYOUTS[kind].items():
+        slots[attr] = size if length == 1 else slice(size, size + length)
+        size += length
+    return slots
+
+def _args_model(kind: str, construct_type: str) -> Type[BaseModel]:
+    """按构造方式查找参数模型"""
+    for model in _ARGS_LISTS[kind]:
+        if model.model_fields["construct_type"].default == construct_type:
+            return model
+    raise ValueError(f"未知的构造方式: {kind}.{construct_type}")
+
+class GeometryArray:
+    """
+    N 个同类几何对象的集合
+
+    ```python
+    points = Point.FreeMany(np.random.rand(1000, 3))
+    edges = LineSegment.PPMany(points[i], points[j])
+    mids = Point.Many("MidPP", point1=points[i], point2=points[j])
+    mids.coord  # (len(i), 3)
+    ```
+
+    属性按 `LAYOUTS` 中的名称读取，向量属性形如 (N, 3)，标量属性形如 (N,)，
+    `turn` 以 `TURN_CCW` / `TURN_CW` 表示。返回值是 `registers` 的视图，不应原地修改
+
+    `valid` 记录每个对象是否构造成功，退化的行（如三点共线时的外心）以 NaN 填充，
+    其下游构造的对应行同样无效
+    """
+
+    def __init__(self, kind: str, registers: np.ndarray, valid: np.ndarray, static: Optional[Dict[str, Any]] = None):
+        """
+        - `kind`: 几何对象种类，如 `"Point"`
+        - `registers`: 形如 (N, R) 的寄存器数组
+        - `valid`: 形如 (N,) 的有效掩码
+        - `static`: 静态信息，如线类型 `line_type`
+        """
+        self.kind = kind
+        self.registers = registers
+        self.valid = valid
+        self.static = dict(static or {})
+        self._view = RegisterView(_layout_slots(kind), self.static)
+        self._view.bind(registers)
+
+    def __len__(self) -> int:
+        return self.registers.shape[0]
+
+    def __repr__(self) -> str:
+        return f"GeometryArray({self.kind}, {len(self)})"
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._view, name)
+
+    def __getitem__(self, index: Any) -> GeometryArray:
+        """
+        按下标、切片、下标数组或布尔掩码选取对象，返回新的集合
+
+        - `index`: 选取方式，同 numpy 在第一维上的索引
+        """
+        if isinstance(index, (int, np.integer)):
+            index = [index]
+        return GeometryArray(self.kind, self.registers[index], self.valid[index], self.static)
+
+    @classmethod
+    def from_objects(cls, objects: Iterable[BaseGeometry]) -> GeometryArray:
+        """
+        由已有的同类几何对象构造集合
+
+        - `objects`: 几何对象，计算失败的对象标记为无效
+        """
+        objects = list(objects)
+        if not objects:
+            raise ValueError("GeometryArray 至少需要一个几何对象")
+        kind = geometry_kind(objects[0])
+        static: Dict[str, Any] = {}
+        if kind == "Line":
+            static["line_type"] = objects[0].line_type
+        for obj in objects:
+            if geometry_kind(obj) != kind or (kind == "Line" and obj.line_type != static["line_type"]):
+                raise ValueError(f"GeometryArray 中的几何对象种类须一致: {obj.name}")
+
+        slots = _layout_slots(kind)
+        registers = np.full((len(objects), sum(LAYOUTS[kind].values())), np.nan)
+        valid = np.array([not obj.on_error for obj in objects], dtype=bool)
+        for row, obj in zip(registers, objects):
+            if obj.on_error:
+                continue
+            for attr, slot in slots.items():
+                row[slot] = encode_attr(attr, getattr(obj, attr))
+        return cls(kind, registers, valid, static)
+
+    @classmethod
+    def free(cls, coords: np.ndarray) -> GeometryArray:
+        """
+        构造 N 个自由点
+
+        - `coords`: 形如 (N, 3) 的坐标
+        """
+        coords = np.asarray(coords, dtype=np.float64)
+        if coords.ndim != 2 or coords.shape[1] != 3:
+            raise ValueError(f"GeometryArray 仅支持形如 (N, 3) 的三维坐标: {coords.shape}")
+        return cls("Point", coords.copy(), np.ones(coords.shape[0], dtype=bool))
+
+    @classmethod
+    def construct(cls, geometry_cls: Type[BaseGeometry], construct_type: str, **args: Any) -> GeometryArray:
+        """
+        以同一构造方式批量构造几何对象
+
+        - `geometry_cls`: 几何对象类，如 `Point`、`LineSegment`
+        - `construct_type`: 构造方式，与参数模型的 `construct_type` 一致，如 `"MidPP"`
+        - `args`: 构造参数，名称与参数模型的字段一致
+
+        几何参数可以是 `GeometryArray` 或单个几何对象，长度为 1 的参数广播到所有行；
+        其余参数（如 `factor`、`as_infinity`）对所有行相同。
+        不支持自由点以外的叶子构造与点的 `Intersections` 构造
+        """
+        kind = next((name for base, name in _KINDS if issubclass(geometry_cls, base)), None)
+        if kind is None:
+            raise NotImplementedError(f"GeometryArray 不支持的几何对象: {geometry_cls.__name__}")
+        if kind == "Point" and construct_type == "Free":
+            return cls.free(args["coord"])
+
+        static: Dict[str, Any] = {}
+        if kind == "Line":
+            line_type = geometry_cls.model_fields["line_type"].default
+            if not isinstance(line_type, str):
+                raise ValueError("批量构造线时需要指定线类型，如 LineSegment")
+            static["line_type"] = line_type
+        elif kind == "Intersections":
+            # 各行是相互独立的对象，而不是连续帧
+            static["track"] = False
+
+        kernel = BATCH_KERNELS.get((kind, construct_type))
+        if kernel is None:
+            raise NotImplementedError(f"GeometryArray 不支持的构造方式: {kind}.{construct_type}")
+
+        model = _args_model(kind, construct_type)
+        arrays: Dict[str, GeometryArray] = {}
+        fields: Dict[str, Any] = {}
+        for name, field in model.model_fields.items():
+            if name in args:
+                value = args[name]
+            elif field.is_required():
+                raise ValueError(f"缺少构造参数: {kind}.{construct_type}.{name}")
+            else:
+                value = field.get_default(call_default_factory=True)
+            if isinstance(value, BaseGeometry):
+                value = cls.from_objects([value])
+            if isinstance(value, GeometryArray):
+                arrays[name] = value
+            fields[name] = value
+        fields.update(static)
+
+        sizes = {len(array) for array in arrays.values()} - {1}
+        if len(sizes) > 1:
+            raise ValueError(f"批量构造的几何参数长度不一致: {sizes}")
+        n = sizes.pop() if sizes else 1
+
+        valid = np.ones(n, dtype=bool)
+        for name, array in arrays.items():
+            if len(array) != n:
+                array = GeometryArray(array.kind, np.broadcast_to(array.registers, (n, array.registers.shape[1])),
+                                      np.broadcast_to(array.valid, (n,)), array.static)
+            fields[name] = array._view
+            valid &= array.valid
+
+        registers = np.empty((n, sum(LAYOUTS[kind].values())))
+        with np.errstate(all="ignore"):
+            outputs, kernel_valid = kernel(SimpleNamespace(**fields))
+            finisher = BATCH_FINISHERS.get(kind)
+            if finisher is not None:
+                outputs = finisher(*outputs)
+        for slot, value in zip(_layout_slots(kind).values(), outputs):
+            registers[:, slot] = value
+        valid &= kernel_valid
+        registers[~valid] = np.nan
+        return cls(kind, registers, valid, static)
@@ -0,0 +1,390 @@
+"""
+GeometryProgram 使用的计算核
+
+每个计算核对应一种几何对象的一种构造方式，接收参数帧 `a`（字段结构与构造参数模型一致，
+其中几何对象被替换为寄存器视图，`a.output` 为该几何对象自身的寄存器视图），返回该几何对象的主要计算属性：
+
+- `Point`: `(coord,)`
+- `Line`: `(start, end)`
+- `Circle`: `(center, radius, normal)`
+- `Angle`: `(angle, turn)`
+- `Vector`: `(vec,)`
+- `Intersections`: `(result_points, num_results)`，交点坐标经 `pack_roots` 展平，
+  跟踪交点时按 `a.output` 中上一次的交点分配槽位
+
+派生属性（如线长度、圆面积）由 `finish_*` 函数统一补全。
+角度方向在寄存器中编码为浮点数，见 `TURN_CCW` 与 `TURN_CW`
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Tuple
+import numpy as np
+
+from ..math import (
+    close,
+    axisymmetric_point,
+    vertical_point_to_line,
+    vertical_line_unit_direction,
+    is_point_on_line,
+    inversion_point,
+    intersection_line_line,
+    intersection_line_circle,
+    intersection_circle_circle,
+    track_roots,
+    circumcenter,
+    inscribed,
+    orthocenter,
+    point_3p_countclockwise,
+    angle_3p_countclockwise,
+    inverse_circle,
+    plane_get_ABCD,
+)
+
+type Kernel = Callable[[Any], Tuple[Any, ...]]
+
+# 角度方向编码
+TURN_CCW = 1.0
+TURN_CW = -1.0
+
+# 交点节点至多保存的交点数量
+MAX_ROOTS = 2
+
+KERNELS: Dict[Tuple[str, str], Kernel] = {}
+
+def kernel(kind: str, construct_type: str):
+    """
+    注册计算核
+
+    - `kind`: 几何对象种类，如 `"Point"`
+    - `construct_type`: 构造方式
+    """
+    def decorator(func: Kernel) -> Kernel:
+        KERNELS[(kind, construct_type)] = func
+        return func
+    return decorator
+
+def ccw_angle(angle: Any, turn: Any) -> Any:
+    """将角度统一换算为逆时针方向"""
+    return np.where(turn > 0, angle, 2 * np.pi - angle)
+
+def unit_normal(normal: Any) -> np.ndarray:
+    """归一化法向量，缺省时为 XY 平面法向量"""
+    if normal is None:
+        return np.array([0.0, 0.0, 1.0])
+    return normal / np.linalg.norm(normal)
+
+def plane_normal(p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> np.ndarray:
+    """三点所在平面的单位法向量"""
+    A, B, C = plane_get_ABCD(p1, p2, p3)
+    normal_vec = np.array([A, B, C])
+    return normal_vec / np.linalg.norm(normal_vec)
+
+def pack_roots(points: np.ndarray) -> np.ndarray:
+    """将形如 (k, 3) 的交点展平为长度 `3 * MAX_ROOTS` 的数组，不足的部分以 NaN 填充"""
+    packed = np.full(3 * MAX_ROOTS, np.nan)
+    packed[:points.size] = points.ravel()
+    return packed
+
+def pack_intersections(a, points: np.ndarray) -> Tuple[np.ndarray, int]:
+    """打包交点节点的输出，跟踪交点时按上一次的交点分配槽位"""
+    if a.track:
+        points = track_roots(a.output.result_points.reshape(-1, 3), points, MAX_ROOTS)
+        return pack_roots(points), int((~np.isnan(points[:, 0])).sum())
+    return pack_roots(points), len(points)
+
+# 派生属性
+
+def finish_line(start: np.ndarray, end: np.ndarray) -> Tuple[Any, ...]:
+    """补全线长度与单位方向"""
+    length = float(np.linalg.norm(end - start))
+    unit_direction = (end - start) / length if not close(length, 0) else np.zeros(3)
+    return start, end, length, unit_direction
+
+def finish_vector(vec: np.ndarray) -> Tuple[Any, ...]:
+    """补全向量模长与单位方向"""
+    norm = float(np.linalg.norm(vec))
+    unit_direction = vec / norm if not close(norm, 0) else np.zeros(3)
+    return vec, norm, unit_direction
+
+def finish_circle(center: np.ndarray, radius: Any, normal: np.ndarray) -> Tuple[Any, ...]:
+    """补全圆面积与周长"""
+    return center, radius, normal, np.pi * radius ** 2, 2 * np.pi * radius
+
+FINISHERS: Dict[str, Callable[..., Tuple[Any, ...]]] = {
+    "Line": finish_line,
+    "Vector": finish_vector,
+    "Circle": finish_circle,
+}
+
+# Point
+
+@kernel("Point", "MidPP")
+def point_mid_pp(a):
+    return ((a.point1.coord + a.point2.coord) / 2,)
+
+@kernel("Point", "MidL")
+def point_mid_l(a):
+    return ((a.line.start + a.line.end) / 2,)
+
+@kernel("Point", "ExtensionPP")
+def point_extension_pp(a):
+    return (a.start.coord + a.factor * (a.through.coord - a.start.coord),)
+
+@kernel("Point", "AxisymmetricPL")
+def point_axisymmetric_pl(a):
+    return (axisymmetric_point(a.point.coord, a.line.start, a.line.end),)
+
+@kernel("Point", "VerticalPL")
+def point_vertical_pl(a):
+    return (vertical_point_to_line(a.point.coord, a.line.start, a.line.end),)
+
+@kernel("Point", "ParallelPL")
+def point_parallel_pl(a):
+    return (a.point.coord + a.distance * a.line.unit_direction,)
+
+@kernel("Point", "InversionPCir")
+def point_inversion_pcir(a):
+    return (inversion_point(a.point.coord, a.circle.center, a.circle.radius),)
+
+def _intersection_ll(line1, line2, as_infinity: bool) -> np.ndarray:
+    result = intersection_line_line(
+        line1.start, line1.end,
+        line2.start, line2.end,
+        line1.line_type, line2.line_type,
+        as_infinity
+    )
+    if result is None:
+        raise ValueError("两线无交点")
+    return result
+
+@kernel("Point", "IntersectionLL")
+def point_intersection_ll(a):
+    return (_intersection_ll(a.line1, a.line2, a.regard_infinite),)
+
+@kernel("Point", "IntersectionsLL")
+def point_intersections_ll(a):
+    int_type = a.int_type
+    return (_intersection_ll(int_type.line1, int_type.line2, int_type.as_infinity),)
+
+def _single_intersection(points: np.ndarray) -> np.ndarray:
+    if len(points) != 1:
+        raise ValueError(f"交点数量不为 1: {len(points)} 个交点")
+    return points[0]
+
+@kernel("Point", "IntersectionsLCir")
+def point_intersections_lcir(a):
+    line, circle = a.int_type.line, a.int_type.circle
+    points = intersection_line_circle(
+        line.start, line.end,
+        circle.center, circle.radius, circle.normal,
+        line.line_type, a.int_type.as_infinity
+    )
+    return (_single_intersection(points),)
+
+@kernel("Point", "IntersectionsCirCir")
+def point_intersections_circir(a):
+    circle1, circle2 = a.int_type.circle1, a.int_type.circle2
+    points = intersection_circle_circle(
+        circle1.center, circle1.radius, circle1.normal,
+        circle2.center, circle2.radius, circle2.normal
+    )
+    return (_single_intersection(points),)
+
+@kernel("Point", "TranslationPV")
+def point_translation_pv(a):
+    return (a.point.coord + a.vector.vec,)
+
+@kernel("Point", "CentroidPPP")
+def point_centroid_ppp(a):
+    return ((a.point1.coord + a.point2.coord + a.point3.coord) / 3,)
+
+@kernel("Point", "CircumcenterPPP")
+def point_circumcenter_ppp(a):
+    _, center = circumcenter(a.point1.coord, a.point2.coord, a.point3.coord)
+    return (center,)
+
+@kernel("Point", "IncenterPPP")
+def point_incenter_ppp(a):
+    _, center = inscribed(a.point1.coord, a.point2.coord, a.point3.coord)
+    return (center,)
+
+@kernel("Point", "OrthocenterPPP")
+def point_orthocenter_ppp(a):
+    return (orthocenter(a.point1.coord, a.point2.coord, a.point3.coord),)
+
+@kernel("Point", "Cir")
+def point_cir(a):
+    return (a.circle.center,)
+
+@kernel("Point", "RotatePPA")
+def point_rotate_ppa(a):
+    axis = a.axis.vec if a.axis is not None else np.array([0.0, 0.0, 1.0])
+    angle_num = float(ccw_angle(a.angle.angle, a.angle.turn))
+    return (point_3p_countclockwise(a.point.coord, a.center.coord, angle_num, axis),)
+
+@kernel("Point", "Root")
+def point_root(a):
+    index = a.index
+    coord = a.intersections.result_points[3 * index:3 * index + 3]
+    # 不存在的交点为 NaN
+    if np.isnan(coord[0]):
+        raise ValueError(f"交点 {index} 不存在")
+    return (coord,)
+
+# Line
+
+@kernel("Line", "PP")
+def line_pp(a):
+    return a.point1.coord, a.point2.coord
+
+@kernel("Line", "PV")
+def line_pv(a):
+    return a.start.coord, a.start.coord + a.vector.vec
+
+@kernel("Line", "TranslationLV")
+def line_translation_lv(a):
+    return a.line.start + a.vector.vec, a.line.end + a.vector.vec
+
+@kernel("Line", "VerticalPL")
+def line_vertical_pl(a):
+    if not is_point_on_line(a.point.coord, a.line.start, a.line.end):
+        return vertical_point_to_line(a.point.coord, a.line.start, a.line.end), a.point.coord
+    direction = vertical_line_unit_direction(a.line.start, a.line.end)
+    return a.point.coord, a.point.coord + direction
+
+@kernel("Line", "ParallelPL")
+def line_parallel_pl(a):
+    return a.point.coord, a.point.coord + a.line.unit_direction * a.distance
+
+# Circle
+
+@kernel("Circle", "CNR")
+def circle_cnr(a):
+    return a.center.coord, a.radius, unit_normal(a.normal.vec)
+
+@kernel("Circle", "PR")
+def circle_pr(a):
+    return a.center.coord, a.radius, unit_normal(a.normal.vec if a.normal is not None else None)
+
+@kernel("Circle", "PP")
+def circle_pp(a):
+    radius = np.linalg.norm(a.point.coord - a.center.coord)
+    return a.center.coord, radius, unit_normal(a.normal.vec if a.normal is not None else None)
+
+@kernel("Circle", "L")
+def circle_l(a):
+    start, end = a.radius_segment.start, a.radius_segment.end
+    return start, np.linalg.norm(end - start), unit_normal(a.normal.vec if a.normal is not None else None)
+
+@kernel("Circle", "PPP")
+def circle_ppp(a):
+    p1, p2, p3 = a.point1.coord, a.point2.coord, a.point3.coord
+    radius, center = circumcenter(p1, p2, p3)
+    return center, radius, plane_normal(p1, p2, p3)
+
+@kernel("Circle", "TranslationCirV")
+def circle_translation_cirv(a):
+    return a.circle.center + a.vector.vec, a.circle.radius, a.circle.normal
+
+@kernel("Circle", "InverseCirCir")
+def circle_inverse_circir(a):
+    center, radius, normal = inverse_circle(
+        a.circle.center, a.circle.radius, a.circle.normal,
+        a.base_circle.center, a.base_circle.radius, a.base_circle.normal
+    )
+    return center, radius, normal
+
+@kernel("Circle", "InscribePPP")
+def circle_inscribe_ppp(a):
+    p1, p2, p3 = a.point1.coord, a.point2.coord, a.point3.coord
+    radius, center = inscribed(p1, p2, p3)
+    return center, radius, plane_normal(p1, p2, p3)
+
+# Angle
+
+@kernel("Angle", "PPP")
+def angle_ppp(a):
+    return angle_3p_countclockwise(a.start.coord, a.center.coord, a.end.coord), TURN_CCW
+
+@kernel("Angle", "LL")
+def angle_ll(a):
+    if not np.allclose(a.line1.start, a.line2.start):
+        raise ValueError("无法从起始点不等的两条线构造角")
+    return angle_3p_countclockwise(a.line1.end, a.line1.start, a.line2.end), TURN_CCW
+
+@kernel("Angle", "LP")
+def angle_lp(a):
+    return angle_3p_countclockwise(a.line.end, a.line.start, a.point.coord), TURN_CCW
+
+@kernel("Angle", "TurnA")
+def angle_turn_a(a):
+    return 2 * np.pi - a.angle.angle, -a.angle.turn
+
+@kernel("Angle", "AddAA")
+def angle_add_aa(a):
+    an0 = ccw_angle(a.angle1.angle, a.angle1.turn)
+    an1 = ccw_angle(a.angle2.angle, a.angle2.turn)
+    return (an0 + an1) % (2 * np.pi), TURN_CCW
+
+@kernel("Angle", "SubAA")
+def angle_sub_aa(a):
+    an0 = ccw_angle(a.angle1.angle, a.angle1.turn)
+    an1 = ccw_angle(a.angle2.angle, a.angle2.turn)
+    return (an0 - an1) % (2 * np.pi), TURN_CCW
+
+@kernel("Angle", "MulNA")
+def angle_mul_na(a):
+    return (a.factor * a.angle.angle) % (2 * np.pi), a.angle.turn
+
+# Vector
+
+@kernel("Vector", "PP")
+def vector_pp(a):
+    return (a.end.coord - a.start.coord,)
+
+@kernel("Vector", "L")
+def vector_l(a):
+    return (a.line.end - a.line.start,)
+
+@kernel("Vector", "AddVV")
+def vector_add_vv(a):
+    return (a.vec1.vec + a.vec2.vec,)
+
+@kernel("Vector", "SubVV")
+def vector_sub_vv(a):
+    return (a.vec1.vec - a.vec2.vec,)
+
+@kernel("Vector", "MulNV")
+def vector_mul_nv(a):
+    return (a.factor * a.vec.vec,)
+
+# Intersections
+
+@kernel("Intersections", "LL")
+def intersections_ll(a):
+    result = intersection_line_line(
+        a.line1.start, a.line1.end,
+        a.line2.start, a.line2.end,
+        a.line1.line_type, a.line2.line_type,
+        a.as_infinity
+    )
+    points = np.empty((0, 3)) if result is None else result[None]
+    return pack_intersections(a, points)
+
+@kernel("Intersections", "LCir")
+def intersections_lcir(a):
+    points = intersection_line_circle(
+        a.line.start, a.line.end,
+        a.circle.center, a.circle.radius, a.circle.normal,
+        a.line.line_type, a.as_infinity
+    )
+    return pack_intersections(a, points)
+
+@kernel("Intersections", "CirCir")
+def intersections_circir(a):
+    points = intersection_circle_circle(
+        a.circle1.center, a.circle1.radius, a.circle1.normal,
+        a.circle2.center, a.circle2.radius, a.circle2.normal
+    )
+    return pack_intersections(a, points)
@@ -0,0 +1,446 @@
+"""
+将几何构造图编译为扁平的指令序列
+
+编译后的程序在一个连续的 float64 寄存器数组上按拓扑顺序执行计算核，
+绕过 pydantic 对象、适配器中的 `match` 分派以及 `bind_attributes` 的逐属性赋值
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
+from pydantic import BaseModel
+import numpy as np
+
+from ..components import BaseGeometry, Point, Line, Circle, Angle, Vector, Intersections
+from .kernels import KERNELS, FINISHERS, TURN_CCW, TURN_CW, MAX_ROOTS, pack_roots
+from .batch_kernels import BATCH_KERNELS, BATCH_FINISHERS
+from ..math import trusted_math
+
+# 日志
+import logging
+logger = logging.getLogger(__name__)
+
+type Slot = Union[int, slice]
+
+# 各类几何对象的计算属性及其在寄存器中占用的长度
+LAYOUTS: Dict[str, Dict[str, int]] = {
+    "Point": {"coord": 3},
+    "Line": {"start": 3, "end": 3, "length": 1, "unit_direction": 3},
+    "Circle": {"center": 3, "radius": 1, "normal": 3, "area": 1, "circumference": 1},
+    "Angle": {"angle": 1, "turn": 1},
+    "Vector": {"vec": 3, "norm": 1, "unit_direction": 3},
+    # 交点按顺序展平存放，不足 MAX_ROOTS 个时以 NaN 填充
+    "Intersections": {"result_points": 3 * MAX_ROOTS, "num_results": 1},
+}
+
+_KINDS = ((Point, "Point"), (Line, "Line"), (Circle, "Circle"), (Angle, "Angle"), (Vector, "Vector"), (Intersections, "Intersections"))
+
+def geometry_kind(obj: BaseGeometry) -> str:
+    """获取几何对象种类，不支持的对象抛出 `NotImplementedError`"""
+    for cls, kind in _KINDS:
+        if isinstance(obj, cls):
+            return kind
+    raise NotImplementedError(f"GeometryProgram 不支持的几何对象: {type(obj).__name__}")
+
+def encode_attr(attr: str, value: Any) -> Any:
+    """将几何对象的属性值编码为寄存器中的数值"""
+    if attr == "turn":
+        return TURN_CCW if value == "Counterclockwise" else TURN_CW
+    if attr == "result_points":
+        return pack_roots(value)
+    return value
+
+def upstream_order(objects: Iterable[BaseGeometry]) -> List[BaseGeometry]:
+    """
+    收集 `objects` 及其全部上游对象，并按拓扑顺序返回
+
+    - `objects`: 需要计算的几何对象
+    """
+    visited: set[int] = set()
+    order: List[BaseGeometry] = []
+    for obj in objects:
+        if id(obj) in visited:
+            continue
+        visited.add(id(obj))
+        stack = [(obj, iter(obj.dependencies))]
+        while stack:
+            current, parents = stack[-1]
+            for parent in parents:
+                if id(parent) not in visited:
+                    visited.add(id(parent))
+                    stack.append((parent, iter(parent.dependencies)))
+                    break
+            else:
+                stack.pop()
+                order.append(current)
+    return order
+
+class RegisterView:
+    """
+    几何对象在寄存器数组上的只读视图
+
+    向量属性直接返回寄存器的 numpy 视图，标量属性按下标读取，
+    线类型等静态信息在编译时确定
+    """
+    __slots__ = ("_slots", "_static", "_values")
+
+    def __init__(self, slots: Dict[str, Slot], static: Dict[str, Any]):
+        self._slots = slots
+        self._static = static
+        self._values: Dict[str, Any] = {}
+
+    def bind(self, registers: np.ndarray):
+        """
+        绑定寄存器数组，寄存器数组被替换后需要重新绑定
+
+        - `registers`: 寄存器数组，最后一维为寄存器下标
+        """
+        self._values = {
+            name: registers[..., slot] if isinstance(slot, slice) else _ScalarRegister(registers, slot)
+            for name, slot in self._slots.items()
+        }
+
+    def __getattr__(self, name: str) -> Any:
+        value = self._values.get(name)
+        if value is not None:
+            return value.read() if isinstance(value, _ScalarRegister) else value
+        try:
+            return self._static[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+class _ScalarRegister:
+    """标量寄存器，读取时取当前值"""
+    __slots__ = ("registers", "index")
+
+    def __init__(self, registers: np.ndarray, index: int):
+        self.registers = registers
+        self.index = index
+
+    def read(self) -> Any:
+        return self.registers[..., self.index]
+
+class Instruction(NamedTuple):
+    """单条指令：计算核、参数帧与输出寄存器"""
+    index: int
+    kernel: Callable[[Any], Tuple[Any, ...]]
+    batch_kernel: Callable[[Any], Tuple[Tuple[Any, ...], Any]]
+    frame: SimpleNamespace
+    finisher: Optional[Callable[..., Tuple[Any, ...]]]
+    batch_finisher: Optional[Callable[..., Tuple[Any, ...]]]
+    out_slots: Tuple[Slot, ...]
+    deps: Tuple[int, ...]
+
+class GeometryProgram:
+    """
+    扁平化的几何构造程序
+
+    ```python
+    program = GeometryProgram.compile([circle, P])
+    program.run({A: np.array([1.0, 2.0, 0.0])})
+    program.get(circle, "radius")
+    ```
+
+    编译时读取所有对象的当前值作为寄存器初值，没有依赖的对象（如自由点）作为输入，
+    其余对象各对应一条指令。执行失败的指令不会抛出异常，其下游指令被跳过，见 `on_error`
+
+    `run_batch` 可以一次性对 N 组输入执行同一程序，见 `BatchResult`
+    """
+
+    def __init__(self):
+        self.objects: List[BaseGeometry] = []
+        self.registers: np.ndarray = np.zeros(0)
+        self.instructions: List[Instruction] = []
+        self.errors: List[bool] = []
+        self._index: Dict[int, int] = {}
+        self._kinds: List[str] = []
+        self._slots: List[Dict[str, Slot]] = []
+        self._views: List[RegisterView] = []
+
+    @classmethod
+    def compile(cls, objects: Iterable[BaseGeometry]) -> GeometryProgram:
+        """
+        编译几何对象及其全部上游对象
+
+        - `objects`: 需要计算的几何对象
+
+        仅支持三维坐标的 `Point`、`Line`、`Circle`、`Angle`、`Vector` 与 `Intersections`，
+        `Point` 的交点构造需恰有一个交点
+        """
+        program = cls()
+        program.objects = upstream_order(objects)
+        program._index = {id(obj): i for i, obj in enumerate(program.objects)}
+        program.errors = [obj.on_error for obj in program.objects]
+
+        # 分配寄存器
+        size = 0
+        for obj in program.objects:
+            kind = geometry_kind(obj)
+            slots: Dict[str, Slot] = {}
+            for attr, length in LAYOUTS[kind].items():
+                slots[attr] = size if length == 1 else slice(size, size + length)
+                size += length
+            static: Dict[str, Any] = {"name": obj.name}
+            if kind == "Line":
+                static["line_type"] = obj.line_type
+            elif kind == "Intersections":
+                static["track"] = obj.args.track
+            program._kinds.append(kind)
+            program._slots.append(slots)
+            program._views.append(RegisterView(slots, static))
+
+        program.registers = np.zeros(size)
+        for view in program._views:
+            view.bind(program.registers)
+        program.read_sources(all_objects=True)
+
+        # 生成指令
+        for i, obj in enumerate(program.objects):
+            if not obj.dependencies:
+                continue
+            kind = program._kinds[i]
+            construct_type = obj.adapter.construct_type
+            if construct_type == "Intersections":
+                # 交点按交点类型分派，如 IntersectionsLCir
+                construct_type += type(obj.args.int_type).__name__
+            kernel = KERNELS.get((kind, construct_type))
+            if kernel is None:
+                raise NotImplementedError(f"GeometryProgram 不支持的构造方式: {kind}.{construct_type}")
+
+            frame = program._frame(obj.args)
+            frame.output = program._views[i]
+            program.instructions.append(Instruction(
+                index=i,
+                kernel=kernel,
+                batch_kernel=BATCH_KERNELS[(kind, construct_type)],
+                frame=frame,
+                finisher=FINISHERS.get(kind),
+                batch_finisher=BATCH_FINISHERS.get(kind),
+                out_slots=tuple(program._slots[i].values()),
+                deps=tuple(program._index[id(dep)] for dep in obj.dependencies),
+            ))
+
+        return program
+
+    def _frame(self, args: BaseModel) -> SimpleNamespace:
+        """构造参数帧，几何对象被替换为寄存器视图"""
+        fields: Dict[str, Any] = {}
+        for name in type(args).model_fields:
+            value = getattr(args, name)
+            if isinstance(value, BaseGeometry):
+                fields[name] = self._views[self._index[id(value)]]
+            elif isinstance(value, BaseModel):
+                fields[name] = self._frame(value)
+            else:
+                fields[name] = value
+        return SimpleNamespace(**fields)
+
+    def read_sources(self, all_objects: bool = False):
+        """
+        从几何对象读取输入寄存器的值
+
+        - `all_objects`: 是否读取全部对象，默认为 False，仅读取没有依赖的输入对象
+        """
+        for i, obj in enumerate(self.objects):
+            if obj.dependencies and not all_objects:
+                continue
+            for attr, slot in self._slots[i].items():
+                value = encode_attr(attr, getattr(obj, attr))
+                if attr != "result_points" and isinstance(value, np.ndarray) and value.shape != (3,):
+                    raise ValueError(f"GeometryProgram 仅支持三维坐标: {obj.name}.{attr} = {value}")
+                self.registers[..., slot] = value
+
+    def slot(self, obj: BaseGeometry, attr: str) -> Slot:
+        """
+        获取几何对象计算属性所在的寄存器位置
+
+        - `obj`: 几何对象
+        - `attr`: 属性名称
+        """
+        index = self._index.get(id(obj))
+        if index is None:
+            raise KeyError(f"几何对象 {obj.name} 不在程序中")
+        return self._slots[index][attr]
+
+    def _input_slot(self, point: BaseGeometry) -> Slot:
+        """获取输入点的坐标寄存器位置"""
+        if not isinstance(point, Point) or point.dependencies:
+            raise ValueError(f"只有没有依赖的点可以作为程序输入: {point.name}")
+        return self.slot(point, "coord")
+
+    def run(self, inputs: Optional[Mapping[BaseGeometry, np.ndarray]] = None) -> bool:
+        """
+        执行程序
+
+        - `inputs`: 输入点及其新坐标，未给出的输入保持上一次的值
+
+        Returns: 是否所有指令均执行成功
+        """
+        registers = self.registers
+        if inputs:
+            for point, coord in inputs.items():
+                registers[self._input_slot(point)] = coord
+
+        errors = self.errors
+        ok = True
+        # 寄存器均为 float64，计算函数无需再检查参数类型
+        with trusted_math():
+            for ins in self.instructions:
+                failed = False
+                for dep in ins.deps:
+                    if errors[dep]:
+                        failed = True
+                        break
+                if not failed:
+                    try:
+                        outputs = ins.kernel(ins.frame)
+                        if ins.finisher is not None:
+                            outputs = ins.finisher(*outputs)
+                    except Exception:
+                        logger.debug(f"指令 {self.objects[ins.index].name} 执行失败", exc_info=True)
+                        failed = True
+                if failed:
+                    errors[ins.index] = True
+                    ok = False
+                    continue
+
+                for slot, value in zip(ins.out_slots, outputs):
+                    registers[slot] = value
+                errors[ins.index] = False
+
+        return ok
+
+    def run_batch(self, inputs: Mapping[BaseGeometry, np.ndarray]) -> BatchResult:
+        """
+        对 N 组输入批量执行程序
+
+        - `inputs`: 输入点及其形如 (N, 3) 的坐标，未给出的输入在所有行中保持当前值
+
+        每条指令在批量维度上向量化执行，退化的行（如三点共线时的外心）被标记为无效，
+        其下游对象的对应行同样无效。不会修改 `registers` 与 `errors`
+
+        Returns: `BatchResult`, 批量执行结果
+        """
+        coords = {point: np.asarray(coord, dtype=np.float64) for point, coord in inputs.items()}
+        sizes = {coord.shape[0] for coord in coords.values() if coord.ndim == 2}
+        if len(sizes) != 1:
+            raise ValueError(f"批量输入的坐标须为形状一致的 (N, 3) 数组: {sizes}")
+        n = sizes.pop()
+
+        registers = np.tile(self.registers, (n, 1))
+        for point, coord in coords.items():
+            registers[:, self._input_slot(point)] = coord
+
+        valid = np.empty((len(self.objects), n), dtype=bool)
+        for i, error in enumerate(self.errors):
+            valid[i] = not error
+
+        for view in self._views:
+            view.bind(registers)
+        try:
+            with np.errstate(all="ignore"):
+                for ins in self.instructions:
+                    row_valid = np.ones(n, dtype=bool)
+                    for dep in ins.deps:
+                        row_valid &= valid[dep]
+                    try:
+                        outputs, kernel_valid = ins.batch_kernel(ins.frame)
+                        if ins.batch_finisher is not None:
+                            outputs = ins.batch_finisher(*outputs)
+                        for slot, value in zip(ins.out_slots, outputs):
+                            registers[:, slot] = value
+                        row_valid &= kernel_valid
+                    except Exception:
+                        logger.debug(f"指令 {self.objects[ins.index].name} 批量执行失败", exc_info=True)
+                        row_valid[:] = False
+
+                    valid[ins.index] = row_valid
+                    if not row_valid.all():
+                        for slot in ins.out_slots:
+                            registers[~row_valid, slot] = np.nan
+        finally:
+            for view in self._views:
+                view.bind(self.registers)
+
+        return BatchResult(self, registers, valid)
+
+    def on_error(self, obj: BaseGeometry) -> bool:
+        """几何对象在最近一次执行中是否计算失败"""
+        return self.errors[self._index[id(obj)]]
+
+    def get(self, obj: BaseGeometry, attr: str) -> Any:
+        """
+        读取几何对象的计算属性
+
+        - `obj`: 几何对象
+        - `attr`: 属性名称
+        """
+        value = self.registers[self.slot(obj, attr)]
+        if attr == "turn":
+            return "Counterclockwise" if value > 0 else "Clockwise"
+        if attr == "num_results":
+            return int(value)
+        if attr == "result_points":
+            points = value.reshape(-1, 3)
+            # 跟踪交点时保留全部槽位
+            return points.copy() if self._views[self._index[id(obj)]].track else points[:self.get(obj, "num_results")].copy()
+        return value.copy() if isinstance(value, np.ndarray) else float(value)
+
+    def apply(self):
+        """
+        将寄存器中的计算结果写回几何对象
+
+        仅写入属性与 `on_error` 标记，不会触发更新传播。自由点的构造参数同时被设置
+        """
+        for i, obj in enumerate(self.objects):
+            if obj.dirty:
+                obj._clear_dirty()
+            obj.on_error = self.errors[i]
+            obj._bump_version()
+            if self.errors[i]:
+                continue
+            for attr in self._slots[i]:
+                setattr(obj, attr, self.get(obj, attr))
+            if not obj.dependencies and obj.adapter.construct_type == "Free":
+                # 自由点的构造参数同步为新坐标，之后的 update 不会恢复旧坐标
+                obj.adapter.args.coord = obj.coord.copy()
+
+class BatchResult:
+    """
+    `GeometryProgram.run_batch` 的执行结果
+
+    `registers` 形如 (N, R)，每行对应一组输入；`valid` 形如 (对象数, N)，
+    记录每个对象在每一行中是否计算成功
+    """
+
+    def __init__(self, program: GeometryProgram, registers: np.ndarray, valid: np.ndarray):
+        self.program = program
+        self.registers = registers
+        self._valid = valid
+
+    def __len__(self) -> int:
+        return self.registers.shape[0]
+
+    def valid(self, obj: BaseGeometry) -> np.ndarray:
+        """几何对象在每一行中是否计算成功，形如 (N,)"""
+        return self._valid[self.program._index[id(obj)]].copy()
+
+    def get(self, obj: BaseGeometry, attr: str) -> np.ma.MaskedArray:
+        """
+        读取几何对象的计算属性
+
+        - `obj`: 几何对象
+        - `attr`: 属性名称
+
+        Returns: 形如 (N,) 或 (N, 3) 的掩码数组，计算失败的行被遮盖。
+        交点坐标 `result_points` 形如 (N, MAX_ROOTS, 3)，不存在的交点以 NaN 填充
+        """
+        value = self.registers[:, self.program.slot(obj, attr)]
+        invalid = ~self.valid(obj)
+        if attr == "turn":
+            value = np.where(value > 0, "Counterclockwise", "Clockwise")
+        elif attr == "result_points":
+            value = value.reshape(len(self), -1, 3)
+        mask = np.broadcast_to(invalid.reshape(-1, *[1] * (value.ndim - 1)), value.shape)
+        return np.ma.masked_array(value, mask=mask.copy())
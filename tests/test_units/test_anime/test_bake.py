@@ -0,0 +1,146 @@
+import numpy as np
+import pytest
+
+from manimgeo.components import *
+from manimgeo.anime.bake import BakedGeometry
+
+def circle_motion(t: np.ndarray) -> np.ndarray:
+    return np.stack([1 + np.cos(t), 3 + np.sin(t), np.zeros_like(t)], axis=1)
+
+@pytest.fixture
+def construction():
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([4, 0, 0]), "B")
+    C = Point.Free(np.array([2, 4, 0]), "C")
+    circle = Circle.PPP(A, B, C, "circle")
+    line = LineSegment.PP(A, B, "line")
+    angle = Angle.PPP(A, B, C, "angle")
+    intersections = Intersections.LCir(line, circle, as_infinity=True, name="I")
+    return A, B, C, circle, line, angle, intersections
+
+def test_bake_matches_updates(construction):
+    A, B, C, circle, line, angle, intersections = construction
+    baked = BakedGeometry.bake([circle, angle, intersections], {C: circle_motion}, duration=2, fps=10)
+    assert len(baked) == 21 and baked.duration == 2
+    assert baked.get(intersections, "result_points").shape == (21, 2, 3)
+    # 预计算不会移动自由点
+    assert np.allclose(C.coord, [2, 4, 0])
+
+    for frame in (0, 7, 20):
+        C.set_coord(circle_motion(np.array([frame / 10]))[0])
+        expected = circle.center.copy(), circle.radius, angle.angle, angle.turn, intersections.result_points.copy()
+        assert np.allclose(baked.get(circle, "center")[frame], expected[0])
+        assert np.isclose(baked.get(circle, "radius")[frame], expected[1])
+
+        C.set_coord(np.array([2, 4, 0]))
+        assert baked.apply_time(frame / 10) == frame
+        assert np.allclose(C.coord, C.adapter.args.coord)
+        assert np.allclose(circle.center, expected[0])
+        assert np.isclose(circle.radius, expected[1])
+        assert np.isclose(angle.angle, expected[2]) and angle.turn == expected[3]
+        assert np.allclose(intersections.result_points, expected[4])
+
+    # 超出范围时取首帧或末帧
+    assert baked.frame_index(-1) == 0 and baked.frame_index(10) == 20
+
+def test_bake_invalid_frames(construction):
+    A, B, C, circle, line, angle, intersections = construction
+    # 第 1 帧三点共线
+    motion = np.array([[2, 4, 0], [2, 0, 0], [2, -4, 0]], dtype=float)
+    baked = BakedGeometry.bake([circle], {C: motion}, duration=2, fps=1)
+    assert baked.valid_frames(circle).tolist() == [True, False, True]
+    assert np.isnan(baked.get(circle, "radius")[1])
+
+    baked.apply_frame(1)
+    assert circle.on_error
+    baked.apply_frame(2)
+    assert not circle.on_error and np.allclose(circle.center, [2, -1.5, 0])
+
+    with pytest.raises(ValueError):
+        BakedGeometry.bake([circle], {C: motion[:2]}, duration=2, fps=1)
+    with pytest.raises(ValueError):
+        BakedGeometry.bake([circle], {circle.args.point1: motion, Point.MidPP(A, B): motion}, duration=2, fps=1)
+
+def test_bake_steps():
+    # 二维坐标不受 GeometryProgram 支持，逐帧计算
+    A = Point.Free(np.array([0.0, 0.0]), "A")
+    B = Point.Free(np.array([4.0, 0.0]), "B")
+    M = Point.MidPP(A, B, "M")
+    line = LineSegment.PP(A, M, "AM")
+    motion = np.stack([np.arange(5.0), np.ones(5)], axis=1)
+    baked = BakedGeometry.bake([line], {B: motion}, duration=4, fps=1)
+
+    assert np.allclose(baked.get(M, "coord"), motion / 2)
+    assert np.allclose(baked.get(line, "length"), np.linalg.norm(motion / 2, axis=1))
+    assert np.allclose(B.coord, [4, 0]) and np.allclose(M.coord, [2, 0])
+
+    baked.apply_frame(3)
+    assert np.allclose(M.coord, [1.5, 0.5]) and np.allclose(line.end, [1.5, 0.5])
+
+def test_bake_steps_invalid_frames():
+    # 二维坐标逐帧计算，第 1 帧三点共线，外心计算抛出异常
+    A = Point.Free(np.array([0.0, 0.0]), "A")
+    B = Point.Free(np.array([4.0, 0.0]), "B")
+    C = Point.Free(np.array([2.0, 4.0]), "C")
+    O = Point.CircumcenterPPP(A, B, C, "O")
+    M = Point.MidPP(A, C, "M")
+    motion = np.array([[2, 4], [2, 0], [2, -4]], dtype=float)
+    baked = BakedGeometry.bake([O, M], {C: motion}, duration=2, fps=1)
+
+    assert baked.valid_frames(O).tolist() == [True, False, True]
+    assert baked.valid_frames(M).all() and np.allclose(baked.get(M, "coord")[1], [1, 0])
+    assert np.isnan(baked.get(O, "coord")[1]).all() and np.allclose(baked.get(O, "coord")[2], [2, -1.5])
+    assert np.allclose(C.coord, [2, 4]) and not O.on_error
+
+def test_bake_steps_unexpected_error(monkeypatch):
+    # 没有对象被标记错误的异常不是计算错误，照常抛出
+    A = Point.Free(np.array([0.0, 0.0]), "A")
+    M = Point.MidPP(A, Point.Free(np.array([4.0, 0.0])), "M")
+    def broken(self, coord):
+        raise RuntimeError("broken")
+    monkeypatch.setattr(Point, "set_coord", broken)
+    with pytest.raises(RuntimeError):
+        BakedGeometry.bake([M], {A: np.zeros((2, 2))}, duration=1, fps=1)
+
+def test_trajectory_store(construction, tmp_path, monkeypatch):
+    from manimgeo.anime import store as store_module
+    from manimgeo.anime.store import TrajectoryStore
+
+    A, B, C, circle, line, angle, intersections = construction
+    store = TrajectoryStore(tmp_path)
+    assert store.load([circle, intersections], {C: circle_motion}, duration=2, fps=10) is None
+
+    baked = store.bake([circle, intersections], {C: circle_motion}, duration=2, fps=10, chunk=4)
+    expected = BakedGeometry.bake([circle, intersections], {C: circle_motion}, duration=2, fps=10)
+    assert isinstance(baked.get(circle, "radius"), np.memmap)
+    for obj in (C, circle, intersections):
+        for attr, values in expected.tracks[expected._index[id(obj)]].items():
+            assert np.allclose(baked.get(obj, attr), values, equal_nan=True)
+        assert (baked.valid_frames(obj) == expected.valid_frames(obj)).all()
+
+    baked.apply_frame(5)
+    assert np.isclose(circle.radius, expected.get(circle, "radius")[5])
+
+    # 相同构造直接映射，不再计算
+    monkeypatch.setattr(store_module, "_fill", None)
+    again = store.bake([circle, intersections], {C: circle_motion}, duration=2, fps=10)
+    assert np.allclose(again.get(circle, "center"), baked.get(circle, "center"))
+    assert store.load([circle, intersections], {C: circle_motion}, duration=2, fps=20) is None
+    assert store.load([circle, intersections], {C: lambda t: circle_motion(2 * t)}, duration=2, fps=10) is None
+    assert len(list(tmp_path.iterdir())) == 1
+
+def test_apply_frame_versions(construction):
+    A, B, C, circle, line, angle, intersections = construction
+    baked = BakedGeometry.bake([circle, line], {C: circle_motion}, duration=2, fps=10)
+    baked.apply_frame(0)
+    versions = {obj.name: obj.version for obj in (A, line, C, circle)}
+
+    # 不随运动变化的对象被跳过，版本号不变
+    baked.apply_frame(1)
+    assert line.version == versions["line"] and A.version == versions["A"]
+    assert C.version != versions["C"] and circle.version != versions["circle"]
+
+    # 对象在两次写入之间被修改时重新写入
+    A.set_coord(np.array([1, 0, 0]))
+    baked.apply_frame(2)
+    assert np.allclose(A.coord, [0, 0, 0]) and np.allclose(line.start, [0, 0, 0])
@@ -0,0 +1,125 @@
+import importlib
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from manimgeo.components import *
+
+pytestmark = pytest.mark.skipif(sys.version_info < (3, 12), reason="janim 要求 Python >= 3.12")
+
+class StubPoints:
+    """仅记录位置的 VItem.points 替身"""
+
+    def __init__(self):
+        self.center = np.zeros(3)
+        self.radius = 1.0
+
+    @property
+    def box(self):
+        return types.SimpleNamespace(center=self.center.copy())
+
+    def move_to(self, point):
+        self.center = np.array(point, dtype=float)
+
+    def scale(self, factor):
+        self.radius *= factor
+
+    def put_start_and_end_on(self, start, end):
+        self.center = (np.asarray(start) + np.asarray(end)) / 2
+
+class StubVItem:
+    def __init__(self):
+        self.points = StubPoints()
+        self.stroke = types.SimpleNamespace(set=lambda **kwargs: None)
+
+    def current(self):
+        return self
+
+class StubDataUpdater:
+    def __init__(self, item, func, **kwargs):
+        self.item = item
+        self.func = func
+
+    def sample(self, t):
+        self.func(None, types.SimpleNamespace(global_t=t, alpha=t))
+
+class StubTimeline:
+    def __init__(self):
+        self.prepared = []
+
+    def prepare(self, *anims, **kwargs):
+        self.prepared.extend(anims)
+
+@pytest.fixture
+def manager_cls(monkeypatch):
+    # 以替身代替 janim，仅测试管理器自身的更新逻辑
+    imports = types.ModuleType("janim.imports")
+    imports.Timeline = StubTimeline
+    imports.VItem = StubVItem
+    imports.DataUpdater = StubDataUpdater
+    for name in ("Dot", "Line", "Circle"):
+        setattr(imports, name, type(name, (StubVItem,), {}))
+    logger = types.ModuleType("janim.logger")
+    logger.log = types.SimpleNamespace(warning=lambda *args: None)
+    janim = types.ModuleType("janim")
+    janim.imports, janim.logger = imports, logger
+    for name, module in (("janim", janim), ("janim.imports", imports), ("janim.logger", logger)):
+        monkeypatch.setitem(sys.modules, name, module)
+    names = ("manimgeo.anime.janim.error_func", "manimgeo.anime.janim.janim_manager")
+    for name in names:
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    module = importlib.import_module("manimgeo.anime.janim.janim_manager")
+    yield module.GeoJAnimManager
+    for name in names:
+        sys.modules.pop(name, None)
+
+def test_shared_updaters(manager_cls, monkeypatch):
+    A = Point.Free(np.array([0.0, 0.0]), "A")
+    B = Point.Free(np.array([2.0, 0.0]), "B")
+    M = Point.MidPP(A, B, "M")
+    AB = LineSegment.PP(A, B, "AB")
+    timeline = StubTimeline()
+    manager = manager_cls(timeline)
+
+    # 每次调用为各自的时间段加入一个 DataUpdater，均更新全部已注册的对象
+    dot_a, dot_b = manager.create_vitems_with_add_updater([A, B], 2)
+    dot_m, line = manager.create_vitems_with_add_updater([M, AB], 4)
+    assert len(timeline.prepared) == 2 and timeline.prepared[1] is manager.updater
+    vitem, updater = manager.create_vitem_from_geometry(Point.MidPP(A, M, "N"))
+    assert isinstance(vitem, StubVItem) and isinstance(updater, StubDataUpdater)
+
+    adapted = []
+    adapt = manager._adapt_vitems
+    def counted(obj, vitem):
+        adapted.append(obj.name)
+        adapt(obj, vitem)
+    monkeypatch.setattr(manager, "_adapt_vitems", counted)
+
+    # 首次采样同步全部对象，同一时刻的其余 DataUpdater 不再计算，之后静止的场景不再同步
+    for updater in timeline.prepared:
+        updater.sample(0.0)
+    assert sorted(adapted) == ["AB", "M", "N"]
+    adapted.clear()
+    timeline.prepared[0].sample(0.1)
+    assert adapted == []
+
+    # 自由点移动后，后加入的 DataUpdater 同样更新先注册的对象
+    dot_b.points.move_to([4.0, 0.0, 0.0])
+    for updater in timeline.prepared:
+        updater.sample(0.2)
+    assert sorted(adapted) == ["AB", "M", "N"]
+    assert np.allclose(dot_m.points.center, [2, 0, 0]) and np.allclose(line.points.center, [2, 0, 0])
+
+    # 先加入的 DataUpdater 结束后，后注册的对象由之后的 DataUpdater 继续更新
+    adapted.clear()
+    dot_a.points.move_to([2.0, 0.0, 0.0])
+    timeline.prepared[1].sample(3.0)
+    assert sorted(adapted) == ["AB", "M", "N"]
+    assert np.allclose(dot_m.points.center, [3, 0, 0])
+
+    manager.release()
+    assert manager.updater is None
+    manager.create_vitems_with_add_updater([A], 1)
+    assert len(timeline.prepared) == 3 and timeline.prepared[2] is manager.updater
@@ -0,0 +1,119 @@
+import importlib
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from manimgeo.components import *
+
+class StubMobject:
+    """仅记录位置的 Mobject 替身"""
+
+    def __init__(self):
+        self.center = np.zeros(3)
+        self.radius = 1.0
+        self.updaters = []
+
+    def get_center(self):
+        return self.center.copy()
+
+    def move_to(self, point):
+        self.center = np.array(point, dtype=float)
+        return self
+
+    def scale(self, factor):
+        self.radius *= factor
+        return self
+
+    def get_radius(self):
+        return self.radius
+
+    def set_points_by_ends(self, start, end):
+        self.center = (np.asarray(start) + np.asarray(end)) / 2
+
+    def set_stroke(self, opacity=1):
+        pass
+
+    def add_updater(self, updater):
+        self.updaters.append(updater)
+
+@pytest.fixture
+def manager_cls(monkeypatch):
+    # 以替身代替 manimlib，仅测试管理器自身的同步逻辑
+    manimlib = types.ModuleType("manimlib")
+    for name in ("Mobject", "Dot", "Line", "Circle"):
+        setattr(manimlib, name, type(name, (StubMobject,), {}))
+    monkeypatch.setitem(sys.modules, "manimlib", manimlib)
+    for name in ("manimgeo.anime.manimgl.error_func", "manimgeo.anime.manimgl.manimgl_manager"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    module = importlib.import_module("manimgeo.anime.manimgl.manimgl_manager")
+    yield module.GeoManimGLManager
+    for name in ("manimgeo.anime.manimgl.error_func", "manimgeo.anime.manimgl.manimgl_manager"):
+        sys.modules.pop(name, None)
+
+def count_adapts(manager, monkeypatch):
+    """记录每次同步的几何对象名称"""
+    adapted = []
+    adapt = manager._adapt_mobjects
+    def counted(obj, mobj):
+        adapted.append(obj.name)
+        adapt(obj, mobj)
+    monkeypatch.setattr(manager, "_adapt_mobjects", counted)
+    return adapted
+
+def test_update_leaf_static(manager_cls, monkeypatch):
+    A = Point.Free(np.array([0.0, 0.0]), "A")
+    B = Point.Free(np.array([2.0, 0.0]), "B")
+    M = Point.MidPP(A, B, "M")
+    manager = manager_cls()
+    mobjects = manager.create_mobjects_from_geometry([A, B, M])
+    adapted = count_adapts(manager, monkeypatch)
+    manager.start_trace()
+
+    # 首帧同步全部对象，之后静止的场景不设置自由点坐标，也不重新同步任何 Mobject
+    for frame in range(3):
+        for mobj in mobjects:
+            for updater in mobj.updaters:
+                updater(mobj)
+        if frame == 0:
+            assert adapted == ["M"]
+            adapted.clear()
+            version = M.version
+    assert adapted == [] and M.version == version
+
+    mobjects[1].move_to([4.0, 0.0, 0.0])
+    for mobj in mobjects:
+        for updater in mobj.updaters:
+            updater(mobj)
+    assert adapted == ["M"] and np.allclose(mobjects[2].get_center(), [2, 0, 0])
+
+def test_update_scene(manager_cls, monkeypatch):
+    A = Point.Free(np.array([0.0, 0.0]), "A")
+    B = Point.Free(np.array([2.0, 0.0]), "B")
+    C = Point.Free(np.array([0.0, 2.0]), "C")
+    M = Point.MidPP(A, B, "M")
+    N = Point.MidPP(A, C, "N")
+    manager = manager_cls(scene_updater=True)
+    mobjects = dict(zip("ABCMN", manager.create_mobjects_from_geometry([A, B, C, M, N])))
+    host = manager.install_scene_updater()
+    adapted = count_adapts(manager, monkeypatch)
+    manager.start_trace()
+
+    # 首帧同步全部对象，之后仅同步版本号变化的对象
+    manager.update_scene()
+    assert adapted == ["M", "N"]
+    adapted.clear()
+    manager.update_scene()
+    assert adapted == []
+    mobjects["B"].move_to([4.0, 0.0, 0.0])
+    host.updaters[0](host)
+    assert adapted == ["M"] and np.allclose(mobjects["M"].get_center(), [2, 0, 0])
+
+    # 没有自由点移动时，在其他位置被修改的对象同样被同步
+    adapted.clear()
+    C.adapter.args.coord = np.array([0.0, 4.0])
+    C.update()
+    mobjects["C"].move_to([0.0, 4.0, 0.0])
+    manager.update_scene()
+    assert adapted == ["N"] and np.allclose(mobjects["N"].get_center(), [0, 2, 0])
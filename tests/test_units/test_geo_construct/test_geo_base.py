@@ -31,4 +31,281 @@ def test_point_hash_and_equality():
     assert len(point_set) == 2 # p3 是 p1 的引用，所以集合中只有两个元素
     assert p1 in point_set
     assert p2 in point_set
-    assert p3 in point_set
\ No newline at end of file
+    assert p3 in point_set
+def test_adapter_outputs_not_reused():
+    coord = np.array([0, 0, 0])
+    A = Point.Free(coord, "A")
+    B = Point.Free(np.array([2, 0, 0]), "B")
+    line = LineSegment.PP(A, B, "line")
+    circle = Circle.PP(A, B, name="circle")
+    M = Point.MidPP(A, B, "M")
+    held = [A.coord, line.start, line.unit_direction, circle.center, circle.normal, M.coord]
+    values = [value.copy() for value in held]
+
+    # 此前持有的属性数组不会被之后的计算覆盖，也不与上游对象或构造参数共享内存
+    A.set_coord(np.array([9, 9, 9]))
+    assert all(np.array_equal(a, b) for a, b in zip(held, values))
+    assert line.start is not A.coord and circle.center is not A.coord
+    assert np.allclose(coord, [0, 0, 0])
+    assert np.allclose(M.coord, [5.5, 4.5, 4.5])
+
+    # 逐帧保存的坐标各不相同
+    frames = []
+    for x in range(3):
+        B.set_coord(np.array([x, 0, 0]))
+        frames.append(M.coord)
+    assert [frame[0] for frame in frames] == [4.5, 5, 5.5]
+
+def test_fresh_results_not_copied(monkeypatch):
+    from manimgeo.components.point import adapter as point_adapter
+
+    # 数学函数新计算的数组直接作为输出属性，不再复制
+    results = []
+    def orthocenter(p1, p2, p3):
+        results.append((p1 + p2 + p3) / 3)
+        return results[-1]
+    monkeypatch.setattr(point_adapter, "orthocenter", orthocenter)
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([3, 0, 0]), "B")
+    C = Point.Free(np.array([0, 3, 0]), "C")
+    H = Point.OrthocenterPPP(A, B, C, "H")
+    assert H.coord is results[-1]
+    C.set_coord(np.array([0, 6, 0]))
+    assert H.coord is results[-1] and np.allclose(H.coord, [1, 2, 0])
+
+def test_output_reuse():
+    from manimgeo.components.point.intersections import LCir, PointIntersections
+
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([2, 0, 0]), "B")
+    line = LineSegment.PP(A, B, "line")
+    circle = Circle.PP(A, B, name="circle")
+    M = Point.MidPP(A, B, "M")
+    P = Point.IntersectionLL(line, InfinityLine.PP(M, Point.Free(np.array([1, 2, 0]), "N")), name="P")
+    solver = PointIntersections(int_type=LCir(line=line, circle=circle, as_infinity=True))
+
+    with output_reuse():
+        A.set_coord(np.array([0, 1, 0]))
+        buffers = [A.coord, line.start, line.unit_direction, circle.center, circle.normal, M.coord, P.coord]
+
+        # 输出数组在更新之间复用，持有的属性数组被原地覆盖，且不与上游对象或构造参数共享内存
+        A.set_coord(np.array([1, 1, 0]))
+        current = [A.coord, line.start, line.unit_direction, circle.center, circle.normal, M.coord, P.coord]
+        assert all(a is b for a, b in zip(current, buffers))
+        assert line.start is not A.coord and circle.center is not A.coord
+        assert np.allclose(M.coord, [1.5, 0.5, 0]) and np.allclose(P.coord, [1.5, 0.5, 0])
+        assert np.allclose(line.unit_direction, [np.sqrt(2) / 2, -np.sqrt(2) / 2, 0])
+        # 交点求解复用结果对象
+        assert solver() is solver()
+    # 交点坐标以列表给出
+    assert isinstance(solver().result_points, list) and len(solver()) == 2
+
+    # 退出后恢复为每次计算得到新数组
+    held = M.coord
+    A.set_coord(np.array([0, 0, 0]))
+    assert M.coord is not held and np.allclose(held, [1.5, 0.5, 0])
+
+def test_zero_copy_binding(monkeypatch):
+    from manimgeo.components.vector.args import MulNVArgs
+
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([2, 0, 0]), "B")
+    circle = Circle.PP(A, B, name="circle")
+    vec = Vector.PP(A, B, "vec")
+    scaled = Vector(name="scaled", args=MulNVArgs(vec=vec, factor=2))
+
+    # 几何对象的向量属性就是适配器的输出缓冲区
+    for obj in (A, circle, vec, scaled):
+        for attr in obj.attrs:
+            if isinstance(getattr(obj, attr), np.ndarray):
+                assert getattr(obj, attr) is getattr(obj.adapter, attr), f"{obj.name}.{attr}"
+
+    # 绑定计算属性不经过 pydantic 的 __setattr__
+    def checked(setattr_):
+        def wrapper(obj, name, value):
+            assert name not in obj.attrs, f"{obj.name}.{name} 经 __setattr__ 绑定"
+            setattr_(obj, name, value)
+        return wrapper
+    monkeypatch.setattr(Circle, "__setattr__", checked(Circle.__setattr__))
+    monkeypatch.setattr(Vector, "__setattr__", checked(Vector.__setattr__))
+    buffer = scaled.vec
+    B.adapter.args.coord = np.array([0, 3, 0])
+    B.update()
+    assert circle.radius == 3 and np.isclose(circle.area, 9 * np.pi)
+    # 每次计算分配新数组，此前持有的数组保持不变
+    assert scaled.vec is not buffer and np.allclose(buffer, [4, 0, 0])
+    assert np.allclose(scaled.vec, [0, 6, 0])
+    assert np.allclose(scaled.unit_direction, [0, 1, 0]) and scaled.norm == 6
+
+def test_derived_attributes():
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([3, 4, 0]), "B")
+    line = LineSegment.PP(A, B, "line")
+    circle = Circle.PP(A, B, name="circle")
+    vec = Vector.PP(A, B, "vec")
+
+    # 派生属性在更新后首次读取时才计算
+    B.set_coord(np.array([0, 2, 0]))
+    for obj, names in ((line, ["length", "unit_direction"]), (circle, ["area", "circumference"]), (vec, ["norm", "unit_direction"])):
+        assert all(name not in obj.__dict__ for name in names)
+    assert line.length == 2 and np.allclose(line.unit_direction, [0, 1, 0])
+    assert "unit_direction" in line.__dict__
+    assert np.isclose(circle.area, 4 * np.pi) and np.isclose(circle.circumference, 4 * np.pi)
+    assert vec.norm == 2 and np.allclose(vec.unit_direction, [0, 1, 0])
+
+    # 下游计算读取派生属性
+    P = Point.ParallelPL(A, line, 3, "P")
+    assert np.allclose(P.coord, [0, 3, 0])
+    B.set_coord(np.array([1, 0, 0]))
+    assert np.allclose(P.coord, [3, 0, 0])
+    assert line.length == 1 and vec.norm == 1
+
+def test_repr_excludes_derived_attributes():
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([1, 0, 0]), "B")
+    C = Point.Free(np.array([0, 1, 0]), "C")
+    D = Point.Free(np.array([1, 1, 0]), "D")
+    ray1 = Ray.PP(A, B, "ray1")
+    ray2 = Ray.PP(C, D, "ray2")
+
+    # 未读取的派生属性不以字段默认值出现在嵌套输出与错误信息中
+    assert "length" not in str(ray1.adapter) and "unit_direction" not in str(ray1.adapter)
+    with pytest.raises(ValueError) as info:
+        Point.IntersectionLL(ray1, ray2, name="P")
+    message = str(info.value)
+    assert "两对象无交点" in message and "start=" in message
+    assert "length=" not in message and "unit_direction=" not in message
+
+def test_trusted_construction():
+    from manimgeo.components.base import is_trusted_construction
+
+    A = Point.Free(np.array([0.0, 0.0, 0.0]), "A")
+    B = Point.Free(np.array([2.0, 0.0, 0.0]), "B")
+    with trusted_construction():
+        assert is_trusted_construction()
+        M = Point.MidPP(A, B, "M")
+        line = LineSegment.PP(A, M, "line")
+        circle = Circle.PR(M, 1.0, name="circle")
+    assert not is_trusted_construction()
+
+    assert isinstance(M.adapter, PointAdapter) and M.adapter.args is M.args
+    assert np.allclose(M.coord, [1, 0, 0]) and line.length == 1
+    assert line.line_type == "LineSegment" and line.attrs == LineSegment.model_fields["attrs"].default
+    assert M in A.dependents and circle.dependencies == [M]
+
+    # 可信构造的对象与普通对象一样参与更新
+    B.set_coord(np.array([4.0, 0.0, 0.0]))
+    assert np.allclose(circle.center, [2, 0, 0])
+    assert np.allclose(line.end, [2, 0, 0])
+
+def test_dependents_unique():
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    M = Point.MidPP(A, A, "M")
+    assert A.dependents == [M]
+    A.remove_dependent(M)
+    assert A.dependents == []
+    A.add_dependent(M)
+    A.add_dependent(M)
+    assert A.dependents == [M]
+
+def test_interning():
+    from manimgeo.components.base import is_interning
+
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([2, 0, 0]), "B")
+    assert Point.MidPP(A, B) is not Point.MidPP(A, B)
+    with interning():
+        assert is_interning()
+        M = Point.MidPP(A, B, "M")
+        assert Point.MidPP(A, B, "N") is M and M.name == "M"
+        assert A.dependents.count(M) == 1
+
+        # 类型、构造方式、数值参数或依赖顺序不同时新建对象
+        segment = LineSegment.PP(A, B)
+        assert LineSegment.PP(A, B) is segment
+        assert Ray.PP(A, B) is not segment
+        assert LineSegment.PP(B, A) is not segment
+        assert Point.ExtensionPP(A, B, 2) is not Point.ExtensionPP(A, B, 3)
+        assert Circle.PR(A, 1.0) is Circle.PR(A, 1.0)
+
+        # 没有依赖的对象总是新建
+        assert Point.Free(np.array([0, 0, 0])) is not Point.Free(np.array([0, 0, 0]))
+
+        # 替换构造参数后不再复用
+        C = Point.Free(np.array([0, 2, 0]), "C")
+        M.update(M.args.model_copy(update={"point2": C}))
+        assert Point.MidPP(A, B) is not M
+    assert not is_interning()
+    assert Point.MidPP(A, B) is not M
+
+def test_adapter_dispatch_table():
+    from manimgeo.components.point.args import MidPPArgs
+
+    assert GeometryAdapter._handlers == {}
+    assert "MidPP" in PointAdapter._handlers and "MidPP" not in LineAdapter._handlers
+
+    A = Point.Free(np.array([1.0, 0.0, 0.0]), "A")
+    B = Point.Free(np.array([3.0, 0.0, 0.0]), "B")
+
+    # 子类继承父类的分派表，注册的计算函数不影响父类
+    class SumPointAdapter(PointAdapter):
+        pass
+
+    @SumPointAdapter.register("MidPP")
+    def _sum(adapter: SumPointAdapter, args: MidPPArgs):
+        adapter._store("coord", args.point1.coord + args.point2.coord)
+
+    adapter = SumPointAdapter(args=MidPPArgs(point1=A, point2=B))
+    adapter()
+    assert np.allclose(adapter.coord, [4, 0, 0])
+    assert "Free" in SumPointAdapter._handlers
+    assert np.allclose(Point.MidPP(A, B).coord, [2, 0, 0])
+
+    # 未注册的构造方式
+    with pytest.raises(NotImplementedError):
+        LineAdapter.model_construct(args=MidPPArgs(point1=A, point2=B))()
+
+def test_deferred_model_build():
+    import os, subprocess, sys
+
+    # 导入时不构建验证器，首次构造时才构建
+    code = (
+        "import numpy as np\n"
+        "from manimgeo.components import *\n"
+        "assert not Point.__pydantic_complete__ and not LineAdapter.__pydantic_complete__\n"
+        "A = Point.Free(np.array([0, 0, 0]), 'A')\n"
+        "line = LineSegment.PP(A, Point.Free(np.array([1, 0, 0]), 'B'))\n"
+        "assert Point.__pydantic_complete__ and line.length == 1\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+def test_version():
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([2, 0, 0]), "B")
+    C = Point.Free(np.array([0, 2, 0]), "C")
+    M = Point.MidPP(A, B, "M")
+    N = Point.MidPP(A, C, "N")
+    versions = {obj.name: obj.version for obj in (A, B, C, M, N)}
+    assert len(set(versions.values())) == 5
+
+    # 只有被重新计算的对象分配新版本号
+    B.set_coord(np.array([4, 0, 0]))
+    assert B.version != versions["B"] and M.version != versions["M"]
+    assert (A.version, C.version, N.version) == (versions["A"], versions["C"], versions["N"])
+
+    # 错误标记变化同样分配新版本号
+    version = M.version
+    M._mark_error()
+    assert M.version != version
+
+    # 惰性模式下读取版本号时先完成计算
+    set_lazy_update(True)
+    try:
+        version = N.version
+        C.set_coord(np.array([0, 4, 0]))
+        assert N.dirty
+        assert N.version != version and not N.dirty
+        assert np.allclose(N.coord, [0, 2, 0])
+    finally:
+        set_lazy_update(False)
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from manimgeo.components import *
+import manimgeo.components.intersections.adapter as intersections_adapter
+
+def test_roots_share_one_solve(monkeypatch):
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([1, 0, 0]), "B")
+    circle1 = Circle.PR(A, 1.0, name="circle1")
+    circle2 = Circle.PR(B, 1.0, name="circle2")
+    intersections = Intersections.CirCir(circle1, circle2, "I")
+    P = intersections.root(0, "P")
+    Q = intersections.root(1, "Q")
+    assert intersections.root(0) is P
+
+    calls = []
+    original = intersections_adapter.intersection_circle_circle
+    def counting(*args):
+        calls.append(args)
+        return original(*args)
+    monkeypatch.setattr(intersections_adapter, "intersection_circle_circle", counting)
+
+    B.set_coord(np.array([0, 1, 0]))
+    assert len(calls) == 1
+    assert np.allclose(P.coord, [-np.sqrt(3) / 2, 0.5, 0])
+    assert np.allclose(Q.coord, [np.sqrt(3) / 2, 0.5, 0])
+
+def test_root_error_recovery():
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([1, 0, 0]), "B")
+    circle = Circle.PR(A, 1.0, name="circle")
+    line = InfinityLine.PP(B, Point.Free(np.array([1, 1, 0])), "line")
+    intersections = Intersections.LCir(line, circle, name="I")
+    T = intersections.root(0, "T")
+    M = Point.MidPP(T, A, "M")
+    assert np.allclose(T.coord, [1, 0, 0])
+
+    # 直线远离圆后交点消失
+    with pytest.raises(ValueError):
+        B.set_coord(np.array([3, 0, 0]))
+    assert not intersections.on_error and len(intersections) == 0
+    assert T.on_error and M.on_error
+
+    B.set_coord(np.array([0, 0, 0]))
+    assert not T.on_error and not M.on_error
+    # 直线 y = x 与单位圆交于两点，参数较小者在前
+    assert np.allclose(T.coord, [-np.sqrt(2) / 2, -np.sqrt(2) / 2, 0])
+    assert np.allclose(M.coord, T.coord / 2)
+
+def test_missing_root():
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([4, 0, 0]), "B")
+    circle1 = Circle.PR(A, 1.0, name="circle1")
+    circle2 = Circle.PR(B, 1.0, name="circle2")
+    intersections = Intersections.CirCir(circle1, circle2, "I")
+
+    # 不存在的交点只登记一次，并被标记为错误
+    P = intersections.root(0, "P")
+    assert intersections.root(0) is P and P.on_error
+    assert intersections.dependents.count(P) == 1
+
+    # 交点出现后恢复
+    B.set_coord(np.array([1, 0, 0]))
+    assert not P.on_error
+    assert np.allclose(P.coord, [0.5, np.sqrt(3) / 2, 0])
+
+def test_ll_intersections():
+    line1 = LineSegment.PP(Point.Free(np.array([0, 0, 0])), Point.Free(np.array([2, 2, 0])))
+    line2 = LineSegment.PP(Point.Free(np.array([0, 2, 0])), Point.Free(np.array([2, 0, 0])))
+    intersections = Intersections.LL(line1, line2)
+    assert len(intersections) == 1
+    assert np.allclose(intersections.root(0).coord, [1, 1, 0])
+
+def test_tracked_roots_keep_identity():
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([1, 0, 0]), "B")
+    circle1 = Circle.PR(A, 1.0, name="circle1")
+    circle2 = Circle.PR(B, 1.0, name="circle2")
+    untracked = Intersections.CirCir(circle1, circle2, name="U")
+    tracked = Intersections.CirCir(circle1, circle2, track=True, name="T")
+    assert np.allclose(untracked.root(0).coord, tracked.root(0).coord)
+
+    # 圆心连线反向后求解顺序互换，跟踪的交点保持在上半平面
+    B.set_coord(np.array([-1, 0, 0]))
+    assert untracked.root(0).coord[1] < 0
+    assert np.allclose(tracked.root(0).coord, [-0.5, np.sqrt(3) / 2, 0])
+    assert np.allclose(tracked.root(1).coord, [-0.5, -np.sqrt(3) / 2, 0])
+
+def test_tracked_roots_disappear():
+    circle = Circle.PR(Point.Free(np.array([0, 0, 0])), 1.0, name="circle")
+    S = Point.Free(np.array([-2, 0.5, 0]), "S")
+    E = Point.Free(np.array([2, 0.5, 0]), "E")
+    intersections = Intersections.LCir(LineSegment.PP(S, E), circle, track=True, name="I")
+    P, Q = intersections.root(0, "P"), intersections.root(1, "Q")
+    x = np.sqrt(3) / 2
+    assert np.allclose(P.coord, [-x, 0.5, 0]) and np.allclose(Q.coord, [x, 0.5, 0])
+
+    # 左侧交点离开线段，右侧交点仍为 Q
+    with pytest.raises(ValueError):
+        S.set_coord(np.array([0, 0.5, 0]))
+    assert len(intersections) == 1 and intersections.result_points.shape == (2, 3)
+    assert P.on_error and not Q.on_error
+    assert np.allclose(Q.coord, [x, 0.5, 0])
+
+    S.set_coord(np.array([-2, 0.5, 0]))
+    assert not P.on_error
+    assert np.allclose(P.coord, [-x, 0.5, 0]) and np.allclose(Q.coord, [x, 0.5, 0])
@@ -36,60 +36,50 @@ def test_ExtensionPP():
     extend_point2 = Point.ExtensionPP(C, D, -0.5)  # 反向，一半
     assert np.allclose(extend_point2.coord, np.array([2, 2.5, 0]))
 
-@pytest.mark.skip(reason="Not implemented yet")
 def test_IntersectionCirCir():
     # 两圆交点测试
 
     # 相交情况
     circle1 = Circle.PP(Point.Free(np.array([0, 0, 0])), Point.Free(np.array([1, 0, 0])))  # 圆心(0,0)，半径1
     circle2 = Circle.PP(Point.Free(np.array([1, 0, 0])), Point.Free(np.array([2, 0, 0])))  # 圆心(1,0)，半径1
-    inter_points = Point.IntersectionCirCir(circle1, circle2)
-    expected1 = np.array([0.5, np.sqrt(3)/2, 0])
-    expected2 = np.array([0.5, -np.sqrt(3)/2, 0])
-    assert (np.allclose(inter_points.coord1, expected1) or 
-            np.allclose(inter_points.coord1, expected2))
-    
+    inter_points = Intersections.CirCir(circle1, circle2)
+    assert len(inter_points) == 2
+    assert np.allclose(inter_points.root(0).coord, [0.5, np.sqrt(3)/2, 0])
+    assert np.allclose(inter_points.root(1).coord, [0.5, -np.sqrt(3)/2, 0])
+
     # 相切情况
     circle3 = Circle.PP(Point.Free(np.array([0, 0, 0])), Point.Free(np.array([2, 0, 0])))  # 半径2
     circle4 = Circle.PP(Point.Free(np.array([4, 0, 0])), Point.Free(np.array([2, 0, 0])))  # 圆心(4,0)，半径2
-    inter_points2 = Point.IntersectionCirCir(circle3, circle4)
-    assert np.allclose(inter_points2.coord1, [2, 0, 0])
+    inter_points2 = Intersections.CirCir(circle3, circle4)
+    assert len(inter_points2) == 1
+    assert np.allclose(inter_points2.root(0).coord, [2, 0, 0])
 
-    # 无交点情况 BUG
+    # 无交点情况
     circle5 = Circle.PP(Point.Free(np.array([0, 0, 0])), Point.Free(np.array([1, 0, 0])))
     circle6 = Circle.PP(Point.Free(np.array([3, 0, 0])), Point.Free(np.array([2, 0, 0])))
-    try:
-        Point.IntersectionCirCir(circle5, circle6)
-        assert False, "Expected ValueError for no intersection"
-    except ValueError:
-        pass
+    inter_points3 = Intersections.CirCir(circle5, circle6)
+    assert len(inter_points3) == 0
+    assert inter_points3.root(0).on_error
 
-@pytest.mark.skip(reason="Not implemented yet")
 def test_IntersectionLCir():
     # 线圆交点测试
     
     # 线段与圆相交
     circle = Circle.PP(Point.Free(np.array([0, 0, 0])), Point.Free(np.array([1, 0, 0])))  # 单位圆
     line = LineSegment.PP(Point.Free(np.array([-2, 0, 0])), Point.Free(np.array([2, 0, 0])))  # x轴线段
-    intersections = Point.IntersectionLCir(line, circle)
-    assert (np.allclose(intersections.coord1, [1, 0, 0]) and \
-            np.allclose(intersections.coord2, [-1, 0, 0])) or \
-            (np.allclose(intersections.coord1, [-1, 0, 0]) and \
-            np.allclose(intersections.coord2, [1, 0, 0]))
+    intersections = Intersections.LCir(line, circle)
+    assert np.allclose(intersections.root(0).coord, [-1, 0, 0])
+    assert np.allclose(intersections.root(1).coord, [1, 0, 0])
 
     # 射线与圆相切
-    circle2 = Circle.PP(Point.Free(np.array([0, 0, 0])), Point.Free(np.array([1, 0, 0])))
-    ray = RayPP(Point.Free(np.array([0, 1, 0])), Point.Free(np.array([1, 1, 0])))  # 水平射线y=1
-    tangent_point = Point.IntersectionLCir(ray, circle2)
-    assert np.allclose(tangent_point.coord1, [0, 1, 0]) and np.allclose(tangent_point.coord2, [0, 1, 0])
+    ray = Ray.PP(Point.Free(np.array([0, 1, 0])), Point.Free(np.array([1, 1, 0])))  # 水平射线y=1
+    tangent = Intersections.LCir(ray, circle)
+    assert len(tangent) == 1
+    assert np.allclose(tangent.root(0).coord, [0, 1, 0])
 
     # 无限直线不相交
     inf_line = InfinityLine.PP(Point.Free(np.array([3, 0, 0])), Point.Free(np.array([3, 1, 0])))  # x=3
-    try:
-        Point.IntersectionLCir(inf_line, circle)
-        assert False, "Expected no intersection"
-    except ValueError:
-        pass
+    assert Intersections.LCir(inf_line, circle).root(0).on_error
 
 def test_IntersectionLL():
     # 线线交点测试
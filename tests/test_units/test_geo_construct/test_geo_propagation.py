@@ -0,0 +1,237 @@
+import numpy as np
+import pytest
+
+from manimgeo.components import *
+from manimgeo.components.base import topological_order
+
+def count_computations(monkeypatch):
+    """统计每个几何对象的计算次数"""
+    counter = {}
+    original = BaseGeometry._compute
+
+    def counting_compute(self):
+        counter[self.name] = counter.get(self.name, 0) + 1
+        original(self)
+
+    monkeypatch.setattr(BaseGeometry, "_compute", counting_compute)
+    return counter
+
+def test_diamond_computed_once(monkeypatch):
+    # 构造菱形依赖：A -> (M1, M2) -> M3 -> (M4, M5) -> M6
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([4, 0, 0]), "B")
+    M1 = Point.MidPP(A, B, "M1")
+    M2 = Point.ExtensionPP(A, B, 2, "M2")
+    M3 = Point.MidPP(M1, M2, "M3")
+    M4 = Point.MidPP(M3, A, "M4")
+    M5 = Point.MidPP(M3, B, "M5")
+    M6 = Point.MidPP(M4, M5, "M6")
+
+    counter = count_computations(monkeypatch)
+    A.set_coord(np.array([2, 0, 0]))
+
+    assert counter == {"A": 1, "M1": 1, "M2": 1, "M3": 1, "M4": 1, "M5": 1, "M6": 1}
+    assert np.allclose(M3.coord, np.array([4.5, 0, 0]))
+    assert np.allclose(M6.coord, np.array([3.75, 0, 0]))
+
+def test_topological_order():
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([1, 0, 0]), "B")
+    AB = LineSegment.PP(A, B, "AB")
+    M = Point.MidL(AB, "M")
+    N = Point.MidPP(A, M, "N")
+
+    order = topological_order([A])
+    assert order[0] is A
+    assert set(order) == {A, AB, M, N}
+    for node in order:
+        for dep in node.dependencies:
+            if dep in order:
+                assert order.index(dep) < order.index(node)
+
+def test_deep_chain_no_recursion_limit():
+    import sys
+    depth = sys.getrecursionlimit() + 500
+
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    vec = Vector.N(np.array([1, 0, 0]))
+    current = A
+    for _ in range(depth):
+        current = Point.TranslationPV(current, vec)
+
+    A.set_coord(np.array([0, 1, 0]))
+    assert np.allclose(current.coord, np.array([depth, 1, 0]))
+
+def test_error_marks_downstream():
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([1, 0, 0]), "B")
+    C = Point.Free(np.array([0, 1, 0]), "C")
+    O = Point.CircumcenterPPP(A, B, C, "O")
+    M = Point.MidPP(O, A, "M")
+    N = Point.MidPP(B, C, "N")
+
+    # 三点共线，外心计算失败
+    with pytest.raises(ValueError):
+        C.set_coord(np.array([2, 0, 0]))
+    assert O.on_error and M.on_error
+    assert not N.on_error
+    assert np.allclose(N.coord, np.array([1.5, 0, 0]))
+
+    # 恢复后错误标记清除
+    C.set_coord(np.array([0, 1, 0]))
+    assert not O.on_error and not M.on_error
+
+def test_batch_update_merges_propagation(monkeypatch):
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([4, 0, 0]), "B")
+    C = Point.Free(np.array([0, 4, 0]), "C")
+    O = Point.CircumcenterPPP(A, B, C, "O")
+    G = Point.CentroidPPP(A, B, C, "G")
+    OG = LineSegment.PP(O, G, "OG")
+
+    counter = count_computations(monkeypatch)
+    with batch_update():
+        A.set_coord(np.array([1, 0, 0]))
+        B.set_coord(np.array([5, 0, 0]))
+        C.set_coord(np.array([1, 4, 0]))
+        # 事务内自由点自身立即更新，下游推迟
+        assert np.allclose(A.coord, np.array([1, 0, 0]))
+        assert "O" not in counter
+
+    assert counter == {"A": 1, "B": 1, "C": 1, "O": 1, "G": 1, "OG": 1}
+    assert np.allclose(O.coord, np.array([3, 2, 0]))
+    assert np.allclose(OG.end, np.array([7 / 3, 4 / 3, 0]))
+
+def test_batch_update_nested():
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([2, 0, 0]), "B")
+    M = Point.MidPP(A, B, "M")
+
+    with batch_update():
+        with batch_update():
+            A.set_coord(np.array([2, 2, 0]))
+        # 内层事务结束时不传播
+        assert np.allclose(M.coord, np.array([1, 0, 0]))
+        B.set_coord(np.array([4, 2, 0]))
+
+    assert np.allclose(M.coord, np.array([3, 2, 0]))
+
+def test_batch_update_keeps_original_error():
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([4, 0, 0]), "B")
+    C = Point.Free(np.array([0, 4, 0]), "C")
+    O = Point.CircumcenterPPP(A, B, C, "O")
+
+    # 事务内抛出的异常不会被传播中的计算错误覆盖
+    with pytest.raises(KeyError) as info:
+        with batch_update():
+            C.set_coord(np.array([2, 0, 0]))
+            raise KeyError("original")
+    assert any("传播" in note for note in info.value.__notes__)
+    assert O.on_error
+
+    # 传播成功时原异常不附加说明
+    with pytest.raises(KeyError) as info:
+        with batch_update():
+            C.set_coord(np.array([0, 4, 0]))
+            raise KeyError("original")
+    assert not getattr(info.value, "__notes__", None)
+    assert not O.on_error and np.allclose(O.coord, [2, 2, 0])
+
+@pytest.fixture
+def lazy_mode():
+    set_lazy_update(True)
+    yield
+    set_lazy_update(False)
+
+def test_lazy_update_computes_on_access(monkeypatch, lazy_mode):
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([4, 0, 0]), "B")
+    C = Point.Free(np.array([0, 4, 0]), "C")
+    M = Point.MidPP(A, B, "M")
+    AB = LineSegment.PP(A, B, "AB")
+    circle = Circle.PPP(A, B, C, "circle")
+    hidden = Point.MidPP(M, C, "hidden")
+
+    counter = count_computations(monkeypatch)
+    A.set_coord(np.array([2, 0, 0]))
+    assert counter == {"A": 1}
+    assert M.dirty and AB.dirty and circle.dirty and hidden.dirty
+
+    # 仅读取需要的对象
+    assert np.allclose(M.coord, np.array([3, 0, 0]))
+    assert np.allclose(AB.start, np.array([2, 0, 0]))
+    assert np.isclose(circle.radius, np.sqrt(10))
+    assert counter == {"A": 1, "M": 1, "AB": 1, "circle": 1}
+    assert hidden.dirty
+
+    # 读取下游时先计算脏上游
+    A.set_coord(np.array([0, 0, 0]))
+    assert np.allclose(hidden.coord, np.array([1, 2, 0]))
+    assert counter["M"] == 2 and counter["hidden"] == 1
+    assert not M.dirty and not hidden.dirty
+
+def test_lazy_update_error(lazy_mode):
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([1, 0, 0]), "B")
+    C = Point.Free(np.array([0, 1, 0]), "C")
+    O = Point.CircumcenterPPP(A, B, C, "O")
+    M = Point.MidPP(O, A, "M")
+
+    C.set_coord(np.array([2, 0, 0]))
+    # 读取时计算失败不抛出，保留原有坐标并标记错误
+    assert np.allclose(M.coord, np.array([0.25, 0.25, 0]))
+    assert O.on_error and M.on_error
+
+    C.set_coord(np.array([0, 1, 0]))
+    assert not M.on_error
+
+@pytest.fixture
+def early_cutoff():
+    set_early_cutoff(True)
+    yield
+    set_early_cutoff(False)
+
+def test_early_cutoff_stops_unchanged_branch(monkeypatch, early_cutoff):
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([4, 0, 0]), "B")
+    P = Point.Free(np.array([2, 3, 0]), "P")
+    AB = InfinityLine.PP(A, B, "AB")
+    H = Point.VerticalPL(P, AB, "H")
+    circle = Circle.PR(H, 1, name="circle")
+    C = Point.Cir(circle, "C")
+    M = Point.MidPP(P, H, "M")
+
+    # 首次传播建立快照
+    P.set_coord(np.array([2, 4, 0]))
+    counter = count_computations(monkeypatch)
+
+    # 沿垂线移动 P，垂足不变，圆及其圆心不再计算
+    P.set_coord(np.array([2, 5, 0]))
+    assert counter == {"P": 1, "H": 1, "M": 1}
+    assert np.allclose(M.coord, np.array([2, 2.5, 0]))
+
+    # 容差内的抖动在 P 处即截止
+    counter.clear()
+    P.set_coord(np.array([2 + 1e-9, 5, 0]))
+    assert counter == {"P": 1}
+
+    counter.clear()
+    P.set_coord(np.array([3, 5, 0]))
+    assert counter == {"P": 1, "H": 1, "M": 1, "circle": 1, "C": 1}
+    assert np.allclose(C.coord, np.array([3, 0, 0]))
+
+def test_early_cutoff_error_recovery(early_cutoff):
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([1, 0, 0]), "B")
+    C = Point.Free(np.array([0, 1, 0]), "C")
+    O = Point.CircumcenterPPP(A, B, C, "O")
+    M = Point.MidPP(O, A, "M")
+
+    with pytest.raises(ValueError):
+        C.set_coord(np.array([2, 0, 0]))
+    assert O.on_error and M.on_error
+
+    # 恢复到出错前的位置，输出与出错前快照一致，但仍需清除下游错误
+    C.set_coord(np.array([0, 1, 0]))
+    assert not O.on_error and not M.on_error
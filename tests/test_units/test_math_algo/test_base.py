@@ -122,3 +122,34 @@ def test_close(a, b, expected):
     elif issubclass(expected, Exception):
         with pytest.raises(expected):
             close(a, b)
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        pytest.param(np.array([1.0, np.inf]), np.array([1.0, 1e100]), id="array_inf_finite"),
+        pytest.param(np.array([1.0, 1e100]), np.array([1.0, np.inf]), id="array_finite_inf"),
+        pytest.param(np.array([np.inf, 1.0]), np.array([-np.inf, 1.0]), id="array_inf_sign_mismatch"),
+    ]
+)
+def test_close_array_infinite(a, b):
+    assert close(a, b) is False
+
+def test_close_many():
+    a = [0.0, 1.0, np.nan, np.inf, 1.0]
+    b = [1e-8, 1.1, np.nan, np.inf, -np.inf]
+    assert close_many(a, b).tolist() == [close(x, y) for x, y in zip(a, b)]
+
+    vectors = np.array([[1.0, 2.0, 3.0], [1.0, 2.0, 3.0], [0.0, 0.0, 0.0]])
+    others = np.array([[1.0, 2.0, 3.0 + 0.5 * cfg.atol], [1.0, 2.5, 3.0], [0.0, 0.0, 0.0]])
+    assert close_many(vectors, others).tolist() == [close(x, y) for x, y in zip(vectors, others)]
+
+def test_trusted_math():
+    start = np.array([0, 0, 0])
+    end = np.array([2, 0, 0])
+    assert np.allclose(unit_direction_vector(start, end), [1, 0, 0])
+
+    assert not is_trusted_math()
+    with trusted_math():
+        assert is_trusted_math()
+        assert np.allclose(unit_direction_vector(start.astype(float), end.astype(float)), [1, 0, 0])
+    assert not is_trusted_math()
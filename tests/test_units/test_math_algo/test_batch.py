@@ -0,0 +1,256 @@
+import numpy as np
+import pytest
+
+from manimgeo.math import *
+
+N = 64
+LINE_TYPES = ["LineSegment", "Ray", "InfinityLine"]
+
+@pytest.fixture
+def points():
+    rng = np.random.default_rng(0)
+    points = [rng.normal(size=(N, 3)) * 3 for _ in range(4)]
+    # 混入退化行：重合点
+    points[1][::8] = points[0][::8]
+    return points
+
+@pytest.fixture
+def planar_points(points):
+    planar = [p.copy() for p in points]
+    for p in planar:
+        p[:, 2] = 0
+    return planar
+
+def assert_batch_matches(scalar, batch, n=N):
+    """逐行比较批量函数与单次函数的结果，单次函数抛出 ValueError 或返回 None 的行应无效"""
+    *results, valid = batch()
+    assert valid.shape == (n,)
+    for i in range(n):
+        try:
+            expected = scalar(i)
+        except ValueError:
+            expected = None
+        if expected is None:
+            assert not valid[i], f"row {i}"
+            continue
+
+        assert valid[i], f"row {i}"
+        if not isinstance(expected, tuple):
+            expected = (expected,)
+        for value, result in zip(expected, results):
+            assert np.allclose(value, result[i], atol=1e-7), f"row {i}: {value} != {result[i]}"
+
+    # 无效行以 NaN 填充
+    for result in results:
+        assert np.all(np.isnan(result[~valid]))
+
+def test_close_batch():
+    a = np.array([0.0, 1.0, np.nan, np.inf, np.inf, 1.0])
+    b = np.array([1e-8, 1.1, np.nan, np.inf, -np.inf, np.inf])
+    assert close_batch(a, b).tolist() == [close(x, y) for x, y in zip(a, b)]
+
+def test_unit_direction_vector_batch(points):
+    p0, p1, _, _ = points
+    assert_batch_matches(
+        lambda i: unit_direction_vector(p0[i], p1[i]),
+        lambda: unit_direction_vector_batch(p0, p1),
+    )
+
+@pytest.mark.parametrize("turn", ["clockwise", "counterclockwise"])
+def test_vertical_line_unit_direction_batch(points, turn):
+    p0, p1, _, _ = points
+    assert_batch_matches(
+        lambda i: vertical_line_unit_direction(p0[i], p1[i], turn),
+        lambda: vertical_line_unit_direction_batch(p0, p1, turn),
+    )
+
+def test_line_batch(points):
+    p0, p1, p2, _ = points
+    assert_batch_matches(
+        lambda i: vertical_point_to_line(p2[i], p0[i], p1[i]),
+        lambda: vertical_point_to_line_batch(p2, p0, p1),
+    )
+    assert_batch_matches(
+        lambda i: point_to_line_distance(p2[i], p0[i], p1[i]),
+        lambda: point_to_line_distance_batch(p2, p0, p1),
+    )
+    assert_batch_matches(
+        lambda i: get_parameter_t_on_line(p2[i], p0[i], p1[i]),
+        lambda: get_parameter_t_on_line_batch(p2, p0, p1),
+    )
+
+@pytest.mark.parametrize("line_type", LINE_TYPES)
+def test_is_point_on_line_batch(points, line_type):
+    p0, p1, _, _ = points
+    t = np.linspace(-1.5, 1.5, N)
+    on_line = p0 + t[:, None] * (p1 - p0)
+    on_line[1::2] += 0.5
+    result = is_point_on_line_batch(on_line, p0, p1, line_type)
+    assert result.tolist() == [is_point_on_line(on_line[i], p0[i], p1[i], line_type) for i in range(N)]
+
+def test_points_batch(points):
+    p0, p1, p2, _ = points
+    assert_batch_matches(
+        lambda i: axisymmetric_point(p2[i], p0[i], p1[i]),
+        lambda: axisymmetric_point_batch(p2, p0, p1),
+    )
+    radius = np.abs(p2[:, 0])
+    assert_batch_matches(
+        lambda i: inversion_point(p1[i], p0[i], radius[i]),
+        lambda: inversion_point_batch(p1, p0, radius),
+    )
+
+def test_three_points_batch(points):
+    p0, p1, p2, _ = points
+    assert_batch_matches(
+        lambda i: circumcenter(p0[i], p1[i], p2[i]),
+        lambda: circumcenter_batch(p0, p1, p2),
+    )
+    assert_batch_matches(
+        lambda i: inscribed(p0[i], p1[i], p2[i]),
+        lambda: inscribed_batch(p0, p1, p2),
+    )
+    assert_batch_matches(
+        lambda i: orthocenter(p0[i], p1[i], p2[i]),
+        lambda: orthocenter_batch(p0, p1, p2),
+    )
+
+def test_angles_batch(points):
+    p0, p1, p2, p3 = points
+    assert_batch_matches(
+        lambda i: angle_3p_countclockwise(p0[i], p1[i], p2[i]),
+        lambda: angle_3p_countclockwise_batch(p0, p1, p2),
+    )
+    angle = p2[:, 0]
+    assert_batch_matches(
+        lambda i: point_3p_countclockwise(p0[i], p1[i], angle[i], p3[i]),
+        lambda: point_3p_countclockwise_batch(p0, p1, angle, p3),
+    )
+    assert_batch_matches(
+        lambda i: point_3p_countclockwise(p0[i], p1[i], angle[i]),
+        lambda: point_3p_countclockwise_batch(p0, p1, angle),
+    )
+
+def test_plane_get_ABCD_batch(points):
+    p0, p1, p2, _ = points
+    assert_batch_matches(
+        lambda i: np.array(plane_get_ABCD(p0[i], p1[i], p2[i])),
+        lambda: plane_get_ABCD_batch(p0, p1, p2),
+    )
+
+def test_inverse_circle_batch(planar_points):
+    p0, p1, p2, _ = planar_points
+    normal = np.tile([0.0, 0.0, 1.0], (N, 1))
+    r0, r1 = np.abs(p2[:, 0]), np.abs(p2[:, 1])
+    assert_batch_matches(
+        lambda i: inverse_circle(p0[i], r0[i], normal[i], p1[i], r1[i], normal[i]),
+        lambda: inverse_circle_batch(p0, r0, normal, p1, r1, normal),
+    )
+
+@pytest.mark.parametrize("line1_type", LINE_TYPES)
+@pytest.mark.parametrize("line2_type", LINE_TYPES)
+def test_intersection_line_line_batch(planar_points, line1_type, line2_type):
+    p0, p1, p2, p3 = planar_points
+    assert_batch_matches(
+        lambda i: intersection_line_line(p0[i], p1[i], p2[i], p3[i], line1_type, line2_type),
+        lambda: intersection_line_line_batch(p0, p1, p2, p3, line1_type, line2_type),
+    )
+
+@pytest.mark.parametrize("line2_type", LINE_TYPES)
+def test_intersection_line_line_batch_collinear(line2_type):
+    start1 = np.zeros((4, 3))
+    end1 = np.tile([2.0, 0, 0], (4, 1))
+    start2 = np.array([[1, 0, 0], [2, 0, 0], [3, 0, 0], [-1, 0, 0]], dtype=float)
+    end2 = np.array([[3, 0, 0], [5, 0, 0], [4, 0, 0], [-3, 0, 0]], dtype=float)
+    assert_batch_matches(
+        lambda i: intersection_line_line(start1[i], end1[i], start2[i], end2[i], "LineSegment", line2_type),
+        lambda: intersection_line_line_batch(start1, end1, start2, end2, "LineSegment", line2_type),
+        n=4,
+    )
+
+def test_intersection_line_line_batch_skew(points):
+    p0, p1, p2, p3 = points
+    assert_batch_matches(
+        lambda i: intersection_line_line(p0[i], p1[i], p2[i], p3[i], "InfinityLine", "InfinityLine"),
+        lambda: intersection_line_line_batch(p0, p1, p2, p3, "InfinityLine", "InfinityLine"),
+    )
+
+def test_get_two_vector_from_normal_batch(points):
+    normal = points[0].copy()
+    normal[::8] = 0
+    normal[1] = [0, 0, 2]
+    assert_batch_matches(
+        lambda i: get_two_vector_from_normal(normal[i]),
+        lambda: get_two_vector_from_normal_batch(normal),
+    )
+
+def test_inverse_circle_to_line_batch(planar_points):
+    p0, _, p1, _ = planar_points
+    normal = np.tile([0.0, 0.0, 1.0], (N, 1))
+    # 偶数行的原圆经过基准圆圆心
+    radius = np.linalg.norm(p0 - p1, axis=1)
+    radius[1::2] += 0.5
+    base_r = np.abs(p1[:, 0]) + 1
+    assert_batch_matches(
+        lambda i: inverse_circle_to_line(p0[i], radius[i], normal[i], p1[i], base_r[i], normal[i]),
+        lambda: inverse_circle_to_line_batch(p0, radius, normal, p1, base_r, normal),
+    )
+
+def test_batch_broadcasting():
+    # 单个三维向量与 (N, 3) 数组混合广播
+    p1 = np.array([[0, 0, 0], [1, 1, 0]], dtype=float)
+    center = np.array([0.0, 0.0, 0.0])
+    result, valid = inversion_point_batch(p1, center, 2.0)
+    assert valid.tolist() == [False, True]
+    assert np.allclose(result[1], [2, 2, 0])
+
+    angle, valid = angle_3p_countclockwise_batch(np.array([1, 0, 0]), center, np.array([[0, 1, 0], [-1, 0, 0]]))
+    assert valid.all()
+    assert np.allclose(angle, [np.pi / 2, np.pi])
+
+def assert_multi_batch_matches(scalar, batch, n=N):
+    """逐行比较多交点的批量函数与单次函数，第 i 行的有效交点应与单次函数的结果一致"""
+    points, valid = batch()
+    assert points.shape == (n, 2, 3) and valid.shape == (n, 2)
+    for i in range(n):
+        try:
+            expected = scalar(i)
+        except ValueError:
+            expected = np.empty((0, 3))
+        assert np.allclose(points[i][valid[i]], expected, atol=1e-7), f"row {i}"
+    assert np.all(np.isnan(points[~valid]))
+
+@pytest.mark.parametrize("line_type", LINE_TYPES)
+def test_intersection_line_circle_batch(planar_points, points, line_type):
+    p0, p1, center, _ = planar_points
+    radius = np.abs(p0[:, 0]) + 1
+    normal = np.tile([0.0, 0.0, 1.0], (N, 1))
+    # 混入穿过圆所在平面的线，其中一半经过圆上的点
+    start, end = p0.copy(), p1.copy()
+    angle = points[2][:, 0]
+    on_circle = center + radius[:, None] * np.stack([np.cos(angle), np.sin(angle), np.zeros(N)], axis=-1)
+    start[::3] = points[3][::3]
+    end[::6] = on_circle[::6]
+    end[3::6] = on_circle[3::6] + 0.5
+    assert_multi_batch_matches(
+        lambda i: intersection_line_circle(start[i], end[i], center[i], radius[i], normal[i], line_type),
+        lambda: intersection_line_circle_batch(start, end, center, radius, normal, line_type),
+    )
+
+def test_intersection_circle_circle_batch(planar_points, points):
+    center1, center2, _, _ = planar_points
+    radius1 = np.abs(center1[:, 0]) + 1
+    radius2 = np.abs(center2[:, 1]) + 1
+    normal1 = np.tile([0.0, 0.0, 1.0], (N, 1))
+    normal2 = normal1.copy()
+    # 混入不共面的圆，其中一半经过第一个圆上的点
+    normal2[::4] = points[3][::4]
+    angle = points[2][:, 0]
+    on_circle = center1 + radius1[:, None] * np.stack([np.cos(angle), np.sin(angle), np.zeros(N)], axis=-1)
+    offset = np.cross(normal2, points[2])
+    offset /= np.linalg.norm(offset, axis=1)[:, None]
+    center2[::8] = on_circle[::8] + radius2[::8, None] * offset[::8]
+    assert_multi_batch_matches(
+        lambda i: intersection_circle_circle(center1[i], radius1[i], normal1[i], center2[i], radius2[i], normal2[i]),
+        lambda: intersection_circle_circle_batch(center1, radius1, normal1, center2, radius2, normal2),
+    )
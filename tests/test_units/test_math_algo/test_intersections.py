@@ -72,4 +72,87 @@ def test_intersection_line_line(
             intersection_line_line(
                 line1_start, line1_end, line2_start, line2_end,
                 line1_type, line2_type, as_infinty
-            )
\ No newline at end of file
+            )
+Z = np.array([0, 0, 1])
+X = np.array([1, 0, 0])
+
+@pytest.mark.parametrize(
+    "line_start, line_end, center, radius, normal, line_type, as_infinty, expected",
+    [
+        pytest.param(np.array([-2, 0, 0]), np.array([2, 0, 0]), np.zeros(3), 1, Z, "LineSegment", False, [[-1, 0, 0], [1, 0, 0]], id="Segment_Secant"),
+        pytest.param(np.array([0, 0, 0]), np.array([2, 0, 0]), np.zeros(3), 1, Z, "LineSegment", False, [[1, 0, 0]], id="Segment_InsideStart"),
+        pytest.param(np.array([0, 0, 0]), np.array([0.5, 0, 0]), np.zeros(3), 1, Z, "LineSegment", False, [], id="Segment_Inside"),
+        pytest.param(np.array([0, 0, 0]), np.array([0.5, 0, 0]), np.zeros(3), 1, Z, "LineSegment", True, [[-1, 0, 0], [1, 0, 0]], id="Segment_AsInf"),
+        pytest.param(np.array([0, 0, 0]), np.array([-0.5, 0, 0]), np.zeros(3), 1, Z, "Ray", False, [[-1, 0, 0]], id="Ray_Secant"),
+        pytest.param(np.array([-2, 1, 0]), np.array([2, 1, 0]), np.zeros(3), 1, Z, "InfinityLine", False, [[0, 1, 0]], id="Line_Tangent"),
+        pytest.param(np.array([3, 0, 0]), np.array([3, 1, 0]), np.zeros(3), 1, Z, "InfinityLine", False, [], id="Line_Separate"),
+        pytest.param(np.array([0, 1, 0]), np.array([0, -1, 0]), np.array([0, 0, 5]), 2, np.array([0, 0, 3]), "InfinityLine", False, [], id="Line_ParallelPlane"),
+        pytest.param(np.array([1, 0, -1]), np.array([1, 0, 1]), np.zeros(3), 1, Z, "LineSegment", False, [[1, 0, 0]], id="3D_CrossOnCircle"),
+        pytest.param(np.array([1, 0, 1]), np.array([1, 0, 2]), np.zeros(3), 1, Z, "Ray", False, [], id="3D_RayBehindPlane"),
+        pytest.param(np.array([0, 0, -1]), np.array([0, 0, 1]), np.zeros(3), 1, Z, "InfinityLine", False, [], id="3D_CrossAtCenter"),
+        pytest.param(np.array([0, -2, 3]), np.array([0, 2, 3]), np.array([0, 0, 3]), 2, X, "InfinityLine", False, [[0, -2, 3], [0, 2, 3]], id="3D_TiltedPlane"),
+    ]
+)
+def test_intersection_line_circle(line_start, line_end, center, radius, normal, line_type, as_infinty, expected):
+    result = intersection_line_circle(line_start, line_end, center, radius, normal, line_type, as_infinty)
+    assert result.shape == (len(expected), 3)
+    assert np.allclose(result, np.array(expected).reshape(-1, 3))
+
+def test_intersection_line_circle_degenerate():
+    with pytest.raises(ValueError):
+        intersection_line_circle(np.zeros(3), np.zeros(3), np.zeros(3), 1, Z, "InfinityLine")
+
+@pytest.mark.parametrize(
+    "center1, radius1, normal1, center2, radius2, normal2, expected",
+    [
+        pytest.param(np.zeros(3), 1, Z, X, 1, Z, [[0.5, np.sqrt(3) / 2, 0], [0.5, -np.sqrt(3) / 2, 0]], id="Planar_Secant"),
+        pytest.param(np.zeros(3), 2, Z, np.array([4, 0, 0]), 2, Z, [[2, 0, 0]], id="Planar_TangentOut"),
+        pytest.param(np.zeros(3), 2, Z, X, 1, Z, [[2, 0, 0]], id="Planar_TangentIn"),
+        pytest.param(np.zeros(3), 1, Z, np.array([3, 0, 0]), 1, Z, [], id="Planar_Separate"),
+        pytest.param(np.zeros(3), 3, Z, X, 1, Z, [], id="Planar_Contained"),
+        pytest.param(np.zeros(3), 1, Z, np.zeros(3), 2, -Z, [], id="Planar_Concentric"),
+        pytest.param(np.zeros(3), 1, Z, np.array([0, 0, 1]), 1, Z, [], id="ParallelPlanes"),
+        pytest.param(np.zeros(3), 1, Z, np.zeros(3), 1, X, [[0, -1, 0], [0, 1, 0]], id="Spatial_Perpendicular"),
+        pytest.param(np.zeros(3), 1, Z, X, 1, X, [], id="Spatial_TouchPlane"),
+        pytest.param(np.zeros(3), 1, Z, np.array([0, 1, 1]), 1, np.array([0, 1, 0]), [[0, 1, 0]], id="Spatial_Tangent"),
+    ]
+)
+def test_intersection_circle_circle(center1, radius1, normal1, center2, radius2, normal2, expected):
+    result = intersection_circle_circle(center1, radius1, normal1, center2, radius2, normal2)
+    assert result.shape == (len(expected), 3)
+    assert np.allclose(result, np.array(expected).reshape(-1, 3))
+
+def test_intersection_circle_circle_coincide():
+    with pytest.raises(ValueError):
+        intersection_circle_circle(np.zeros(3), 1, Z, np.zeros(3), 1, -Z)
+
+def test_track_roots():
+    previous = np.array([[1, 0, 0], [-1, 0, 0]], dtype=float)
+    # 没有历史时按原顺序分配
+    assert np.allclose(track_roots(np.empty((0, 3)), previous), previous)
+
+    # 交点顺序互换时保持编号
+    current = np.array([[-1, 0.1, 0], [1, 0.1, 0]])
+    assert np.allclose(track_roots(previous, current), current[::-1])
+
+    # 交点减少时分配到最近的槽位，空槽位为 NaN
+    result = track_roots(previous, np.array([[-0.9, 0, 0]]))
+    assert np.isnan(result[0]).all() and np.allclose(result[1], [-0.9, 0, 0])
+
+    # 新出现的交点分配到空槽位
+    result = track_roots(result, np.array([[2, 0, 0], [-1, 0, 0]]))
+    assert np.allclose(result, [[2, 0, 0], [-1, 0, 0]])
+    assert np.isnan(track_roots(result, np.empty((0, 3)))).all()
+
+def test_track_roots_sequence():
+    previous = np.array([[1, 0, 0], [-1, 0, 0]], dtype=float)
+    points = np.array([
+        [[-1, 0, 0], [1, 0, 0]],
+        [[0.5, 0, 0], [np.nan] * 3],
+        [[-1, 0, 0], [1, 0, 0]],
+    ])
+    valid = ~np.isnan(points[..., 0])
+    result = track_roots_sequence(previous, points, valid)
+    assert np.allclose(result[0], previous)
+    assert np.allclose(result[1, 0], [0.5, 0, 0]) and np.isnan(result[1, 1]).all()
+    assert np.allclose(result[2], previous)
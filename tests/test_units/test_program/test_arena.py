@@ -0,0 +1,137 @@
+import numpy as np
+import pytest
+
+from manimgeo.components import *
+from manimgeo.program import GeometryArena
+
+@pytest.fixture
+def construction():
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([4, 0, 0]), "B")
+    C = Point.Free(np.array([1, 3, 0]), "C")
+    circle = Circle.PPP(A, B, C, "circle")
+    line = LineSegment.PP(A, B, "line")
+    angle = Angle.PPP(A, B, C, "angle")
+    intersections = Intersections.LCir(line, circle, as_infinity=True, name="I")
+    return A, B, C, circle, line, angle, intersections
+
+def test_arena_views(construction):
+    A, B, C, circle, line, angle, intersections = construction
+    arena = GeometryArena.attach([circle, angle, intersections])
+    assert len(arena.objects) == 7
+
+    # 向量属性是坐标池的视图，计算后原地更新
+    coord = A.coord
+    assert np.shares_memory(coord, arena.buffer)
+    assert np.shares_memory(circle.center, arena.buffer)
+    A.set_coord(np.array([1, 1, 0]))
+    assert A.coord is coord and np.allclose(coord, [1, 1, 0])
+    assert np.allclose(arena.buffer[arena.slot(line, "start")], [1, 1, 0])
+    assert arena.buffer[arena.slot(circle, "radius")] == circle.radius
+    assert isinstance(circle.radius, float)
+
+def test_arena_snapshot_restore(construction):
+    A, B, C, circle, line, angle, intersections = construction
+    arena = GeometryArena.attach([circle, angle, intersections])
+    saved = arena.snapshot()
+    expected = {obj: {attr: getattr(obj, attr) for attr in obj.attrs} for obj in arena.objects}
+
+    A.set_coord(np.array([-1, 2, 0]))
+    C.set_coord(np.array([3, 3, 0]))
+    arena.restore(saved)
+    for obj, attrs in expected.items():
+        for attr, value in attrs.items():
+            if isinstance(value, str):
+                assert getattr(obj, attr) == value
+            else:
+                assert np.allclose(getattr(obj, attr), value), f"{obj.name}.{attr}"
+
+    # 自由点的构造参数同时被恢复，后续更新与快照一致
+    B.set_coord(np.array([4, 0, 0]))
+    assert np.allclose(A.coord, [0, 0, 0])
+    assert np.allclose(circle.center, expected[circle]["center"])
+
+def test_arena_detach(construction):
+    A, B, C, circle, line, angle, intersections = construction
+    arena = GeometryArena.attach([circle])
+    with pytest.raises(ValueError):
+        GeometryArena.attach([line])
+
+    arena.detach()
+    assert not np.shares_memory(A.coord, arena.buffer)
+    A.set_coord(np.array([1, 0, 0]))
+    assert np.allclose(arena.buffer[:3], [0, 0, 0])
+    GeometryArena.attach([line])
+
+def test_arena_writes_in_place(construction):
+    A, B, C, circle, line, angle, intersections = construction
+    arena = GeometryArena.attach([circle, line])
+    center = circle.center
+
+    C.set_coord(np.array([2, 3, 0]))
+    assert circle.center is center and line.start is not A.coord
+    assert np.shares_memory(line.start, arena.buffer) and np.allclose(line.start, A.coord)
+    assert np.allclose(arena.buffer[arena.slot(circle, "center")], circle.center)
+
+def test_arena_derived_on_read(construction, monkeypatch):
+    A, B, C, circle, line, angle, intersections = construction
+    arena = GeometryArena.attach([circle, line])
+    calls = []
+    original = type(line.adapter).derive
+    monkeypatch.setattr(type(line.adapter), "derive", lambda self: (calls.append(self), original(self))[1])
+
+    # 计算时不强制计算派生属性
+    A.set_coord(np.array([1, 0, 0]))
+    assert calls == []
+
+    # 读取时计算并写入坐标池
+    assert np.isclose(line.length, 3)
+    assert len(calls) == 1
+    assert arena.buffer[arena.slot(line, "length")] == 3
+    assert np.shares_memory(line.unit_direction, arena.buffer)
+
+    # 快照前补齐尚未读取的派生属性
+    B.set_coord(np.array([5, 0, 0]))
+    saved = arena.snapshot()
+    assert saved[arena.slot(line, "length")] == 4
+    assert np.isclose(saved[arena.slot(circle, "area")], circle.area)
+
+def test_arena_restore_adapter_outputs(construction):
+    A, B, C, circle, line, angle, intersections = construction
+    tracked = Intersections.LCir(line, circle, as_infinity=True, name="T", track=True)
+    arena = GeometryArena.attach([circle, angle, intersections, tracked])
+    saved = arena.snapshot()
+    roots = tracked.result_points.copy()
+
+    A.set_coord(np.array([-1, 2, 0]))
+    arena.restore(saved)
+    # 适配器的输出属性同时被恢复，派生属性重新计算时读取恢复后的值
+    for obj in arena.objects:
+        for attr in obj.attrs:
+            if attr in obj.adapter.derived_attrs:
+                continue
+            value = getattr(obj.adapter, attr)
+            if isinstance(value, str):
+                assert value == getattr(obj, attr)
+            else:
+                assert np.allclose(value, getattr(obj, attr)), f"{obj.name}.{attr}"
+    line.adapter.derive()
+    assert line.adapter.length == 4
+
+    # 交点跟踪以恢复后的交点为基准
+    assert np.allclose(tracked.adapter.result_points, roots)
+    B.set_coord(np.array([4, 0.01, 0]))
+    assert np.allclose(tracked.result_points, roots, atol=0.1)
+
+def test_arena_output_reuse(construction):
+    A, B, C, circle, line, angle, intersections = construction
+    arena = GeometryArena.attach([circle, line])
+    with output_reuse():
+        C.set_coord(np.array([2, 3, 0]))
+        A.set_coord(np.array([1, 0, 0]))
+        # 适配器直接写入坐标池，不再复制
+        for obj, attr in ((circle, "center"), (circle, "normal"), (line, "start"), (A, "coord")):
+            assert getattr(obj.adapter, attr) is getattr(obj, attr)
+            assert np.shares_memory(getattr(obj, attr), arena.buffer)
+        assert np.allclose(arena.buffer[arena.slot(line, "start")], [1, 0, 0])
+        assert np.isclose(line.length, 3) and np.shares_memory(line.unit_direction, arena.buffer)
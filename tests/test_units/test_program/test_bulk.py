@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from manimgeo.components import *
+from manimgeo.program import GeometryArray, TURN_CCW
+
+@pytest.fixture
+def coords():
+    rng = np.random.default_rng(0)
+    coords = rng.normal(size=(16, 3))
+    coords[:, 2] = 0
+    return coords
+
+def test_free_many(coords):
+    points = Point.FreeMany(coords)
+    assert len(points) == 16 and points.valid.all()
+    assert np.allclose(points.coord, coords)
+    assert np.allclose(points[3].coord, coords[[3]])
+    assert np.allclose(points[coords[:, 0] > 0].coord, coords[coords[:, 0] > 0])
+
+    with pytest.raises(ValueError):
+        Point.FreeMany(np.zeros((4, 2)))
+
+def test_pp_many_matches_objects(coords):
+    points = Point.FreeMany(coords)
+    i, j = np.arange(8), np.arange(8, 16)
+    edges = Ray.PPMany(points[i], points[j])
+    assert edges.line_type == "Ray"
+
+    for k in range(8):
+        ray = Ray.PP(Point.Free(coords[i[k]]), Point.Free(coords[j[k]]))
+        for attr in ray.attrs:
+            assert np.allclose(getattr(edges, attr)[k], getattr(ray, attr))
+
+    # 坐标数组与单个点均可作为端点
+    A = Point.Free(np.array([1, 2, 0]), "A")
+    assert np.allclose(LineSegment.PPMany(A, coords).start, A.coord)
+    assert np.allclose(LineSegment.PPMany(coords, A).end, A.coord)
+
+def test_many_matches_objects(coords):
+    points = Point.FreeMany(coords)
+    i, j, k = np.arange(0, 5), np.arange(5, 10), np.arange(10, 15)
+    circles = Circle.Many("PPP", point1=points[i], point2=points[j], point3=points[k])
+    angles = Angle.Many("PPP", start=points[i], center=points[j], end=points[k])
+    O = Point.Free(np.array([0, 0, 0]), "O")
+    extended = Point.Many("ExtensionPP", start=O, through=points, factor=2)
+
+    for n in range(5):
+        A, B, C = (Point.Free(coords[index[n]]) for index in (i, j, k))
+        circle = Circle.PPP(A, B, C)
+        assert np.allclose(circles.center[n], circle.center)
+        assert np.isclose(circles.area[n], circle.area)
+        angle = Angle.PPP(A, B, C)
+        assert np.isclose(angles.angle[n], angle.angle)
+        assert (angles.turn[n] == TURN_CCW) == (angle.turn == "Counterclockwise")
+    assert np.allclose(extended.coord, 2 * coords)
+
+def test_many_invalid_rows():
+    coords = np.array([[0, 0, 0], [1, 0, 0], [2, 0, 0], [0, 1, 0]], dtype=float)
+    points = Point.FreeMany(coords)
+    # 第一行三点共线
+    centers = Point.Many("CircumcenterPPP", point1=points[[0, 0]], point2=points[[1, 1]], point3=points[[2, 3]])
+    assert centers.valid.tolist() == [False, True]
+    assert np.isnan(centers.coord[0]).all()
+    assert np.allclose(centers.coord[1], [0.5, 0.5, 0])
+
+    # 无效行传播到下游
+    mids = Point.Many("MidPP", point1=centers, point2=points[[0, 1]])
+    assert mids.valid.tolist() == [False, True]
+
+    with pytest.raises(ValueError):
+        Point.Many("MidPP", point1=points[[0, 1]], point2=points[[0, 1, 2]])
+    with pytest.raises(NotImplementedError):
+        Point.Many("Constraint", coord=coords)
+
+def test_many_roots():
+    centers = Point.FreeMany(np.array([[0, 0, 0], [0.5, 0, 0], [4, 0, 0]], dtype=float))
+    O = Point.Free(np.array([1, 0, 0]), "O")
+    intersections = Intersections.Many("CirCir", circle1=Circle.Many("PR", center=centers, radius=1.0), circle2=Circle.PR(O, 1.0))
+    assert intersections.num_results.tolist() == [2, 2, 0]
+
+    roots = Point.Many("Root", intersections=intersections, index=0)
+    assert roots.valid.tolist() == [True, True, False]
+    expected = Intersections.CirCir(Circle.PR(Point.Free(np.array([0.5, 0, 0])), 1.0), Circle.PR(O, 1.0))
+    assert np.allclose(roots.coord[1], expected.result_points[0])
+
+def test_from_objects():
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([1, 0, 0]), "B")
+    lines = GeometryArray.from_objects([LineSegment.PP(A, B), LineSegment.PP(B, A)])
+    assert np.allclose(lines.unit_direction, [[1, 0, 0], [-1, 0, 0]])
+
+    with pytest.raises(ValueError):
+        GeometryArray.from_objects([LineSegment.PP(A, B), Ray.PP(A, B)])
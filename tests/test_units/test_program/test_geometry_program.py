@@ -0,0 +1,231 @@
+import contextlib
+import numpy as np
+import pytest
+
+from manimgeo.components import *
+from manimgeo.program import GeometryProgram
+
+def assert_matches_objects(program: GeometryProgram):
+    """程序寄存器中的结果与几何对象一致"""
+    for obj in program.objects:
+        for attr in obj.attrs:
+            expected = getattr(obj, attr)
+            if isinstance(expected, str):
+                assert program.get(obj, attr) == expected
+            else:
+                assert np.allclose(program.get(obj, attr), expected), f"{obj.name}.{attr}"
+
+@pytest.fixture
+def construction():
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([4, 0, 0]), "B")
+    C = Point.Free(np.array([1, 3, 0]), "C")
+    O = Point.CircumcenterPPP(A, B, C, "O")
+    H = Point.OrthocenterPPP(A, B, C, "H")
+    G = Point.CentroidPPP(A, B, C, "G")
+    euler = InfinityLine.PP(O, H, "euler")
+    circle = Circle.PPP(A, B, C, "circle")
+    nine = Circle.PR(Point.MidPP(O, H), 1.0, name="nine")
+    angle = Angle.PPP(A, B, C, "angle")
+    turned = Angle.TurnA(angle, "turned")
+    vec = Vector.PP(A, B, "vec")
+    R = Point.RotatePPA(C, A, turned, vec, "R")
+    I = Point.IntersectionLL(LineSegment.PP(A, B), LineSegment.PP(C, G), True, "I")
+    inverse = Circle.InverseCirCir(Circle.PR(C, 0.5), circle, "inverse")
+    return A, B, C, [euler, nine, R, I, inverse]
+
+def test_program_matches_objects(construction):
+    A, B, C, objects = construction
+    program = GeometryProgram.compile(objects)
+    assert_matches_objects(program)
+    assert len(program.instructions) == len(program.objects) - 3
+
+    for coord in [np.array([0.5, 0.2, 0]), np.array([1, 1, 0]), np.array([-2, 0.5, 0])]:
+        assert program.run({A: coord})
+        A.set_coord(coord)
+        assert_matches_objects(program)
+
+def test_program_apply(construction):
+    A, B, C, objects = construction
+    program = GeometryProgram.compile(objects)
+    euler = objects[0]
+    start = euler.start.copy()
+
+    program.run({B: np.array([5, 1, 0])})
+    assert np.allclose(euler.start, start)
+
+    program.apply()
+    B.set_coord(np.array([5, 1, 0]))
+    assert np.allclose(program.get(euler, "start"), euler.start)
+
+    # 自由点的构造参数同步更新，重新计算不会恢复旧坐标
+    program.run({B: np.array([6, 2, 0])})
+    program.apply()
+    B.update()
+    assert np.allclose(B.coord, [6, 2, 0])
+    assert np.allclose(program.get(euler, "start"), euler.start)
+
+def test_program_error():
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([1, 0, 0]), "B")
+    C = Point.Free(np.array([0, 1, 0]), "C")
+    O = Point.CircumcenterPPP(A, B, C, "O")
+    M = Point.MidPP(O, A, "M")
+    N = Point.MidPP(B, C, "N")
+    program = GeometryProgram.compile([M, N])
+
+    # 三点共线，外心计算失败，不抛出异常
+    assert not program.run({C: np.array([2, 0, 0])})
+    assert program.on_error(O) and program.on_error(M)
+    assert not program.on_error(N)
+    assert np.allclose(program.get(N, "coord"), np.array([1.5, 0, 0]))
+
+    assert program.run({C: np.array([0, 1, 0])})
+    assert not program.on_error(M)
+    assert np.allclose(program.get(M, "coord"), np.array([0.25, 0.25, 0]))
+
+def test_program_invalid_input():
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([1, 0, 0]), "B")
+    M = Point.MidPP(A, B, "M")
+    program = GeometryProgram.compile([M])
+
+    with pytest.raises(ValueError):
+        program.run({M: np.array([1, 1, 0])})
+
+    multiple = MultipleComponents.Multiple([A, B])
+    with pytest.raises(NotImplementedError):
+        GeometryProgram.compile([multiple])
+
+def test_run_batch_matches_run(construction):
+    A, B, C, objects = construction
+    program = GeometryProgram.compile(objects)
+
+    rng = np.random.default_rng(0)
+    coords = rng.normal(size=(32, 3))
+    coords[:, 2] = 0
+    # A 落在直线 BC 上，三点共线
+    coords[::8] = C.coord + 2 * (B.coord - C.coord)
+    result = program.run_batch({A: coords})
+    assert len(result) == 32
+
+    for i in range(32):
+        program.run({A: coords[i]})
+        for obj in program.objects:
+            assert result.valid(obj)[i] == (not program.on_error(obj))
+            if program.on_error(obj):
+                continue
+            for attr in obj.attrs:
+                expected = program.get(obj, attr)
+                if isinstance(expected, str):
+                    assert result.get(obj, attr)[i] == expected
+                else:
+                    assert np.allclose(result.get(obj, attr)[i], expected)
+
+def test_run_batch_masked():
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([1, 0, 0]), "B")
+    C = Point.Free(np.array([0, 1, 0]), "C")
+    circle = Circle.PPP(A, B, C, "circle")
+    M = Point.MidPP(Point.Cir(circle), A, "M")
+    N = Point.MidPP(B, C, "N")
+    program = GeometryProgram.compile([M, N])
+
+    coords = np.array([[0, 1, 0], [2, 0, 0], [0, 3, 0]], dtype=float)
+    result = program.run_batch({C: coords})
+
+    radius = result.get(circle, "radius")
+    assert radius.mask.tolist() == [False, True, False]
+    assert np.allclose(radius.compressed(), [np.sqrt(2) / 2, np.sqrt(10) / 2])
+    assert result.get(M, "coord").mask[1].all()
+    assert not result.get(N, "coord").mask.any()
+
+    # 批量执行不影响程序状态
+    assert np.allclose(program.get(circle, "radius"), np.sqrt(2) / 2)
+
+def test_program_intersections():
+    from manimgeo.components.point.args import IntersectionsArgs
+    from manimgeo.components.point.intersections import LCir, CirCir
+
+    O = Point.Free(np.array([0, 0, 0]), "O")
+    A = Point.Free(np.array([2, 0, 0]), "A")
+    circle = Circle.PR(O, 1.0, name="circle")
+    ray = Ray.PP(O, A, "ray")
+    P = Point(name="P", args=IntersectionsArgs(int_type=LCir(line=ray, circle=circle, as_infinity=False)))
+    # 两圆外切
+    outer = Circle.PR(Point.ExtensionPP(O, P, 2), 1.0, name="outer")
+    Q = Point(name="Q", args=IntersectionsArgs(int_type=CirCir(circle1=circle, circle2=outer)))
+    program = GeometryProgram.compile([Q])
+    assert_matches_objects(program)
+
+    coords = np.array([[0, 2, 0], [0.5, 0.5, 0], [-1, 0, 0]], dtype=float)
+    result = program.run_batch({A: coords})
+    assert result.valid(Q).all()
+    expected = coords / np.linalg.norm(coords, axis=1)[:, None]
+    assert np.allclose(result.get(P, "coord"), expected)
+    assert np.allclose(result.get(Q, "coord"), expected)
+
+    # 射线退化为点时交点无效
+    assert not program.run({A: np.array([0, 0, 0])})
+    assert program.on_error(P) and program.on_error(Q)
+    assert program.run({A: np.array([0, -0.5, 0])})
+    assert np.allclose(program.get(Q, "coord"), [0, -1, 0])
+
+def test_program_roots():
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([1, 0, 0]), "B")
+    circle1 = Circle.PR(A, 1.0, name="circle1")
+    circle2 = Circle.PR(B, 1.0, name="circle2")
+    intersections = Intersections.CirCir(circle1, circle2, "I")
+    P, Q = intersections.root(0, "P"), intersections.root(1, "Q")
+    M = Point.MidPP(P, Q, "M")
+    program = GeometryProgram.compile([M])
+    assert_matches_objects(program)
+
+    # 外切时只有一个交点
+    assert not program.run({B: np.array([2, 0, 0])})
+    assert program.get(intersections, "num_results") == 1
+    assert not program.on_error(P) and program.on_error(Q) and program.on_error(M)
+
+    coords = np.array([[0, 1, 0], [2, 0, 0], [3, 0, 0]], dtype=float)
+    result = program.run_batch({B: coords})
+    assert result.get(intersections, "num_results").tolist() == [2, 1, 0]
+    assert result.valid(P).tolist() == [True, True, False]
+    assert result.valid(Q).tolist() == [True, False, False]
+    assert result.get(intersections, "result_points").shape == (3, 2, 3)
+    for i, coord in enumerate(coords):
+        program.run({B: coord})
+        if not program.on_error(P):
+            assert np.allclose(result.get(P, "coord")[i], program.get(P, "coord"))
+
+    program.run({B: coords[0]})
+    B.set_coord(coords[0])
+    assert_matches_objects(program)
+
+def test_program_tracked_roots():
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([1, 0, 0]), "B")
+    circle1 = Circle.PR(A, 1.0, name="circle1")
+    circle2 = Circle.PR(B, 1.0, name="circle2")
+    intersections = Intersections.CirCir(circle1, circle2, track=True, name="I")
+    P, Q = intersections.root(0, "P"), intersections.root(1, "Q")
+    program = GeometryProgram.compile([P, Q])
+    assert_matches_objects(program)
+
+    # 批量执行时各行视为连续帧
+    coords = np.array([[0, 1, 0], [-1, 0, 0], [0, -2, 0], [0, -1, 0]], dtype=float)
+    result = program.run_batch({B: coords})
+    # 外切时只剩下离上一帧较近的交点
+    assert result.valid(P).tolist() == [True, True, True, True]
+    assert result.valid(Q).tolist() == [True, True, False, True]
+    for i, coord in enumerate(coords):
+        program.run({B: coord})
+        # 交点消失时传播会抛出异常
+        with contextlib.suppress(ValueError):
+            B.set_coord(coord)
+        for obj in (intersections, P, Q):
+            assert obj.on_error == program.on_error(obj)
+        assert np.allclose(program.get(intersections, "result_points"), intersections.result_points, equal_nan=True)
+        assert np.allclose(result.get(intersections, "result_points")[i], intersections.result_points, equal_nan=True)
+        if not P.on_error:
+            assert np.allclose(result.get(P, "coord")[i], P.coord)
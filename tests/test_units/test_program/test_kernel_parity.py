@@ -0,0 +1,166 @@
+import numpy as np
+import pytest
+
+from manimgeo.components import *
+from manimgeo.components.point.args import IntersectionLLArgs, IntersectionsArgs
+from manimgeo.components.point.intersections import LCir as IntersectionLCir, CirCir as IntersectionCirCir
+from manimgeo.components.point.adapter import PointAdapter
+from manimgeo.components.line.adapter import LineAdapter
+from manimgeo.components.circle.adapter import CircleAdapter
+from manimgeo.components.angle.adapter import AngleAdapter
+from manimgeo.components.vector.adapter import VectorAdapter
+from manimgeo.components.intersections.adapter import IntersectionsAdapter
+from manimgeo.program import GeometryProgram
+from manimgeo.program.program import geometry_kind
+from manimgeo.program.kernels import KERNELS
+from manimgeo.program.batch_kernels import BATCH_KERNELS
+
+ADAPTERS = {
+    "Point": PointAdapter,
+    "Line": LineAdapter,
+    "Circle": CircleAdapter,
+    "Angle": AngleAdapter,
+    "Vector": VectorAdapter,
+    "Intersections": IntersectionsAdapter,
+}
+
+# 不依赖其他几何对象的构造方式，由寄存器直接读取，没有计算核
+SOURCES = {
+    ("Point", "Free"), ("Point", "Constraint"),
+    ("Angle", "N"),
+    ("Vector", "N"), ("Vector", "NPP"), ("Vector", "NNormDirection"),
+}
+
+def kernel_key(obj: BaseGeometry):
+    construct_type = obj.adapter.construct_type
+    if construct_type == "Intersections":
+        construct_type += type(obj.args.int_type).__name__
+    return geometry_kind(obj), construct_type
+
+@pytest.fixture
+def scene():
+    """覆盖全部计算核的场景，仅移动自由点 A"""
+    A = Point.Free(np.array([0, 0, 0]), "A")
+    B = Point.Free(np.array([4, 0, 0]), "B")
+    C = Point.Free(np.array([1, 3, 0]), "C")
+    AB = LineSegment.PP(A, B, "AB")
+    AC = LineSegment.PP(A, C, "AC")
+    ray = Ray.PP(C, B, "ray")
+    z = Vector.N(np.array([0, 0, 1]), "z")
+    vec = Vector.PP(A, C, "vec")
+    circle = Circle.PPP(A, B, C, "circle")
+    M = Point.MidPP(A, B, "M")
+    G = Point.CentroidPPP(A, B, C, "G")
+    O = Point.CircumcenterPPP(A, B, C, "O")
+    CG = InfinityLine.PP(C, G, "CG")
+    angle = Angle.PPP(A, B, C, "angle")
+    angle2 = Angle.LP(AB, C, "angle2")
+    vec2 = Vector.L(AB, "vec2")
+
+    # 两圆相切于 E，不随 A 移动
+    D = Point.Free(np.array([10, 0, 0]), "D")
+    E = Point.Free(np.array([12, 0, 0]), "E")
+    F = Point.Free(np.array([14, 0, 0]), "F")
+    tangent1, tangent2 = Circle.PP(D, E, name="tangent1"), Circle.PP(F, E, name="tangent2")
+
+    circir = Intersections.CirCir(circle, Circle.PR(B, 1.0, name="small"), "circir", track=True)
+    with pytest.deprecated_call():
+        intersection_ll = Point(name="IntersectionLL", args=IntersectionLLArgs(line1=AB, line2=CG, regard_infinite=True))
+    objects = [
+        Point.MidL(AB, "MidL"),
+        Point.ExtensionPP(A, B, 1.5, "Extension"),
+        Point.AxisymmetricPL(C, AB, "Axisymmetric"),
+        Point.VerticalPL(C, AB, "Vertical"),
+        Point.ParallelPL(C, AB, 2, "Parallel"),
+        Point.InversionPCir(M, circle, "Inversion"),
+        intersection_ll,
+        Point.IntersectionLL(AB, CG, True, "IntersectionsLL"),
+        Point(name="IntersectionsLCir", args=IntersectionsArgs(int_type=IntersectionLCir(
+            line=LineSegment.PP(O, Point.ExtensionPP(O, A, 2)), circle=circle, as_infinity=False
+        ))),
+        Point(name="IntersectionsCirCir", args=IntersectionsArgs(int_type=IntersectionCirCir(
+            circle1=tangent1, circle2=tangent2
+        ))),
+        Point.TranslationPV(C, vec, "TranslationPV"),
+        Point.IncenterPPP(A, B, C, "Incenter"),
+        Point.OrthocenterPPP(A, B, C, "Orthocenter"),
+        Point.Cir(circle, "Cir"),
+        Point.RotatePPA(C, A, angle, z, "Rotate"),
+        circir.root(0, "root0"),
+        circir.root(1, "root1"),
+        LineSegment.PV(A, vec, "PV"),
+        Ray.TranslationLV(AB, vec, "TranslationLV"),
+        LineSegment.VerticalPL(C, AB, "VerticalPL"),
+        LineSegment.VerticalPL(M, AB, "VerticalPLOn"),
+        InfinityLine.ParallelPL(C, AB, 2, "ParallelPL"),
+        Circle.CNR(A, z, 2.0, "CNR"),
+        Circle.L(AB, name="L"),
+        Circle.TranslationCirV(circle, vec, "TranslationCirV"),
+        Circle.InverseCirCir(Circle.PR(C, 0.5), circle, "InverseCirCir"),
+        Circle.InscribePPP(A, B, C, "InscribePPP"),
+        Angle.LL(AB, AC, "LL"),
+        Angle.TurnA(angle, "TurnA"),
+        angle + angle2,
+        angle - angle2,
+        angle * 0.5,
+        vec + vec2,
+        vec - vec2,
+        vec * 2,
+        Intersections.LL(AB, CG, True, "LL"),
+        Intersections.LCir(InfinityLine.PP(A, C), circle, name="LCir"),
+        ray,
+    ]
+    return A, objects
+
+def assert_matches_objects(program: GeometryProgram):
+    for obj in program.objects:
+        assert not program.on_error(obj) and not obj.on_error, obj.name
+        for attr in obj.attrs:
+            expected = getattr(obj, attr)
+            if isinstance(expected, str):
+                assert program.get(obj, attr) == expected
+            else:
+                assert np.allclose(program.get(obj, attr), expected, equal_nan=True), f"{obj.name}.{attr}"
+
+def test_kernels_cover_handlers(scene):
+    _, objects = scene
+    program = GeometryProgram.compile(objects)
+    covered = {kernel_key(obj) for obj in program.objects if obj.dependencies}
+    assert covered == set(KERNELS) == set(BATCH_KERNELS)
+
+    # 适配器中注册的每个依赖其他对象的构造方式都有计算核
+    handlers = {(kind, construct_type) for kind, adapter in ADAPTERS.items() for construct_type in adapter._handlers}
+    kernels = {(kind, "Intersections" if construct_type.startswith("Intersections") else construct_type)
+               for kind, construct_type in KERNELS}
+    assert handlers - SOURCES == kernels
+
+def test_run_matches_update(scene):
+    A, objects = scene
+    program = GeometryProgram.compile(objects)
+    assert_matches_objects(program)
+
+    for coord in [np.array([0.5, 0.2, 0]), np.array([-1, 0.5, 0]), np.array([0.3, -0.4, 0])]:
+        assert program.run({A: coord})
+        A.set_coord(coord)
+        assert_matches_objects(program)
+
+def test_run_batch_matches_update(scene):
+    A, objects = scene
+    program = GeometryProgram.compile(objects)
+    coords = np.array([[0.5, 0.2, 0], [-1, 0.5, 0], [0.3, -0.4, 0]])
+    result = program.run_batch({A: coords})
+
+    for i, coord in enumerate(coords):
+        A.set_coord(coord)
+        for obj in program.objects:
+            assert result.valid(obj)[i], obj.name
+            for attr in obj.attrs:
+                expected = getattr(obj, attr)
+                actual = result.get(obj, attr)[i]
+                if attr == "result_points":
+                    # 批量结果中不存在的交点以 NaN 填充
+                    actual = actual[:len(expected)]
+                if isinstance(expected, str):
+                    assert actual == expected
+                else:
+                    assert np.allclose(actual, expected, equal_nan=True), f"{obj.name}.{attr}"